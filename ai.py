@@ -0,0 +1,226 @@
+"""
+自动玩家：枚举当前方块和下一个方块所有的最终落点（旋转 × 列），
+用加权启发式（空洞、总高度、凹凸度、消行数）给落下后的场地打分，选择得分最高的落点。
+同一个场地可能经由不同的落点顺序得到，场地评估结果保存在有界的 LRU 置换表中
+只支持标准尺寸（FIELD_WIDTH x FIELD_HEIGHT）的场地
+"""
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from board import FULL_ROW, PIECE_MASKS, Rows, board_rows
+from cache import LRUCache
+from constants import *
+from engine import TetrisEngine
+from movegen import WAIT, MoveGenerator, State, trace
+
+
+class Weights(NamedTuple):
+    height: float = -0.510066
+    lines: float = 0.760666
+    holes: float = -0.35663
+    bumpiness: float = -0.184483
+
+
+DEFAULT_CACHE_SIZE = 200000
+
+
+def column_heights(rows: Rows) -> List[int]:
+    heights = [0] * FIELD_WIDTH
+    seen = 0
+    for y, row in enumerate(rows):
+        new = row & ~seen
+        while new:
+            low = new & -new
+            heights[low.bit_length() - 1] = FIELD_HEIGHT - y
+            new ^= low
+        seen |= row
+        if seen == FULL_ROW:
+            break
+    return heights
+
+
+def place(rows: Rows, kind: int, direction: int, x: int, y: int) -> Tuple[Rows, int]:
+    """
+    把方块锁定在 (x, y)，返回消行后的场地和消除行数
+    """
+    mask = PIECE_MASKS[kind][direction]
+    new_rows = list(rows)
+    for dy, row_mask in mask.placed[x - mask.x_lo]:
+        new_rows[y + dy] |= row_mask
+    lines = 0
+    if FULL_ROW in new_rows:
+        kept = [row for row in new_rows if row != FULL_ROW]
+        lines = FIELD_HEIGHT - len(kept)
+        new_rows = [0] * lines + kept
+    return tuple(new_rows), lines
+
+
+def placements(rows: Rows, kind: int) -> Iterator[Tuple[int, int, Rows, int]]:
+    """
+    枚举方块从顶部直接落下的所有落点，产出 (方向, 列, 落下并消行后的场地, 消除行数)
+    """
+    heights = column_heights(rows)
+    for direction, mask in enumerate(PIECE_MASKS[kind]):
+        for x in range(mask.x_lo, mask.x_hi + 1):
+            # 从出生行落下：落点由各列高度和方块底部轮廓决定
+            land_y = FIELD_HEIGHT
+            for dx, bottom in mask.bottoms:
+                land_y = min(land_y, FIELD_HEIGHT - heights[x + dx] - 1 - bottom)
+            if land_y < 0:
+                continue
+            new_rows, lines = place(rows, kind, direction, x, land_y)
+            yield direction, x, new_rows, lines
+
+
+class AutoPlayer:
+    """
+    自动玩家。既可以直接调用 best_placement 做搜索，也可以作为每帧调用一次的玩家，
+    返回下一步要执行的动作（取值同 KEY_ACTIONS），用于 TetrisGame.advance 和 tournament。
+    传入 movegen 时当前方块只考虑真正能到达的锁定位置（包括需要等待下落后再平移的位置），
+    并按走法生成器给出的按键序列操作
+    """
+    def __init__(self, weights: Weights = Weights(), lookahead: bool = True,
+                 cache_size: int = DEFAULT_CACHE_SIZE, movegen: Optional[MoveGenerator] = None) -> None:
+        self.weights = weights
+        self.lookahead = lookahead
+        self.cache = LRUCache(cache_size)
+        self.movegen = movegen
+        self.evaluated = 0
+        self.target: Optional[Tuple[int, int]] = None
+        self.target_piece = -1
+        self.last_state = None
+        self.steps: List[Tuple[Optional[str], State, Optional[State]]] = []
+
+    def evaluate(self, rows: Rows) -> float:
+        """
+        场地本身的启发式得分（不含消行），结果进入置换表
+        """
+        score = self.cache.get(rows)
+        if score is not None:
+            return score
+        self.evaluated += 1
+        heights = column_heights(rows)
+        holes = 0
+        seen = 0
+        for row in rows:
+            holes += bin(seen & ~row).count("1")
+            seen |= row
+        bumpiness = sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+        w = self.weights
+        score = w.height * sum(heights) + w.holes * holes + w.bumpiness * bumpiness
+        self.cache.put(rows, score)
+        return score
+
+    def best_score(self, rows: Rows, kind: int) -> float:
+        """
+        只看一个方块时能达到的最高得分，按 (场地, 方块) 缓存
+        """
+        key = (rows, kind)
+        score = self.cache.get(key)
+        if score is not None:
+            return score
+        w_lines = self.weights.lines
+        score = max((self.evaluate(new_rows) + w_lines * lines
+                     for _, _, new_rows, lines in placements(rows, kind)), default=float("-inf"))
+        self.cache.put(key, score)
+        return score
+
+    def best_placement(self, rows: Rows, kind: int, next_kind: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """
+        返回最佳落点 (方向, 列)；给出 next_kind 时同时考虑下一个方块的最佳落点
+        """
+        best, best_score = None, float("-inf")
+        w_lines = self.weights.lines
+        for direction, x, new_rows, lines in placements(rows, kind):
+            if next_kind is None:
+                score = self.evaluate(new_rows)
+            else:
+                score = self.best_score(new_rows, next_kind)
+            score += w_lines * lines
+            if score > best_score:
+                best, best_score = (direction, x), score
+        return best
+
+    def best_reachable(self, engine: TetrisEngine) -> Optional[State]:
+        """
+        在走法生成器给出的可到达锁定位置中选出最佳的一个
+        """
+        rows = board_rows(engine.board)
+        piece = engine.cur_piece
+        next_kind = engine.next_piece.kind if self.lookahead else None
+        best, best_score = None, float("-inf")
+        for state in self.movegen.reachable(engine.board, piece):
+            direction, x, y = state
+            new_rows, lines = place(rows, piece.kind, direction, x, y)
+            score = self.evaluate(new_rows) if next_kind is None else self.best_score(new_rows, next_kind)
+            score += self.weights.lines * lines
+            if score > best_score:
+                best, best_score = state, score
+        return best
+
+    def plan(self, engine: TetrisEngine) -> None:
+        self.target_piece = engine.pieces
+        self.last_state = None
+        if self.movegen is not None:
+            piece = engine.cur_piece
+            target = self.best_reachable(engine)
+            self.steps = [] if target is None else trace(
+                engine.board, piece.kind, (piece.direction,) + piece.position,
+                self.movegen.reachable(engine.board, piece)[target])
+            return
+        next_kind = engine.next_piece.kind if self.lookahead else None
+        self.target = self.best_placement(board_rows(engine.board), engine.cur_piece.kind, next_kind)
+
+    def follow(self, engine: TetrisEngine) -> Optional[str]:
+        """
+        按计划的按键序列操作。重力下落与计划不同步（例如按键期间方块已经下落了一格）时，
+        从当前位置重新规划
+        """
+        piece = engine.cur_piece
+        state = (piece.direction,) + piece.position
+        while self.steps:
+            action, before, after = self.steps[0]
+            if state == after:
+                self.steps.pop(0)
+                continue
+            if state != before:
+                self.plan(engine)
+                if not self.steps or self.steps[0][1] != state:
+                    return "down"
+                continue
+            if action is WAIT:
+                return None
+            self.steps.pop(0)
+            return action
+        return None
+
+    def __call__(self, engine: TetrisEngine) -> Optional[str]:
+        """
+        每帧返回一个动作：先旋转到目标方向，再平移到目标列，最后快速下落
+        """
+        if engine.game_over:
+            return None
+        if self.target_piece != engine.pieces:
+            self.plan(engine)
+        if self.movegen is not None:
+            return self.follow(engine)
+        piece = engine.cur_piece
+        state = (piece.direction, piece.position)
+        if self.target is None or state == self.last_state:
+            # 没有落点或上一步动作没有生效（被挡住），直接落下
+            return "down"
+        self.last_state = state
+        direction, x = self.target
+        if piece.direction != direction:
+            return "rotate"
+        if piece.position[0] < x:
+            return "right"
+        if piece.position[0] > x:
+            return "left"
+        return "down"
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "evaluated": self.evaluated,
+            "cache_size": len(self.cache.data),
+            "cache_hit_rate": self.cache.hit_rate(),
+        }
@@ -0,0 +1,105 @@
+"""
+限时动画的调度：烟花、技能名称和消行闪光等效果登记为带开始时间和持续时间的动画，
+每帧由渲染器在最上层按当前时间绘制，到期后自动移除，不再用 time.sleep 阻塞主循环。
+时间使用引擎的逻辑时钟（毫秒），动画随对局推进，回放时也完全一致
+"""
+from typing import List, Optional, Sequence, Tuple
+
+from config import *
+from text import TEXT
+
+
+class Animation:
+    """
+    在 rect 内持续 duration 毫秒的动画，子类实现 draw
+    """
+    def __init__(self, start: int, duration: int, rect: pygame.Rect) -> None:
+        self.start = start
+        self.duration = duration
+        self.rect = pygame.Rect(rect)
+
+    def finished(self, now: int) -> bool:
+        return now >= self.start + self.duration
+
+    def progress(self, now: int) -> float:
+        """
+        0 到 1 之间的播放进度
+        """
+        return min(max((now - self.start) / self.duration, 0.0), 1.0) if self.duration > 0 else 1.0
+
+    def draw(self, surface: pygame.Surface, now: int) -> None:
+        raise NotImplementedError
+
+
+class ImageAnimation(Animation):
+    """
+    以 center 为中心显示一张图片，例如得分里程碑的烟花
+    """
+    def __init__(self, start: int, duration: int, image: pygame.Surface, center: Tuple[int, int]) -> None:
+        super().__init__(start, duration, image.get_rect(center=center))
+        self.image = image
+
+    def draw(self, surface: pygame.Surface, now: int) -> None:
+        surface.blit(self.image, self.rect)
+
+
+class TextBanner(Animation):
+    """
+    以 center 为中心显示一行文字，例如生效中的技能名称
+    """
+    def __init__(self, start: int, duration: int, text: str, center: Tuple[int, int],
+                 color: Tuple[int, int, int] = (255, 255, 0)) -> None:
+        self.image = TEXT.render(text, True, color)
+        super().__init__(start, duration, self.image.get_rect(center=center))
+
+    def draw(self, surface: pygame.Surface, now: int) -> None:
+        surface.blit(self.image, self.rect)
+
+
+class RowFlash(Animation):
+    """
+    被消除的行上逐渐淡出的白色闪光
+    """
+    def __init__(self, start: int, duration: int, rows: Sequence[int]) -> None:
+        top, bottom = min(rows), max(rows)
+        super().__init__(start, duration,
+                         (0, top * BRICK_HEIGHT, FIELD_WIDTH * BRICK_WIDTH, (bottom - top + 1) * BRICK_HEIGHT))
+        self.rows = rows
+        self.overlay = pygame.Surface((FIELD_WIDTH * BRICK_WIDTH, BRICK_HEIGHT), pygame.SRCALPHA)
+
+    def draw(self, surface: pygame.Surface, now: int) -> None:
+        self.overlay.fill((255, 255, 255, int(200 * (1 - self.progress(now)))))
+        for y in self.rows:
+            surface.blit(self.overlay, (0, y * BRICK_HEIGHT))
+
+
+class Scheduler:
+    """
+    当前播放中的动画。update 设置当前时间并移除到期的动画，draw 按登记顺序绘制
+    """
+    def __init__(self) -> None:
+        self.animations: List[Animation] = []
+        self.now = 0
+
+    def add(self, animation: Animation) -> Animation:
+        self.animations.append(animation)
+        return animation
+
+    def clear(self) -> None:
+        self.animations = []
+
+    def update(self, now: int) -> None:
+        self.now = now
+        if any(animation.finished(now) for animation in self.animations):
+            self.animations = [animation for animation in self.animations if not animation.finished(now)]
+
+    def rects(self) -> List[pygame.Rect]:
+        return [animation.rect for animation in self.animations]
+
+    def draw(self, surface: pygame.Surface, rect: Optional[pygame.Rect] = None) -> None:
+        """
+        绘制播放中的动画；给出 rect 时只绘制与之相交的动画（调用方负责设置裁剪区域）
+        """
+        for animation in self.animations:
+            if rect is None or rect.colliderect(animation.rect):
+                animation.draw(surface, self.now)
@@ -0,0 +1,141 @@
+"""
+资源管理：字体、音效和图片在第一次使用时才从 resources 目录加载，之后从缓存中取用。
+图片在显示窗口创建后转换为屏幕像素格式（convert / convert_alpha）并缓存转换结果。
+可选地在后台线程中预先加载（prewarm），后台线程只做文件读取和解码，像素格式转换仍在主线程进行
+"""
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import pygame
+
+RESOURCE_DIR = "resources"
+
+# 资源名称到文件名（以及参数）的映射
+FONTS = {
+    "main": ("simsun.ttc", 20),
+}
+# 短音效整段解码后常驻内存，播放没有延迟
+SOUNDS = {
+    "dida": ("dida.mp3", None),
+}
+# 背景音乐通过 pygame.mixer.music 边解码边播放，不整段解码到内存
+MUSIC = {
+    "music": ("music.mp3", 0.1),
+}
+IMAGES = {
+    "game_over": "game-over.png",
+    "cover": "cover.png",
+    "teach": "teach.png",
+    "fireworks": "fireworks.png",
+}
+
+Key = Tuple[str, str]
+
+
+class AssetManager:
+    """
+    按需加载并缓存资源。load_times 记录每个资源的加载耗时（秒），用于分析启动时间
+    """
+    def __init__(self, root: str = RESOURCE_DIR) -> None:
+        self.root = root
+        self.raw: Dict[Key, Any] = {}
+        self.converted: Dict[str, pygame.Surface] = {}
+        self.load_times: Dict[Key, float] = {}
+        # 每个资源一把锁，主线程只会等待它正要使用、且后台线程正在加载的那个资源
+        self.locks: Dict[Key, threading.Lock] = {}
+        self.locks_guard = threading.Lock()
+        self.music: Optional[str] = None
+
+    def path(self, filename: str) -> str:
+        return f"{self.root}/{filename}"
+
+    def load(self, kind: str, name: str) -> Any:
+        """
+        加载 (种类, 名称) 对应的资源；后台线程正在加载同一资源时等待其完成
+        """
+        key = (kind, name)
+        value = self.raw.get(key)
+        if value is not None:
+            return value
+        with self.locks_guard:
+            lock = self.locks.setdefault(key, threading.Lock())
+        with lock:
+            value = self.raw.get(key)
+            if value is None:
+                start = time.perf_counter()
+                if kind == "font":
+                    filename, size = FONTS[name]
+                    value = pygame.font.Font(self.path(filename), size)
+                elif kind == "sound":
+                    filename, volume = SOUNDS[name]
+                    value = pygame.mixer.Sound(self.path(filename))
+                    if volume is not None:
+                        value.set_volume(volume)
+                else:
+                    value = pygame.image.load(self.path(IMAGES[name]))
+                self.load_times[key] = time.perf_counter() - start
+                self.raw[key] = value
+        return value
+
+    def font(self, name: str = "main") -> pygame.font.Font:
+        return self.load("font", name)
+
+    def sound(self, name: str) -> pygame.mixer.Sound:
+        return self.load("sound", name)
+
+    def play_music(self, name: str = "music") -> None:
+        """
+        循环播放背景音乐：第一次调用时打开文件开始流式播放，之后从暂停处继续
+        """
+        if self.music == name:
+            pygame.mixer.music.unpause()
+            return
+        filename, volume = MUSIC[name]
+        start = time.perf_counter()
+        pygame.mixer.music.load(self.path(filename))
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(-1)
+        self.load_times[("music", name)] = time.perf_counter() - start
+        self.music = name
+
+    def pause_music(self) -> None:
+        pygame.mixer.music.pause()
+
+    def image(self, name: str) -> pygame.Surface:
+        """
+        返回图片；显示窗口已创建时返回转换为屏幕像素格式后的缓存结果，blit 更快。
+        带透明通道的图片用 convert_alpha 保留透明度
+        """
+        surface = self.converted.get(name)
+        if surface is not None:
+            return surface
+        surface = self.load("image", name)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+            self.converted[name] = surface
+        return surface
+
+    def prewarm(self, keys: Optional[Iterable[Key]] = None, background: bool = True) -> Optional[threading.Thread]:
+        """
+        预先加载资源（默认全部，字体和图片在前，解码较慢的音效在后）。
+        background 为 True 时在后台守护线程中加载并返回该线程
+        """
+        if keys is None:
+            keys = ([("font", name) for name in FONTS] + [("image", name) for name in IMAGES]
+                    + [("sound", name) for name in SOUNDS])
+        keys = list(keys)
+
+        def run() -> None:
+            for kind, name in keys:
+                self.load(kind, name)
+
+        if not background:
+            run()
+            return None
+        thread = threading.Thread(target=run, name="asset-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+
+ASSETS = AssetManager()
@@ -0,0 +1,209 @@
+"""
+基于 NumPy 的批量环境：N 个棋盘存放在一个 (N, FIELD_HEIGHT, FIELD_WIDTH) 的 uint8 数组中同步推进，
+碰撞检测、下落、锁定、满行检测和行压缩都是对整批棋盘的数组运算。
+规则与 engine.TetrisEngine.step 一致（每一步先执行动作，再下落一格或锁定），暂不包含技能释放
+"""
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from constants import *
+from engine import ROTATE_OFFSETS
+
+# 动作编号：step 接收的 actions 数组中每个元素取下列下标
+BATCH_ACTIONS = ("noop", "left", "right", "rotate", "down")
+NOOP, LEFT, RIGHT, ROTATE, DOWN = range(len(BATCH_ACTIONS))
+
+NUM_KINDS = len(BLOCK_LAYOUTS)
+MAX_ROTATIONS = max(len(layouts) for layouts in BLOCK_LAYOUTS)
+
+# ROTATIONS[kind] 为该方块的旋转状态数；CELLS[kind, rotation] 为 4 个砖块的 (x, y)，
+# 旋转状态不足 4 个的方块按取模补齐，便于用同一个数组索引
+ROTATIONS = np.array([len(layouts) for layouts in BLOCK_LAYOUTS], dtype=np.int64)
+CELLS = np.array(
+    [[layouts[r % len(layouts)] for r in range(MAX_ROTATIONS)] for layouts in BLOCK_LAYOUTS],
+    dtype=np.int64
+)
+
+# SCORE_TABLE[n] 为一次消除 n 行的得分
+SCORE_TABLE = np.array([SCORE_PER_LINE.get(n, 0) for n in range(FIELD_HEIGHT + 1)], dtype=np.int64)
+
+
+class BatchTetrisEnv:
+    """
+    N 个棋盘同步推进的批量环境。棋盘取值与 TetrisEngine.grid 相同：0 为空，其余为方块种类编号 + 1。
+    对局结束的棋盘会在同一步内自动重置，结束时的得分保存在 final_scores 中
+    """
+    def __init__(self, num_envs: int, seed: Optional[int] = None) -> None:
+        self.num_envs = num_envs
+        self.rng = np.random.default_rng(seed)
+        self.boards = np.zeros((num_envs, FIELD_HEIGHT, FIELD_WIDTH), dtype=np.uint8)
+
+        self.kinds = np.zeros(num_envs, dtype=np.int64)
+        self.rotations = np.zeros(num_envs, dtype=np.int64)
+        self.xs = np.zeros(num_envs, dtype=np.int64)
+        self.ys = np.zeros(num_envs, dtype=np.int64)
+        self.next_kinds = np.zeros(num_envs, dtype=np.int64)
+        self.next_rotations = np.zeros(num_envs, dtype=np.int64)
+
+        self.scores = np.zeros(num_envs, dtype=np.int64)
+        self.lines = np.zeros(num_envs, dtype=np.int64)
+        self.pieces = np.zeros(num_envs, dtype=np.int64)
+        self.energy = np.zeros(num_envs, dtype=np.int64)
+        self.final_scores = np.zeros(num_envs, dtype=np.int64)
+
+        self.rewards = np.zeros(num_envs, dtype=np.int64)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.all_envs = np.arange(num_envs)
+        self.reset()
+
+    def reset(self, envs: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        重置指定下标（默认全部）的棋盘为新对局，返回整批棋盘
+        """
+        envs = self.all_envs if envs is None else envs
+        self.boards[envs] = 0
+        self.scores[envs] = 0
+        self.lines[envs] = 0
+        self.pieces[envs] = 0
+        self.energy[envs] = 0
+        self.next_kinds[envs], self.next_rotations[envs] = self.random_pieces(len(envs))
+        self.spawn(envs)
+        return self.boards
+
+    def observe(self) -> Dict[str, np.ndarray]:
+        """
+        返回当前状态的数组视图（不复制）
+        """
+        return {
+            "boards": self.boards,
+            "kinds": self.kinds,
+            "rotations": self.rotations,
+            "xs": self.xs,
+            "ys": self.ys,
+            "next_kinds": self.next_kinds,
+        }
+
+    def random_pieces(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        kinds = self.rng.integers(0, NUM_KINDS, count)
+        rotations = self.rng.integers(0, ROTATIONS[kinds])
+        return kinds, rotations
+
+    def spawn(self, envs: np.ndarray) -> np.ndarray:
+        """
+        把下一个方块放到出生位置，返回出生位置被占用（对局结束）的掩码
+        """
+        self.kinds[envs] = self.next_kinds[envs]
+        self.rotations[envs] = self.next_rotations[envs]
+        self.xs[envs], self.ys[envs] = CUR_BLOCK_INIT_POSITION
+        self.next_kinds[envs], self.next_rotations[envs] = self.random_pieces(len(envs))
+        return ~self.is_valid(envs, self.xs[envs], self.ys[envs], self.rotations[envs])
+
+    def is_valid(self, envs: np.ndarray, xs: np.ndarray, ys: np.ndarray, rotations: np.ndarray) -> np.ndarray:
+        """
+        检查 envs 中每个棋盘的当前方块放在 (xs, ys, rotations) 时是否不越界且没有碰撞
+        """
+        cells = CELLS[self.kinds[envs], rotations]
+        cx = xs[:, None] + cells[..., 0]
+        cy = ys[:, None] + cells[..., 1]
+        inside = (cx >= 0) & (cx < FIELD_WIDTH) & (cy >= 0) & (cy < FIELD_HEIGHT)
+        occupied = self.boards[envs[:, None], cy.clip(0, FIELD_HEIGHT - 1), cx.clip(0, FIELD_WIDTH - 1)] != 0
+        return (inside & ~occupied).all(axis=1)
+
+    def move(self, envs: np.ndarray, dx: int, dy: int) -> np.ndarray:
+        xs = self.xs[envs] + dx
+        ys = self.ys[envs] + dy
+        ok = self.is_valid(envs, xs, ys, self.rotations[envs])
+        moved = envs[ok]
+        self.xs[moved] = xs[ok]
+        self.ys[moved] = ys[ok]
+        return ok
+
+    def rotate(self, envs: np.ndarray) -> None:
+        """
+        顺时针旋转，依次尝试 ROTATE_OFFSETS 中的踢墙偏移
+        """
+        pending = envs
+        rotations = (self.rotations[envs] + 1) % ROTATIONS[self.kinds[envs]]
+        for dx, dy in ROTATE_OFFSETS:
+            xs = self.xs[pending] + dx
+            ys = self.ys[pending] + dy
+            ok = self.is_valid(pending, xs, ys, rotations)
+            rotated = pending[ok]
+            self.xs[rotated] = xs[ok]
+            self.ys[rotated] = ys[ok]
+            self.rotations[rotated] = rotations[ok]
+            pending, rotations = pending[~ok], rotations[~ok]
+            if not pending.size:
+                break
+
+    def hard_drop(self, envs: np.ndarray) -> None:
+        """
+        快速下落到不能再下的位置（与 TetrisEngine.down 一样不立即锁定）
+        """
+        pending = envs
+        while pending.size:
+            pending = pending[self.is_valid(pending, self.xs[pending], self.ys[pending] + 1,
+                                            self.rotations[pending])]
+            self.ys[pending] += 1
+
+    def lock(self, envs: np.ndarray) -> None:
+        """
+        把方块写入棋盘，检测满行并把剩余行压缩到底部，然后计分并生成下一个方块
+        """
+        cells = CELLS[self.kinds[envs], self.rotations[envs]]
+        cx = self.xs[envs][:, None] + cells[..., 0]
+        cy = self.ys[envs][:, None] + cells[..., 1]
+        self.boards[envs[:, None], cy, cx] = (self.kinds[envs] + 1)[:, None]
+        self.pieces[envs] += 1
+
+        full = (self.boards[envs] != 0).all(axis=2)
+        cleared = full.sum(axis=1)
+        hit = cleared > 0
+        if hit.any():
+            # 稳定排序把满行移到顶部、其余行保持原有顺序压到底部，再把顶部的满行清零
+            targets = envs[hit]
+            order = np.argsort(~full[hit], axis=1, kind="stable")
+            compacted = np.take_along_axis(self.boards[targets], order[:, :, None], axis=1)
+            compacted[np.arange(FIELD_HEIGHT)[None, :] < cleared[hit][:, None]] = 0
+            self.boards[targets] = compacted
+
+        rewards = SCORE_TABLE[cleared]
+        self.rewards[envs] = rewards
+        self.scores[envs] += rewards
+        self.lines[envs] += cleared
+        self.energy[envs] += cleared * SKILL_ENERGY_PER_LINE
+
+        over = envs[self.spawn(envs)]
+        if over.size:
+            self.dones[over] = True
+            self.final_scores[over] = self.scores[over]
+            self.reset(over)
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        每个棋盘执行一个动作（取值见 BATCH_ACTIONS），然后整批下落一格，无法下落的锁定。
+        返回 (boards, rewards, dones)，均为环境内部数组的视图，下一次 step 时会被覆盖
+        """
+        actions = np.asarray(actions)
+        self.rewards[:] = 0
+        self.dones[:] = False
+
+        envs = np.flatnonzero(actions == LEFT)
+        if envs.size:
+            self.move(envs, -1, 0)
+        envs = np.flatnonzero(actions == RIGHT)
+        if envs.size:
+            self.move(envs, 1, 0)
+        envs = np.flatnonzero(actions == ROTATE)
+        if envs.size:
+            self.rotate(envs)
+        envs = np.flatnonzero(actions == DOWN)
+        if envs.size:
+            self.hard_drop(envs)
+
+        fell = self.move(self.all_envs, 0, 1)
+        locking = self.all_envs[~fell]
+        if locking.size:
+            self.lock(locking)
+        return self.boards, self.rewards, self.dones
@@ -0,0 +1,44 @@
+"""
+自动玩家的搜索吞吐：每秒评估的落点数、每秒决策的方块数以及置换表命中率
+运行：python -m benchmarks.bench_ai
+"""
+import time
+
+from ai import AutoPlayer
+from board import board_rows
+from engine import TetrisEngine
+
+
+def bench(lookahead: bool, pieces: int = 200, seed: int = 0) -> None:
+    engine = TetrisEngine(seed=seed)
+    player = AutoPlayer(lookahead=lookahead)
+    placed = 0
+    start = time.perf_counter()
+    while placed < pieces:
+        if engine.game_over:
+            engine.reset()
+        target = player.best_placement(board_rows(engine.board), engine.cur_piece.kind,
+                                       engine.next_piece.kind if lookahead else None)
+        piece = engine.cur_piece
+        if target is None:
+            engine.down()
+        else:
+            # 直接把方块放到目标落点，只测量搜索本身
+            piece.direction, piece.position = target[0], (target[1], 0)
+            engine.down()
+        engine.lock()
+        placed += 1
+    elapsed = time.perf_counter() - start
+    stats = player.stats()
+    print(f"lookahead={str(lookahead):<6}{placed / elapsed:>10.1f} pieces/s"
+          f"{stats['evaluated'] / elapsed:>12,.0f} placements/s"
+          f"{stats['cache_hit_rate']:>10.1%} cache hits   lines={engine.lines}")
+
+
+def main() -> None:
+    bench(lookahead=False, pieces=2000)
+    bench(lookahead=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+批量环境与逐个推进 TetrisEngine 的吞吐对比（单位：棋盘步/秒）
+运行：python -m benchmarks.bench_batch
+"""
+import random
+import time
+
+import numpy as np
+
+from batch_env import BATCH_ACTIONS, BatchTetrisEnv
+from engine import TetrisEngine
+
+
+def bench_batch(num_envs: int, steps: int = 200) -> float:
+    env = BatchTetrisEnv(num_envs, seed=0)
+    rng = np.random.default_rng(0)
+    actions = rng.integers(0, len(BATCH_ACTIONS), (steps, num_envs))
+    start = time.perf_counter()
+    for step_actions in actions:
+        env.step(step_actions)
+    return num_envs * steps / (time.perf_counter() - start)
+
+
+def bench_engines(num_envs: int, steps: int = 200) -> float:
+    engines = [TetrisEngine(seed=i) for i in range(num_envs)]
+    rng = random.Random(0)
+    actions = [[rng.choice(BATCH_ACTIONS) for _ in range(num_envs)] for _ in range(steps)]
+    start = time.perf_counter()
+    for step_actions in actions:
+        for engine, action in zip(engines, step_actions):
+            engine.step(None if action == "noop" else action)
+            if engine.game_over:
+                engine.reset()
+    return num_envs * steps / (time.perf_counter() - start)
+
+
+def main() -> None:
+    print(f"{'boards':>8}{'engine loop':>14}{'batch':>14}{'speed-up':>10}")
+    for num_envs in (64, 1024, 4096):
+        loop_rate, batch_rate = bench_engines(num_envs), bench_batch(num_envs)
+        print(f"{num_envs:>8}{loop_rate:>14,.0f}{batch_rate:>14,.0f}{batch_rate / loop_rate:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+对比 ListBoard 与 BitBoard 的碰撞检测和消行速度
+运行：python -m benchmarks.bench_board
+"""
+import random
+import timeit
+
+from board import BOARD_BACKENDS, PIECE_MASKS
+from constants import *
+from engine import ACTIONS, TetrisEngine
+
+
+def make_board(backend: str, seed: int = 0):
+    """
+    生成一个下半部分接近填满的场地
+    """
+    rng = random.Random(seed)
+    board = BOARD_BACKENDS[backend]()
+    cells = [(x, y) for y in range(FIELD_HEIGHT // 2, FIELD_HEIGHT) for x in range(FIELD_WIDTH) if rng.random() < 0.8]
+    board.lock(cells, 1)
+    return board
+
+
+def make_queries(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        kind = rng.randrange(len(BLOCK_LAYOUTS))
+        direction = rng.randrange(len(BLOCK_LAYOUTS[kind]))
+        mask = PIECE_MASKS[kind][direction]
+        # 只取不越界的位置，避免边界检查提前返回掩盖真实的碰撞开销
+        queries.append((kind, direction, (rng.randint(mask.x_lo, mask.x_hi), rng.randint(mask.y_lo, mask.y_hi))))
+    return queries
+
+
+def bench_collision(backend: str, repeat: int = 7) -> float:
+    board = make_board(backend)
+    queries = make_queries(10000)
+    is_valid = board.is_valid
+
+    def run() -> None:
+        for kind, direction, pos in queries:
+            is_valid(kind, direction, pos)
+
+    return min(timeit.repeat(run, number=1, repeat=repeat)) / len(queries)
+
+
+def bench_clear(backend: str, lines: int, repeat: int = 5, number: int = 2000) -> float:
+    """
+    底部 lines 行填满后执行一次消行；lines 为 0 时测量没有满行时的检查开销。
+    每轮都需要先写入满行，结果扣除单独写入的耗时
+    """
+    full = [(x, y) for y in range(FIELD_HEIGHT - lines, FIELD_HEIGHT) for x in range(FIELD_WIDTH)]
+    board = make_board(backend) if lines == 0 else BOARD_BACKENDS[backend]()
+
+    def lock_and_clear() -> None:
+        board.lock(full, 1)
+        board.eliminate_lines()
+
+    def lock_only() -> None:
+        board.lock(full, 1)
+
+    total = min(timeit.repeat(lock_and_clear, number=number, repeat=repeat))
+    board.reset()
+    setup = min(timeit.repeat(lock_only, number=number, repeat=repeat))
+    return max(total - setup, 0.0) / number
+
+
+def bench_engine_step(backend: str, steps: int = 20000) -> float:
+    """
+    整局随机操作下每步的平均耗时
+    """
+    engine = TetrisEngine(seed=0, backend=backend)
+    rng = random.Random(0)
+    actions = [rng.choice(ACTIONS) for _ in range(steps)]
+
+    def run() -> None:
+        engine.reset(seed=0)
+        for action in actions:
+            if engine.step(action).done:
+                engine.reset()
+
+    return min(timeit.repeat(run, number=1, repeat=3)) / steps
+
+
+def main() -> None:
+    print(f"{'case':<16}{'list (us)':>12}{'bitboard (us)':>16}{'speed-up':>10}")
+    rows = [("collision", bench_collision("list"), bench_collision("bitboard"))]
+    for lines in range(0, 5):
+        rows.append((f"clear {lines} line", bench_clear("list", lines), bench_clear("bitboard", lines)))
+    rows.append(("engine step", bench_engine_step("list"), bench_engine_step("bitboard")))
+    for name, list_time, bit_time in rows:
+        print(f"{name:<16}{list_time * 1e6:>12.3f}{bit_time * 1e6:>16.3f}{list_time / bit_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
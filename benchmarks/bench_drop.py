@@ -0,0 +1,56 @@
+"""
+对比逐行检查与列高缓存两种方式计算快速下落落点的耗时
+运行：python -m benchmarks.bench_drop
+"""
+import random
+import timeit
+
+from board import BOARD_BACKENDS
+from constants import *
+
+
+def scan_drop(board, kind: int, direction: int, pos):
+    """
+    原有做法：逐行向下检查直到不合法
+    """
+    x, y = pos
+    while board.is_valid(kind, direction, (x, y + 1)):
+        y += 1
+    return x, y
+
+
+def make_case(backend: str, seed: int = 0):
+    rng = random.Random(seed)
+    board = BOARD_BACKENDS[backend]()
+    cells = [(x, y) for y in range(FIELD_HEIGHT - 4, FIELD_HEIGHT) for x in range(FIELD_WIDTH) if rng.random() < 0.7]
+    board.lock(cells, 1)
+    queries = []
+    while len(queries) < 5000:
+        kind = rng.randrange(len(BLOCK_LAYOUTS))
+        direction = rng.randrange(len(BLOCK_LAYOUTS[kind]))
+        pos = (rng.randint(-1, FIELD_WIDTH - 1), 0)
+        if board.is_valid(kind, direction, pos):
+            queries.append((kind, direction, pos))
+    return board, queries
+
+
+def bench(backend: str, use_heights: bool, repeat: int = 5) -> float:
+    board, queries = make_case(backend)
+    drop = board.drop_position if use_heights else lambda k, d, p: scan_drop(board, k, d, p)
+
+    def run() -> None:
+        for kind, direction, pos in queries:
+            drop(kind, direction, pos)
+
+    return min(timeit.repeat(run, number=1, repeat=repeat)) / len(queries)
+
+
+def main() -> None:
+    print(f"{'backend':<12}{'scan (us)':>12}{'heights (us)':>15}{'speed-up':>10}")
+    for backend in BOARD_BACKENDS:
+        scan_time, cached_time = bench(backend, False), bench(backend, True)
+        print(f"{backend:<12}{scan_time * 1e6:>12.3f}{cached_time * 1e6:>15.3f}{scan_time / cached_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
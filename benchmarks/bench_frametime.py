@@ -0,0 +1,73 @@
+"""
+对局界面的帧时间稳定性：由自动玩家操作，以真实的 60 帧/秒节奏运行 game_loop 若干帧，
+统计主循环相邻两轮的间隔分布。得分每过 500 分出现一次烟花，
+烟花阻塞主循环时会在这里表现为长帧。需要在项目根目录运行以加载 resources：
+运行：python -m benchmarks.bench_frametime [帧数]
+"""
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from ai import AutoPlayer
+from game import TetrisGame
+
+TARGET_MS = 1000 / 60
+
+
+class Done(Exception):
+    pass
+
+
+class TimedClock:
+    """
+    包装 pygame.time.Clock，记录主循环每一轮开始（tick 返回）的时刻
+    """
+    def __init__(self, clock: pygame.time.Clock, frames: int) -> None:
+        self.clock = clock
+        self.frames = frames
+        self.times = []
+
+    def tick(self, framerate: int = 0) -> int:
+        result = self.clock.tick(framerate)
+        self.times.append(time.perf_counter())
+        if len(self.times) > self.frames:
+            raise Done
+        return result
+
+
+def measure(frames: int):
+    # 不做前瞻的自动玩家每个方块只需很少的搜索，帧时间主要反映主循环本身
+    game = TetrisGame(AutoPlayer(lookahead=False))
+    clock = game.clock = TimedClock(game.clock, frames)
+    try:
+        game.game_loop()
+    except Done:
+        pass
+    times = clock.times
+    return [(b - a) * 1000 for a, b in zip(times, times[1:])], game.engine.score
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    intervals, score = measure(frames)
+    slow = sum(interval > 2 * TARGET_MS for interval in intervals)
+    print(f"{len(intervals)} 帧，得分 {score}")
+    print(f"平均 {statistics.mean(intervals):.2f} ms，标准差 {statistics.pstdev(intervals):.2f} ms")
+    print(f"p50 {percentile(intervals, 0.5):.2f} ms，p95 {percentile(intervals, 0.95):.2f} ms，"
+          f"p99 {percentile(intervals, 0.99):.2f} ms，最长 {max(intervals):.2f} ms")
+    print(f"超过 {2 * TARGET_MS:.1f} ms 的帧：{slow}，累计 {sum(i for i in intervals if i > 2 * TARGET_MS):.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+菜单界面空闲时的 CPU 占用：在 dummy 视频 / 音频驱动下分别停留在各个菜单界面若干秒（默认 3 秒）且没有任何输入，
+统计主线程和整个进程占用的 CPU 时间占墙钟时间的比例，以及期间提交画面（flip）的次数。
+到时由另一个线程投递 QUIT 事件结束。不播放背景音乐，避免把解码音乐的开销算进来。
+需要在项目根目录运行以加载 resources：
+运行：python -m benchmarks.bench_idle [秒数]
+"""
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from config import *
+from game import TetrisGame
+from scenes import MenuScene
+
+DEFAULT_SECONDS = 3.0
+
+
+def measure(game: TetrisGame, scene: str, seconds: float):
+    """
+    返回 (主线程 CPU 占比, 进程 CPU 占比, flip 次数)
+    """
+    flips = [0]
+    real_flip = pygame.display.flip
+
+    def flip() -> None:
+        flips[0] += 1
+        real_flip()
+
+    pygame.event.clear()
+    timer = threading.Timer(seconds, lambda: pygame.event.post(pygame.event.Event(QUIT)))
+    pygame.display.flip = flip
+    try:
+        wall, thread_cpu, process_cpu = time.perf_counter(), time.thread_time(), time.process_time()
+        timer.start()
+        game.run(scene)
+        wall = time.perf_counter() - wall
+        thread_cpu = time.thread_time() - thread_cpu
+        process_cpu = time.process_time() - process_cpu
+    finally:
+        timer.cancel()
+        pygame.display.flip = real_flip
+    return thread_cpu / wall, process_cpu / wall, flips[0]
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SECONDS
+    game = TetrisGame()
+    game.music_started = True
+    print(f"{'scene':<14}{'main CPU':>10}{'process CPU':>13}{'flips':>8}")
+    for name, scene in game.scenes.items():
+        if not isinstance(scene, MenuScene):
+            continue
+        thread_cpu, process_cpu, flips = measure(game, name, seconds)
+        print(f"{name:<14}{thread_cpu:>10.1%}{process_cpu:>13.1%}{flips:>8}")
+
+
+if __name__ == "__main__":
+    main()
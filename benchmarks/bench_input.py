@@ -0,0 +1,108 @@
+"""
+键盘输入的延迟与自动重复：后台线程在随机时刻向事件队列投递按键（按住左右键一段时间再松开、偶尔旋转），
+以真实的 60 帧/秒节奏运行 game_loop，报告按键从投递到被轮询的等待时间、从轮询到画面提交的延迟分位数，
+以及各 DAS / ARR 设置下每次按住产生的平均移动次数。需要在项目根目录运行以加载 resources：
+运行：python -m benchmarks.bench_input [秒数]
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from controls import Controls, percentile
+from game import TetrisGame
+
+SETTINGS = [(167, 33), (100, 16), (100, 0)]
+
+
+class Done(Exception):
+    pass
+
+
+class StopClock:
+    def __init__(self, clock: pygame.time.Clock, seconds: float) -> None:
+        self.clock = clock
+        self.deadline = time.perf_counter() + seconds
+
+    def tick(self, framerate: int = 0) -> int:
+        if time.perf_counter() > self.deadline:
+            raise Done
+        return self.clock.tick(framerate)
+
+
+def post(event_type: int, key: int) -> None:
+    pygame.event.post(pygame.event.Event(event_type, key=key, mod=0, posted=time.perf_counter()))
+
+
+def typist(stop: threading.Event, seed: int, counts: dict) -> None:
+    rng = random.Random(seed)
+    while not stop.is_set():
+        if rng.random() < 0.2:
+            post(pygame.KEYDOWN, pygame.K_UP)
+            post(pygame.KEYUP, pygame.K_UP)
+        else:
+            key = rng.choice((pygame.K_LEFT, pygame.K_RIGHT))
+            post(pygame.KEYDOWN, key)
+            time.sleep(rng.uniform(0.05, 0.4))
+            post(pygame.KEYUP, key)
+            counts["holds"] += 1
+        time.sleep(rng.uniform(0.05, 0.3))
+
+
+def run(das: int, arr: int, seconds: float) -> None:
+    game = TetrisGame(controls=Controls(das, arr))
+    game.clock = StopClock(game.clock, seconds)
+    moves = [0]
+    apply = game.engine.apply
+
+    def counted(action: str) -> bool:
+        applied = apply(action)
+        if applied and action in ("left", "right"):
+            moves[0] += 1
+        return applied
+
+    game.engine.apply = counted
+    waits = []
+    real_get = pygame.event.get
+
+    def get(*args, **kwargs):
+        events = real_get(*args, **kwargs)
+        now = time.perf_counter()
+        waits.extend((now - event.posted) * 1000 for event in events if event.type == pygame.KEYDOWN)
+        return events
+
+    pygame.event.get = get
+    counts = {"holds": 0}
+    stop = threading.Event()
+    thread = threading.Thread(target=typist, args=(stop, 0, counts), daemon=True)
+    thread.start()
+    try:
+        game.game_loop()
+    except Done:
+        pass
+    finally:
+        pygame.event.get = real_get
+    stop.set()
+    thread.join()
+    stats = game.controls.latency_stats()
+    print(f"DAS {das:3d} ms / ARR {arr:2d} ms: {counts['holds']} 次按住，"
+          f"平均每次移动 {moves[0] / max(counts['holds'], 1):.1f} 格；"
+          f"延迟 p50 {stats.get('p50', 0):.2f} / p95 {stats.get('p95', 0):.2f} / "
+          f"p99 {stats.get('p99', 0):.2f} ms（{stats['samples']} 个样本）；"
+          f"等待轮询 p50 {percentile(waits, 0.5):.2f} / p99 {percentile(waits, 0.99):.2f} ms")
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for das, arr in SETTINGS:
+        run(das, arr, seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+排行榜界面每帧的文件读取次数与耗时，以及 add_score 的耗时
+排行榜写到临时目录，不影响 resources 中的记录；需要在项目根目录运行以加载 resources：
+运行：python -m benchmarks.bench_leaderboard
+"""
+import builtins
+import os
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from config import *
+from game import TetrisGame
+from scenes import LeaderboardScene
+from utils import Leaderboard
+
+
+class Counter:
+    """
+    统计 open / os.stat 的调用次数
+    """
+    def __init__(self) -> None:
+        self.opens = 0
+        self.stats = 0
+        self.real_open = builtins.open
+        self.real_stat = os.stat
+
+    def open(self, *args, **kwargs):
+        self.opens += 1
+        return self.real_open(*args, **kwargs)
+
+    def stat(self, *args, **kwargs):
+        self.stats += 1
+        return self.real_stat(*args, **kwargs)
+
+    def __enter__(self) -> "Counter":
+        builtins.open, os.stat = self.open, self.stat
+        return self
+
+    def __exit__(self, *exc) -> None:
+        builtins.open, os.stat = self.real_open, self.real_stat
+
+
+def bench_screen(leaderboard: Leaderboard, frames: int = 600):
+    """
+    运行排行榜界面 frames 帧后模拟点击“退出”，返回 (文件操作次数, 平均每帧耗时)。
+    每帧送入一个 VIDEOEXPOSE 事件，使空闲时不重画的排行榜界面每帧都重画
+    """
+    remaining = [frames]
+    real_flip, real_get, real_wait = pygame.display.flip, pygame.event.get, pygame.event.wait
+    exit_pos = (int(0.5 * BRICK_WIDTH * (FIELD_WIDTH + INFO_PANEL_WIDTH)), int(SCREEN.get_height() // 2 + 4.5 * 37.5))
+
+    def get(*args, **kwargs):
+        real_get()
+        remaining[0] -= 1
+        if remaining[0] > 0:
+            return []
+        return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=exit_pos)]
+
+    game = TetrisGame()
+    game.leaderboard = leaderboard
+    scene = LeaderboardScene(game)
+    pygame.display.flip, pygame.event.get = lambda: None, get
+    pygame.event.wait = lambda timeout=0: pygame.event.Event(pygame.VIDEOEXPOSE)
+    try:
+        with Counter() as counter:
+            start = time.perf_counter()
+            scene.enter()
+            while scene.frame() is None:
+                pass
+            elapsed = time.perf_counter() - start
+    finally:
+        pygame.display.flip, pygame.event.get, pygame.event.wait = real_flip, real_get, real_wait
+    return counter.opens + counter.stats, elapsed / frames
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        leaderboard = Leaderboard(os.path.join(directory, "leaderboard.txt"))
+        start = time.perf_counter()
+        for score in range(0, 20000, 100):
+            leaderboard.add_score(score)
+        add_time = (time.perf_counter() - start) / 200
+
+        frames = 600
+        io_calls, frame_time = bench_screen(leaderboard, frames)
+        print(f"add_score: {add_time * 1e6:.1f} us/call (atomic write when the score enters the top 10)")
+        print(f"leaderboard screen: {frames} frames, {io_calls} file operations, {frame_time * 1e6:.1f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+SQLite 排行榜在大量记录下的写入与查询延迟：分批写入 N 条成绩（默认 100 万），
+再测前 10 名、深分页、按难度前 10 名、按时间段查询和计数的耗时。数据库写到临时目录
+运行：python -m benchmarks.bench_leaderboard_db [记录数]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from leaderboard_db import SqliteLeaderboard
+
+DIFFICULTIES = ["简单", "普通", "困难"]
+BATCH_SIZE = 10000
+REPEATS = 20
+
+
+def fake_rows(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        timestamp = start + timedelta(seconds=i * 30)
+        yield rng.randrange(200000), rng.choice(DIFFICULTIES), timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def timed(function, repeats: int = REPEATS) -> float:
+    function()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    with tempfile.TemporaryDirectory() as directory:
+        board = SqliteLeaderboard(os.path.join(directory, "leaderboard.db"))
+        rows = fake_rows(count)
+        start = time.perf_counter()
+        batches = 0
+        while True:
+            batch = [row for _, row in zip(range(BATCH_SIZE), rows)]
+            if not batch:
+                break
+            board.add_scores(batch)
+            batches += 1
+        elapsed = time.perf_counter() - start
+        print(f"写入 {count} 条（{batches} 个事务）：{elapsed:.2f} s，{count / elapsed:.0f} 条/s")
+
+        start = time.perf_counter()
+        for _ in range(100):
+            board.add_score(random.randrange(200000), "普通")
+        print(f"单条 add_score（每条一个事务）：{(time.perf_counter() - start) * 10:.3f} ms")
+
+        queries = [
+            ("前 10 名", lambda: board.top(10)),
+            ("第 1000 页（offset 9990）", lambda: board.top(10, 9990)),
+            ("困难难度前 10 名", lambda: board.top(10, difficulty="困难")),
+            ("2024-03-01 当天", lambda: board.between("2024-03-01", "2024-03-02")),
+            ("总数", lambda: board.count()),
+            ("困难难度总数", lambda: board.count("困难")),
+        ]
+        for name, query in queries:
+            print(f"{name}：{timed(query):.3f} ms")
+
+        plan = board.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT score, difficulty, time FROM scores ORDER BY score DESC, id LIMIT 10"
+        ).fetchall()
+        print("前 10 名查询计划：", "; ".join(row[-1] for row in plan))
+        board.close()
+
+
+if __name__ == "__main__":
+    main()
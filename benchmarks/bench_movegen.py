@@ -0,0 +1,62 @@
+"""
+走法生成器的查询耗时：首次搜索与命中缓存的重复查询对比
+运行：python -m benchmarks.bench_movegen
+"""
+import time
+
+from ai import AutoPlayer
+from engine import Piece, TetrisEngine
+from movegen import MoveGenerator, search
+
+
+def collect_positions(count: int = 300, seed: int = 0):
+    """
+    用自动玩家打一局，记录每个方块出生时的 (场地, 方块)
+    """
+    engine = TetrisEngine(seed=seed)
+    player = AutoPlayer()
+    positions = []
+    now = 0
+    last = -1
+    while len(positions) < count:
+        if engine.game_over:
+            engine.reset()
+            last = -1
+        if engine.pieces != last:
+            last = engine.pieces
+            board = type(engine.board)()
+            board.lock([(x, y) for y, row in enumerate(engine.grid) for x, v in enumerate(row) if v], 1)
+            piece = engine.cur_piece
+            positions.append((board, Piece(piece.kind, piece.direction, piece.position)))
+        action = player(engine)
+        if action:
+            engine.apply(action)
+        now += 16
+        engine.update(now)
+    return positions
+
+
+def main() -> None:
+    positions = collect_positions()
+    start = time.perf_counter()
+    states = 0
+    for board, piece in positions:
+        states += len(search(board, piece.kind, piece.direction, piece.position))
+    uncached = (time.perf_counter() - start) / len(positions)
+
+    movegen = MoveGenerator()
+    for board, piece in positions:
+        movegen.reachable(board, piece)
+    start = time.perf_counter()
+    for board, piece in positions:
+        movegen.reachable(board, piece)
+    cached = (time.perf_counter() - start) / len(positions)
+
+    print(f"positions: {len(positions)}, lock states per query: {states / len(positions):.1f}")
+    print(f"search:       {uncached * 1e6:10.1f} us/query")
+    print(f"cached query: {cached * 1e6:10.1f} us/query ({uncached / cached:.0f}x)")
+    print(f"cache hit rate: {movegen.cache.hit_rate():.2f}")
+
+
+if __name__ == "__main__":
+    main()
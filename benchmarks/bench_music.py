@@ -0,0 +1,50 @@
+"""
+对比背景音乐整段解码为 pygame.mixer.Sound 与通过 pygame.mixer.music 流式播放的
+开始播放耗时和常驻内存增量（每种方式在新的子进程中测量；内存读取 /proc/self/statm，仅限 Linux）
+需要在项目根目录运行以加载 resources：
+运行：python -m benchmarks.bench_music
+"""
+import subprocess
+import sys
+
+SCRIPT = """
+import os, sys, time
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+from assets import ASSETS, MUSIC
+
+def rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+pygame.mixer.init()
+before = rss()
+start = time.perf_counter()
+if sys.argv[1] == "sound":
+    music = pygame.mixer.Sound(ASSETS.path(MUSIC["music"][0]))
+    music.play(-1)
+else:
+    ASSETS.play_music()
+elapsed = time.perf_counter() - start
+print(elapsed, rss() - before)
+"""
+
+
+def measure(mode: str):
+    output = subprocess.run([sys.executable, "-c", SCRIPT, mode], check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+    elapsed, memory = output.strip().splitlines()[-1].split()
+    return float(elapsed), int(memory)
+
+
+def main(repeat: int = 5) -> None:
+    print(f"{'mode':<10}{'start (ms)':>12}{'RSS delta (MB)':>16}")
+    for mode in ("sound", "stream"):
+        results = [measure(mode) for _ in range(repeat)]
+        elapsed = min(r[0] for r in results)
+        memory = min(r[1] for r in results)
+        print(f"{mode:<10}{elapsed * 1e3:>12.2f}{memory / 2 ** 20:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
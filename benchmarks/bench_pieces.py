@@ -0,0 +1,78 @@
+"""
+生成方块的开销：每种方块生成器连续生成若干个方块（默认 100 万个），对比方块对象交回池中重复使用
+与每次新建（原有做法，锁定的方块直接丢弃）的耗时和新建的方块对象数。
+只测量生成与出生（spawn），不移动和锁定方块。新建的对象数在另一次不计时的运行中统计：
+临时替换 Piece.__init__，数出创建引擎和生成方块期间实际调用的次数
+运行：python -m benchmarks.bench_pieces [方块数] [--preview 预览队列长度]
+"""
+import argparse
+import time
+from typing import List, Optional, Tuple
+
+from engine import Piece, TetrisEngine
+from generators import GENERATORS
+
+DEFAULT_PIECES = 1000000
+
+
+def run_spawns(generator: str, pieces: int, preview: int, pooled: bool) -> float:
+    """
+    连续生成 pieces 个方块，pooled 为 True 时每个方块出生前把当前方块交回池中，返回生成部分的耗时（秒）
+    """
+    engine = TetrisEngine(seed=0, generator=generator, preview=preview)
+    pool = engine.pool
+    spawn = engine.spawn
+    start = time.perf_counter()
+    if pooled:
+        for _ in range(pieces):
+            pool.append(engine.cur_piece)
+            spawn()
+    else:
+        for _ in range(pieces):
+            spawn()
+    return time.perf_counter() - start
+
+
+def count_created(generator: str, pieces: int, preview: int, pooled: bool) -> int:
+    """
+    与 run_spawns 相同的运行（包括创建引擎）中实际新建的 Piece 对象数
+    """
+    created = 0
+    original = Piece.__init__
+
+    def counting_init(self: Piece, *args, **kwargs) -> None:
+        nonlocal created
+        created += 1
+        original(self, *args, **kwargs)
+
+    Piece.__init__ = counting_init
+    try:
+        run_spawns(generator, pieces, preview, pooled)
+    finally:
+        Piece.__init__ = original
+    return created
+
+
+def spawn_pieces(generator: str, pieces: int, preview: int, pooled: bool) -> Tuple[float, int]:
+    """
+    返回 (每个方块的耗时（微秒）, 新建的方块对象数)
+    """
+    elapsed = run_spawns(generator, pieces, preview, pooled)
+    return elapsed / pieces * 1e6, count_created(generator, pieces, preview, pooled)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="方块生成器与对象池的开销")
+    parser.add_argument("pieces", nargs="?", type=int, default=DEFAULT_PIECES)
+    parser.add_argument("--preview", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(f"{'generator':<10}{'pool':<6}{'us/piece':>10}{'new Piece':>11}")
+    for generator in GENERATORS:
+        for pooled in (False, True):
+            per_piece, created = spawn_pieces(generator, args.pieces, args.preview, pooled)
+            print(f"{generator:<10}{'yes' if pooled else 'no':<6}{per_piece:>10.3f}{created:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+性能分析器的开销：分别在关闭和开启 PROFILER 时绘制同样的 3000 帧（两种渲染器），
+并单独测量关闭时一次 mark 调用的耗时。需要在项目根目录运行以加载 resources：
+运行：python -m benchmarks.bench_profiler
+"""
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from config import *
+from profiler import PROFILER
+from renderer import RENDERERS
+from benchmarks.bench_render import bench
+
+
+def main() -> None:
+    pygame.init()
+    calls = 1000000
+    per_call = timeit.timeit(lambda: PROFILER.mark("field"), number=calls) / calls
+    print(f"关闭时 mark 调用：{per_call * 1e9:.0f} ns")
+    for name in RENDERERS:
+        # 先各跑一遍预热字形缓存和图集
+        bench(name, frames=300)
+        disabled = bench(name)
+        PROFILER.enable()
+        PROFILER.begin_frame("game")
+        enabled = bench(name)
+        PROFILER.enabled = False
+        print(f"{name:<8}关闭 {disabled * 1e3:.3f} ms/frame，开启 {enabled * 1e3:.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+对比每帧全屏重画与脏矩形绘制的单帧耗时（包括 flip / display.update）
+默认使用 SDL 的 dummy 视频驱动，需要在项目根目录运行以加载 resources：
+运行：python -m benchmarks.bench_render
+"""
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from config import *
+from engine import ACTIONS, TetrisEngine
+from renderer import RENDERERS
+from utils import Button, Skill
+
+
+def bench(name: str, frames: int = 3000, seed: int = 0) -> float:
+    """
+    用随机按键推进一局（与界面层相同的 60 FPS 时钟），返回平均每帧的绘制耗时
+    """
+    rng = random.Random(seed)
+    engine = TetrisEngine(seed=seed)
+    buttons = (Button((BRICK_WIDTH * (FIELD_WIDTH + 1), SCREEN.get_height() // 2 + 75, 100, 37.5), "重新开始", None),
+               Button((BRICK_WIDTH * (FIELD_WIDTH + 1), SCREEN.get_height() // 2 + 150, 100, 37.5), "退出", None))
+    renderer = RENDERERS[name](buttons, Skill(engine))
+    now = 0
+    elapsed = 0.0
+    for _ in range(frames):
+        if rng.random() < 0.1:
+            engine.apply(rng.choice(ACTIONS))
+        now += 1000 // 60
+        engine.update(now)
+        if engine.game_over:
+            engine.reset()
+        start = time.perf_counter()
+        renderer.draw(engine)
+        elapsed += time.perf_counter() - start
+    return elapsed / frames
+
+
+def main() -> None:
+    pygame.init()
+    results = {name: bench(name) for name in RENDERERS}
+    for name, frame_time in results.items():
+        print(f"{name:<8}{frame_time * 1e3:8.3f} ms/frame")
+    print(f"speed-up: {results['full'] / results['dirty']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+无界面回放的速度：先由随机玩家和自动玩家各录制若干局，再分别逐帧回放和跳过空闲帧回放，
+报告每秒回放的对局时长（相对原速的倍数）并校验每局的得分和场地
+运行：python -m benchmarks.bench_replay [每种玩家的局数]
+"""
+import sys
+import time
+
+from replay import TICK_RATE, record, simulate, verify
+from tournament import AGENTS
+
+MAX_TICKS = 60 * 2 * TICK_RATE
+
+
+def bench(name: str, recordings, turbo: bool) -> None:
+    start = time.perf_counter()
+    failed = sum(not verify(recording, simulate(recording, turbo=turbo)) for recording in recordings)
+    elapsed = time.perf_counter() - start
+    ticks = sum(recording.ticks for recording in recordings)
+    print(f"  {name}: {elapsed * 1000:.1f} ms, {ticks / TICK_RATE / elapsed:.0f} 倍速, {failed} 局不一致")
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for agent in ("random", "ai"):
+        start = time.perf_counter()
+        recordings = [record(AGENTS[agent](seed), seed, max_ticks=MAX_TICKS) for seed in range(games)]
+        elapsed = time.perf_counter() - start
+        ticks = sum(recording.ticks for recording in recordings)
+        actions = sum(len(recording.actions) for recording in recordings)
+        print(f"{agent}: {games} 局, 共 {ticks / TICK_RATE:.0f} 秒对局, {actions} 个动作, 录制 {elapsed:.2f} s")
+        bench("逐帧", recordings, turbo=False)
+        bench("跳过空闲帧", recordings, turbo=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+大场地压力测试：在不同尺寸的场地上测量碰撞检测、直接落下、消行、技能清除与下落的单次耗时，
+以及无界面对局中每个方块的平均耗时，检查耗时随改动的行数而不是场地面积增长。
+每个场地底部预先堆上 STACK_ROWS 行（每行随机留一个空格），同一宽度下不同高度的结果应当接近；
+“old scan” 列为原来每次锁定都要做的全场地满行扫描的耗时，作为对照。
+运行：python -m benchmarks.bench_scaling [--sizes 10x16 64x512 256x4096] [--backends bitboard list]
+"""
+import argparse
+import gc
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from board import BOARD_BACKENDS, ListBoard
+from constants import *
+from engine import TetrisEngine
+
+DEFAULT_SIZES = ("10x16", "10x4096", "64x512", "256x512", "256x4096")
+STACK_ROWS = 12
+CLEAR_LINES = 4
+
+
+def parse_size(text: str) -> Tuple[int, int]:
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def stacked_board(backend: str, width: int, height: int, seed: int = 0) -> ListBoard:
+    rng = random.Random(seed)
+    board = BOARD_BACKENDS[backend](width, height)
+    cells = []
+    for y in range(height - STACK_ROWS, height):
+        hole = rng.randrange(width)
+        cells.extend((x, y) for x in range(width) if x != hole)
+    board.lock(cells, 1)
+    board.eliminate_lines()
+    return board
+
+
+def timed(run: Callable[[int], float], min_time: float = 0.05) -> float:
+    """
+    把次数加倍到耗时不少于 min_time，返回每次的耗时（微秒）。
+    与 timeit 一样在计时期间关闭垃圾回收，避免大场地上的准备工作触发的回收计入被测操作
+    """
+    n = 1
+    gc.disable()
+    try:
+        while True:
+            elapsed = run(n)
+            if elapsed >= min_time:
+                return elapsed / n * 1e6
+            n *= 2
+    finally:
+        gc.enable()
+
+
+def collision_case(board: ListBoard, rng: random.Random) -> Callable[[int], float]:
+    """
+    在最高砖块附近的随机位置做碰撞检测
+    """
+    queries = []
+    for _ in range(1000):
+        kind = rng.randrange(len(BLOCK_LAYOUTS))
+        direction = rng.randrange(len(BLOCK_LAYOUTS[kind]))
+        mask = board.masks[kind][direction]
+        y = min(max(board.top - rng.randrange(4), mask.y_lo), mask.y_hi)
+        queries.append((kind, direction, (rng.randint(mask.x_lo, mask.x_hi), y)))
+
+    def run(n: int) -> float:
+        is_valid = board.is_valid
+        start = time.perf_counter()
+        for i in range(n):
+            kind, direction, pos = queries[i % len(queries)]
+            is_valid(kind, direction, pos)
+        return time.perf_counter() - start
+    return run
+
+
+def drop_case(board: ListBoard, rng: random.Random) -> Callable[[int], float]:
+    """
+    从出生行直接落下
+    """
+    queries = []
+    for _ in range(1000):
+        kind = rng.randrange(len(BLOCK_LAYOUTS))
+        direction = rng.randrange(len(BLOCK_LAYOUTS[kind]))
+        mask = board.masks[kind][direction]
+        queries.append((kind, direction, (rng.randint(mask.x_lo, mask.x_hi), mask.y_lo)))
+
+    def run(n: int) -> float:
+        drop_position = board.drop_position
+        start = time.perf_counter()
+        for i in range(n):
+            kind, direction, pos = queries[i % len(queries)]
+            drop_position(kind, direction, pos)
+        return time.perf_counter() - start
+    return run
+
+
+def clear_case(board: ListBoard) -> Callable[[int], float]:
+    """
+    在堆叠顶部写入 CLEAR_LINES 个满行（不计时），计时查找满行并消除
+    """
+    top = board.top
+    full = [(x, y) for y in range(top - CLEAR_LINES, top) for x in range(board.width)]
+
+    def run(n: int) -> float:
+        elapsed = 0.0
+        for _ in range(n):
+            board.lock(full, 1)
+            start = time.perf_counter()
+            board.eliminate_lines(board.full_rows())
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run
+
+
+def old_scan_case(board: ListBoard) -> Callable[[int], float]:
+    """
+    原来每次锁定时扫描整个场地查找满行
+    """
+    def run(n: int) -> float:
+        start = time.perf_counter()
+        for _ in range(n):
+            tuple(y for y, row in enumerate(board.grid) if 0 not in row)
+        return time.perf_counter() - start
+    return run
+
+
+def skill_case(backend: str, width: int, height: int, skill: str) -> Callable[[int], float]:
+    """
+    技能的完整效果（选取目标、清除、下落），每释放 20 次换一个新堆好的场地（不计时）
+    """
+    engine = TetrisEngine(seed=0, backend=backend, width=width, height=height)
+
+    def run(n: int) -> float:
+        elapsed = 0.0
+        for i in range(n):
+            if i % 20 == 0:
+                engine.board = stacked_board(backend, width, height, i)
+            start = time.perf_counter()
+            engine.apply_skill(skill)
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run
+
+
+def play_case(backend: str, width: int, height: int, pieces: int = 2000, seed: int = 0) -> Tuple[float, int]:
+    """
+    无界面对局：每个方块随机旋转、移到随机列后直接落下，返回 (每个方块的平均耗时（微秒）, 消除行数)
+    """
+    rng = random.Random(seed)
+    engine = TetrisEngine(seed=seed, backend=backend, width=width, height=height)
+    start = time.perf_counter()
+    placed = 0
+    while placed < pieces:
+        for _ in range(rng.randrange(4)):
+            engine.rotate()
+        target = rng.randrange(width)
+        piece = engine.cur_piece
+        step = engine.left if target < piece.position[0] else engine.right
+        while piece.position[0] != target and step():
+            pass
+        engine.down()
+        result = engine.step()
+        if result.locked:
+            placed += 1
+        if engine.game_over:
+            engine.reset()
+    return (time.perf_counter() - start) / pieces * 1e6, engine.lines
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="大场地上核心操作的耗时")
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES), help="场地尺寸，格式为 宽x高")
+    parser.add_argument("--backends", nargs="+", default=["bitboard", "list"], choices=sorted(BOARD_BACKENDS))
+    args = parser.parse_args(argv)
+
+    header = ["size", "backend", "collide", "drop", "clear 4", "old scan", "explosion", "column", "piece"]
+    print(f"{header[0]:<10}{header[1]:<10}" + "".join(f"{h:>11}" for h in header[2:]) + "  (us)")
+    for text in args.sizes:
+        width, height = parse_size(text)
+        for backend in args.backends:
+            rng = random.Random(0)
+            board = stacked_board(backend, width, height)
+            results: Dict[str, float] = {
+                "collide": timed(collision_case(board, rng)),
+                "drop": timed(drop_case(board, rng)),
+                "clear 4": timed(clear_case(board)),
+                "old scan": timed(old_scan_case(board)),
+                "explosion": timed(skill_case(backend, width, height, "EXPLOSION")),
+                "column": timed(skill_case(backend, width, height, "COLUMN_WIPE")),
+            }
+            results["piece"], _ = play_case(backend, width, height)
+            print(f"{text:<10}{backend:<10}" + "".join(f"{results[h]:>11.2f}" for h in header[2:]))
+
+
+if __name__ == "__main__":
+    main()
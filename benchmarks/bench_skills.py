@@ -0,0 +1,34 @@
+"""
+在接近填满的场地上逐个释放技能，按技能输出平均耗时（来自 TetrisEngine.skill_timings）
+运行：python -m benchmarks.bench_skills
+"""
+from benchmarks.bench_stress import nearly_full_cells
+from board import BOARD_BACKENDS
+from engine import TetrisEngine
+from skills import SKILLS
+
+
+def bench(backend: str, rounds: int = 2000, seed: int = 0) -> TetrisEngine:
+    engine = TetrisEngine(seed=seed, backend=backend)
+    cells = nearly_full_cells(seed)
+    for _ in range(rounds):
+        for skill in SKILLS:
+            engine.board.reset()
+            engine.board.lock(cells, 1)
+            engine.apply_skill(skill)
+    return engine
+
+
+def main() -> None:
+    print(f"{'skill':<14}" + "".join(f"{backend + ' (us)':>16}{'cells':>8}" for backend in BOARD_BACKENDS))
+    engines = {backend: bench(backend) for backend in BOARD_BACKENDS}
+    for skill in SKILLS:
+        line = f"{skill:<14}"
+        for engine in engines.values():
+            timing = engine.skill_timings[skill]
+            line += f"{timing.mean() * 1e6:>16.1f}{timing.cells / timing.count:>8.1f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
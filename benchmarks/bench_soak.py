@@ -0,0 +1,182 @@
+"""
+长时间运行的稳定性：在 dummy 视频 / 音频驱动下由脚本模拟点击，通过 TetrisGame.run 连续重新开始若干局（默认 10000 局），
+每 100 局从封面依次进出排行榜、设置、难度和教程界面再开始，每 1000 局把一局打到结束后从结算界面重新开始。
+定期记录主循环中的调用栈深度、tracemalloc 统计的 Python 内存和进程的最大 RSS，确认都不随重新开始的次数增长。
+时钟不等待，每次读取推进 17 毫秒；排行榜写到临时目录。需要在项目根目录运行以加载 resources：
+运行：python -m benchmarks.bench_soak [重新开始次数]
+"""
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from typing import List, Optional, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from config import *
+from game import TetrisGame
+from utils import Leaderboard
+
+# 每局在对局界面停留的帧数
+GAME_FRAMES = 3
+MENU_EVERY = 100
+GAME_OVER_EVERY = 1000
+SAMPLES = 20
+
+# 回到封面后依次点击的 (界面, 按钮)
+MENU_TOUR = (
+    ("cover", "排行榜"), ("leaderboard", "退出"), ("cover", "设置"), ("settings", "调整难度"),
+    ("difficulty", "普通"), ("settings", "玩法教程"), ("teaching", "退出"), ("settings", "退出"),
+    ("cover", "开始游戏"),
+)
+
+
+class NoWaitClock:
+    def tick(self, framerate: int = 0) -> int:
+        return 0
+
+
+def stack_depth() -> int:
+    depth = 0
+    frame = sys._getframe(1)
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+def max_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    # Linux 上单位为 KB，macOS 上为字节
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1 << 20) if sys.platform == "darwin" else rss / 1024
+
+
+class Driver:
+    """
+    代替 pygame.event.get / wait，按当前界面决定每一帧的事件，并定期采样
+    """
+    def __init__(self, game: TetrisGame, restarts: int) -> None:
+        self.game = game
+        self.restarts = restarts
+        self.done = 0
+        self.frames = 0
+        self.scene = ""
+        self.scene_frames = 0
+        self.tour: List[Tuple[str, str]] = []
+        self.dropping = False
+        self.depth = 0
+        self.pending: List[pygame.event.Event] = []
+        self.samples: List[Tuple[int, int, int, int, Optional[float]]] = []
+        for scene in game.scenes.values():
+            scene.enter, scene.frame = self.wrap(scene)
+
+    def wrap(self, scene):
+        """
+        包装界面的 enter / frame，记录当前界面、在该界面停留的帧数和主循环调用 frame 时的调用栈深度
+        """
+        enter, frame = scene.enter, scene.frame
+
+        def wrapped_enter() -> None:
+            self.scene, self.scene_frames = scene.name, 0
+            if scene.name == "game_over":
+                self.dropping = False
+            enter()
+
+        def wrapped_frame() -> Optional[str]:
+            self.scene_frames += 1
+            self.frames += 1
+            self.depth = stack_depth()
+            self.pending = self.script()
+            return frame()
+        return wrapped_enter, wrapped_frame
+
+    def click(self, scene: str, text: str) -> List[pygame.event.Event]:
+        scene = self.game.scenes[scene]
+        buttons = (scene.restart, scene.exit_game) if scene.name == "game" else scene.buttons
+        rect = next(btn.rect for btn in buttons if btn.text == text)
+        return [pygame.event.Event(MOUSEBUTTONDOWN, button=1, pos=rect.center)]
+
+    def restarted(self) -> None:
+        self.done += 1
+        if self.done % max(self.restarts // SAMPLES, 1) == 0:
+            self.sample()
+
+    def sample(self) -> None:
+        gc.collect()
+        self.samples.append((self.done, self.frames, self.depth, tracemalloc.get_traced_memory()[0], max_rss_mb()))
+
+    def get(self, *args, **kwargs) -> List[pygame.event.Event]:
+        events, self.pending = self.pending, []
+        return events
+
+    def wait(self, timeout: int = 0) -> pygame.event.Event:
+        return self.pending.pop(0) if self.pending else pygame.event.Event(NOEVENT)
+
+    def script(self) -> List[pygame.event.Event]:
+        """
+        这一帧的事件
+        """
+        if self.done >= self.restarts:
+            return [pygame.event.Event(QUIT)]
+        if self.tour and self.scene == self.tour[0][0]:
+            return self.click(*self.tour.pop(0))
+        if self.scene == "game_over":
+            self.restarted()
+            return self.click("game_over", "重新开始")
+        if self.scene != "game":
+            return []
+        if self.dropping:
+            return [pygame.event.Event(KEYDOWN, key=K_DOWN, mod=0)]
+        if self.scene_frames < GAME_FRAMES:
+            return []
+        if (self.done + 1) % GAME_OVER_EVERY == 0:
+            self.dropping = True
+            return []
+        self.restarted()
+        if self.done % MENU_EVERY == 0:
+            self.tour = list(MENU_TOUR)
+            return self.click("game", "退出")
+        return self.click("game", "重新开始")
+
+
+def main() -> None:
+    restarts = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    real_get, real_wait, real_ticks = pygame.event.get, pygame.event.wait, pygame.time.get_ticks
+    clock = [0]
+
+    def ticks() -> int:
+        clock[0] += 17
+        return clock[0]
+
+    with tempfile.TemporaryDirectory() as directory:
+        game = TetrisGame()
+        game.clock = NoWaitClock()
+        game.leaderboard = Leaderboard(os.path.join(directory, "leaderboard.txt"))
+        driver = Driver(game, restarts)
+        pygame.event.get, pygame.event.wait, pygame.time.get_ticks = driver.get, driver.wait, ticks
+        tracemalloc.start()
+        try:
+            game.run("game")
+        finally:
+            pygame.event.get, pygame.event.wait, pygame.time.get_ticks = real_get, real_wait, real_ticks
+            tracemalloc.stop()
+
+    print(f"{'restarts':>9}{'frames':>9}{'stack':>7}{'traced KB':>11}{'max RSS MB':>12}")
+    for done, frames, depth, traced, rss in driver.samples:
+        print(f"{done:>9}{frames:>9}{depth:>7}{traced / 1024:>11.1f}{rss if rss is not None else float('nan'):>12.1f}")
+    first, last = driver.samples[0], driver.samples[-1]
+    print(f"调用栈深度 {min(s[2] for s in driver.samples)}-{max(s[2] for s in driver.samples)}；"
+          f"第 {first[0]} 局到第 {last[0]} 局 Python 内存变化 {(last[3] - first[3]) / 1024:+.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+启动时间：从导入 game 模块到封面第一帧 flip 的耗时，每种方式在新的子进程中重复测量取中位数。
+pygame 本身的导入耗时与资源加载方式无关，不计入
+  - eager：模拟原有做法，显示封面前同步加载全部资源并开始播放背景音乐
+  - lazy：资源在第一次使用时加载（默认）
+  - prewarm：lazy 的基础上在后台线程中预先加载全部资源
+需要在项目根目录运行以加载 resources：
+运行：python -m benchmarks.bench_startup
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+MODES = ("eager", "lazy", "prewarm")
+
+SCRIPT = """
+import os, sys, time
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+start = time.perf_counter()
+
+def flip():
+    print(time.perf_counter() - start)
+    sys.stdout.flush()
+    os._exit(0)
+
+pygame.display.flip = flip
+import game
+mode = sys.argv[1]
+if mode == "eager":
+    game.ASSETS.prewarm(background=False)
+    music = pygame.mixer.Sound("resources/music.mp3")
+    music.play(-1)
+game.TetrisGame(prewarm=mode == "prewarm").show_cover()
+"""
+
+
+def measure(mode: str) -> float:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    output = subprocess.run([sys.executable, "-c", SCRIPT, mode], env=env, check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main(repeat: int = 7) -> None:
+    print(f"{'mode':<10}{'median (ms)':>12}{'min (ms)':>10}")
+    for mode in MODES:
+        times = [measure(mode) for _ in range(repeat)]
+        print(f"{mode:<10}{statistics.median(times) * 1e3:>12.1f}{min(times) * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+接近填满的场地上的消行与技能后下落（settle）压力测试，对比原有做法与当前实现
+运行：python -m benchmarks.bench_stress
+"""
+import random
+import timeit
+
+from board import BOARD_BACKENDS
+from constants import *
+
+
+def old_eliminate_lines(board) -> int:
+    """
+    原有做法：每消除一行都删除并在顶部插入一行，随后从同一行号重新检查，最后重新计算列高
+    """
+    eliminated = 0
+    y = FIELD_HEIGHT - 1
+    while y >= 0:
+        if 0 not in board.grid[y]:
+            eliminated += 1
+            del board.grid[y]
+            board.grid.insert(0, [0] * FIELD_WIDTH)
+        else:
+            y -= 1
+    if eliminated:
+        board.refresh_heights()
+    return eliminated
+
+
+def old_settle(board) -> None:
+    """
+    原有做法：自下而上逐格检查，每个砖块逐行向下找最大下落距离
+    """
+    grid = board.grid
+    for y in range(FIELD_HEIGHT - 2, -1, -1):
+        for x in range(FIELD_WIDTH):
+            if grid[y][x] != 0:
+                drop = 0
+                while y + drop + 1 < FIELD_HEIGHT and grid[y + drop + 1][x] == 0:
+                    drop += 1
+                if drop > 0:
+                    grid[y + drop][x] = grid[y][x]
+                    grid[y][x] = 0
+    board.refresh_heights()
+
+
+def nearly_full_cells(seed: int = 0):
+    """
+    除顶部两行外几乎填满：每行随机留一个空格，底部四行为满行
+    """
+    rng = random.Random(seed)
+    cells = []
+    for y in range(2, FIELD_HEIGHT):
+        hole = None if y >= FIELD_HEIGHT - 4 else rng.randrange(FIELD_WIDTH)
+        cells.extend((x, y) for x in range(FIELD_WIDTH) if x != hole)
+    return cells
+
+
+def scattered_holes(seed: int = 0):
+    """
+    技能（爆破 / 清行）清除的格子：散布在场地各处，使上方大量砖块需要下落
+    """
+    rng = random.Random(seed)
+    return [(rng.randrange(FIELD_WIDTH), rng.randrange(2, FIELD_HEIGHT)) for _ in range(FIELD_WIDTH * 4)]
+
+
+def bench(backend: str, operation: str, number: int = 2000) -> float:
+    """
+    在 number 个相同的场地上各执行一次 operation，返回平均耗时。
+    原有做法只维护 grid 和列高，因此只在 ListBoard 上对比
+    """
+    cells = nearly_full_cells()
+    holes = scattered_holes()
+    boards = []
+    for _ in range(number):
+        board = BOARD_BACKENDS[backend]()
+        board.lock(cells, 1)
+        if operation.endswith("settle"):
+            board.clear_cells(holes)
+        boards.append(board)
+    run = {
+        "old clear": old_eliminate_lines,
+        "clear": lambda board: board.eliminate_lines(),
+        "old settle": old_settle,
+        "settle": lambda board: board.settle(),
+    }[operation]
+    it = iter(boards)
+    return timeit.timeit(lambda: run(next(it)), number=number) / number
+
+
+def main() -> None:
+    print(f"{'operation':<12}{'old list (us)':>15}{'list (us)':>12}{'speed-up':>10}{'bitboard (us)':>15}")
+    for operation in ("clear", "settle"):
+        old_time = bench("list", "old " + operation)
+        new_time = bench("list", operation)
+        bit_time = bench("bitboard", operation)
+        print(f"{operation:<12}{old_time * 1e6:>15.1f}{new_time * 1e6:>12.1f}{old_time / new_time:>9.1f}x"
+              f"{bit_time * 1e6:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
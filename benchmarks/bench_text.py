@@ -0,0 +1,56 @@
+"""
+对比每帧直接调用 FONT.render 与经过文字缓存绘制的耗时，并输出缓存命中率
+需要在项目根目录运行以加载 resources：
+运行：python -m benchmarks.bench_text
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from assets import ASSETS
+from config import *
+from text import TextCache
+
+# 对局界面每帧绘制的文字：两个按钮、“下一个”标签、技能名称和得分
+LABELS = ("重新开始", "退出", "下一个:", SkillType["TIME_SLOW"])
+
+
+def frame_direct(font: pygame.font.Font, surface: pygame.Surface, score: int) -> None:
+    for label in LABELS:
+        surface.blit(font.render(label, True, (255, 255, 255)), (0, 0))
+    surface.blit(font.render(f'得分: {score}', True, (255, 255, 255)), (0, 0))
+
+
+def frame_cached(text: TextCache, surface: pygame.Surface, score: int) -> None:
+    for label in LABELS:
+        surface.blit(text.render(label), (0, 0))
+    text.blit(surface, f'得分: {score}', (0, 0))
+
+
+def main(frames: int = 5000) -> None:
+    surface = pygame.Surface(SCREEN.get_size())
+    # 平均每 10 帧加一次分，模拟得分持续变化
+    scores = [frame // 10 * 100 for frame in range(frames)]
+
+    font = ASSETS.font()
+    start = time.perf_counter()
+    for score in scores:
+        frame_direct(font, surface, score)
+    direct = (time.perf_counter() - start) / frames
+
+    text = TextCache(font)
+    start = time.perf_counter()
+    for score in scores:
+        frame_cached(text, surface, score)
+    cached = (time.perf_counter() - start) / frames
+
+    stats = text.stats()
+    print(f"FONT.render: {direct * 1e6:8.1f} us/frame")
+    print(f"TextCache:   {cached * 1e6:8.1f} us/frame ({direct / cached:.1f}x)")
+    print(f"cache: {stats['size']} surfaces, hit rate {stats['hit_rate']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+对比逐格 fill 与从砖块图集批量 blits 绘制整个场地的耗时
+需要在项目根目录运行以加载 resources：
+运行：python -m benchmarks.bench_tiles
+"""
+import os
+import random
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from config import *
+from block import draw_grid
+
+
+def fill_grid(surface: pygame.Surface, grid) -> None:
+    """
+    原有做法：每个砖块单独 fill 一次
+    """
+    for y, row in enumerate(grid):
+        for x, value in enumerate(row):
+            if value:
+                surface.fill(colors_for_bricks[value - 1], (x * BRICK_WIDTH, y * BRICK_HEIGHT, BRICK_WIDTH, BRICK_HEIGHT))
+
+
+def make_grid(density: float, seed: int = 0):
+    rng = random.Random(seed)
+    return [[rng.randint(1, len(colors_for_bricks)) if rng.random() < density else 0 for _ in range(FIELD_WIDTH)]
+            for _ in range(FIELD_HEIGHT)]
+
+
+def main(number: int = 2000) -> None:
+    print(f"{'density':<10}{'fill (us)':>12}{'blits (us)':>12}{'speed-up':>10}")
+    for density in (0.25, 0.5, 0.75, 1.0):
+        grid = make_grid(density)
+        fill_time = min(timeit.repeat(lambda: fill_grid(SCREEN, grid), number=number, repeat=3)) / number
+        blits_time = min(timeit.repeat(lambda: draw_grid(SCREEN, grid, range(FIELD_WIDTH), range(FIELD_HEIGHT)),
+                                       number=number, repeat=3)) / number
+        print(f"{density:<10.2f}{fill_time * 1e6:>12.1f}{blits_time * 1e6:>12.1f}{fill_time / blits_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
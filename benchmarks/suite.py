@@ -0,0 +1,292 @@
+"""
+基准测试套件：在 SDL 的 dummy 视频 / 音频驱动下无界面运行，覆盖引擎、技能、绘制和排行榜读写的热点路径，
+结果写入 JSON 文件，并可与之前保存的基线比较，任何一项的中位数变慢超过阈值时以非零状态退出。
+需要在项目根目录运行以加载 resources：
+
+    python -m benchmarks.suite --output baseline.json
+    （修改引擎后）
+    python -m benchmarks.suite --output current.json --baseline baseline.json --threshold 0.1
+
+--filter 只运行名称包含给定子串的项目，--min-time 为每轮的最短计时（秒），--repeat 为轮数
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from benchmarks.bench_stress import nearly_full_cells
+from board import BOARD_BACKENDS, is_valid_position
+from config import *
+from engine import ACTIONS, Piece, TetrisEngine
+from leaderboard_db import LEADERBOARDS
+from renderer import RENDERERS
+from skills import SKILLS
+from utils import Button, Skill
+
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_REPEAT = 5
+
+# 每个项目是一个函数：执行 n 次被测操作，返回这 n 次操作本身的耗时（秒），准备工作不计入
+Case = Callable[[int], float]
+
+
+def random_positions(seed: int = 0, count: int = 1000) -> List[Tuple[int, int, Tuple[int, int]]]:
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(count):
+        kind = rng.randrange(len(BLOCK_LAYOUTS))
+        positions.append((kind, rng.randrange(len(BLOCK_LAYOUTS[kind])),
+                          (rng.randrange(-1, FIELD_WIDTH), rng.randrange(-1, FIELD_HEIGHT))))
+    return positions
+
+
+def filled_board(backend: str, seed: int = 0):
+    board = BOARD_BACKENDS[backend]()
+    board.lock([cell for cell in nearly_full_cells(seed) if cell[1] >= FIELD_HEIGHT // 2], 1)
+    return board
+
+
+def is_valid_case(backend: str) -> Case:
+    board = filled_board(backend)
+    positions = random_positions()
+
+    def run(n: int) -> float:
+        is_valid = board.is_valid
+        start = time.perf_counter()
+        for i in range(n):
+            kind, direction, position = positions[i % len(positions)]
+            is_valid(kind, direction, position)
+        return time.perf_counter() - start
+    return run
+
+
+def is_valid_position_case() -> Case:
+    grid = filled_board("list").grid
+    positions = [(BLOCK_LAYOUTS[kind][direction], position) for kind, direction, position in random_positions()]
+
+    def run(n: int) -> float:
+        start = time.perf_counter()
+        for i in range(n):
+            layout, position = positions[i % len(positions)]
+            is_valid_position(layout, position, grid)
+        return time.perf_counter() - start
+    return run
+
+
+def move_case(action: str) -> Case:
+    """
+    在半满的场地上从出生位置附近执行一个动作，每次执行前把方块放回原处
+    """
+    engine = TetrisEngine(seed=0)
+    engine.board = filled_board("bitboard")
+    piece = Piece(2, 0, (4, 2))
+    engine.cur_piece = piece
+    handler = getattr(engine, action)
+
+    def run(n: int) -> float:
+        elapsed = 0.0
+        for _ in range(n):
+            piece.direction, piece.position = 0, (4, 2)
+            start = time.perf_counter()
+            handler()
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run
+
+
+def eliminate_case(backend: str, lines: int) -> Case:
+    """
+    底部 lines 行为满行、其上几乎填满的场地上消行
+    """
+    rng = random.Random(lines)
+    cells = []
+    for y in range(2, FIELD_HEIGHT):
+        hole = None if y >= FIELD_HEIGHT - lines else rng.randrange(FIELD_WIDTH)
+        cells.extend((x, y) for x in range(FIELD_WIDTH) if x != hole)
+    board = BOARD_BACKENDS[backend]()
+
+    def run(n: int) -> float:
+        elapsed = 0.0
+        for _ in range(n):
+            board.reset()
+            board.lock(cells, 1)
+            start = time.perf_counter()
+            board.eliminate_lines()
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run
+
+
+def skill_case(backend: str, skill: str) -> Case:
+    engine = TetrisEngine(seed=0, backend=backend)
+    cells = nearly_full_cells(0)
+
+    def run(n: int) -> float:
+        elapsed = 0.0
+        for _ in range(n):
+            engine.board.reset()
+            engine.board.lock(cells, 1)
+            start = time.perf_counter()
+            engine.apply_skill(skill)
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run
+
+
+def render_case(name: str) -> Case:
+    """
+    用随机按键推进一局，计时一帧的完整绘制（包括 flip / display.update）
+    """
+    rng = random.Random(0)
+    engine = TetrisEngine(seed=0)
+    buttons = (Button((BRICK_WIDTH * (FIELD_WIDTH + 1), SCREEN.get_height() // 2 + 75, 100, 37.5), "重新开始", None),
+               Button((BRICK_WIDTH * (FIELD_WIDTH + 1), SCREEN.get_height() // 2 + 150, 100, 37.5), "退出", None))
+    renderer = RENDERERS[name](buttons, Skill(engine))
+    clock = [0]
+
+    def run(n: int) -> float:
+        elapsed = 0.0
+        for _ in range(n):
+            if rng.random() < 0.1:
+                engine.apply(rng.choice(ACTIONS))
+            clock[0] += 1000 // 60
+            engine.update(clock[0])
+            if engine.game_over:
+                engine.reset()
+            start = time.perf_counter()
+            renderer.draw(engine)
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run
+
+
+def leaderboard_case(name: str, directory: str) -> Case:
+    """
+    写入一个分数再读取前 10 名。分数逐次递增，每个分数都排在第一名，
+    因此 json 排行榜每次都真正写入文件，而不是在前 10 名填满后直接返回
+    """
+    extension = "db" if name == "sqlite" else "txt"
+    board = LEADERBOARDS[name](os.path.join(directory, f"leaderboard-{name}.{extension}"))
+    score = 0
+
+    def run(n: int) -> float:
+        nonlocal score
+        start = time.perf_counter()
+        for _ in range(n):
+            score += 1
+            board.add_score(score, "普通")
+            board.load_leaderboard()
+        return time.perf_counter() - start
+    return run
+
+
+def cases(directory: str) -> Dict[str, Callable[[], Case]]:
+    """
+    项目名称到构造函数的映射，构造函数只在项目被选中时调用
+    """
+    result: Dict[str, Callable[[], Case]] = {}
+    for backend in BOARD_BACKENDS:
+        result[f"board.is_valid/{backend}"] = lambda b=backend: is_valid_case(b)
+    result["board.is_valid_position"] = is_valid_position_case
+    for action in ("left", "right", "rotate", "down"):
+        result[f"engine.{action}"] = lambda a=action: move_case(a)
+    for backend in BOARD_BACKENDS:
+        for lines in range(1, 5):
+            result[f"eliminate_lines/{backend}/{lines}"] = lambda b=backend, k=lines: eliminate_case(b, k)
+    for backend in BOARD_BACKENDS:
+        for skill in SKILLS:
+            result[f"apply_skill/{backend}/{skill}"] = lambda b=backend, s=skill: skill_case(b, s)
+    for name in RENDERERS:
+        result[f"render/{name}"] = lambda r=name: render_case(r)
+    for name in LEADERBOARDS:
+        result[f"leaderboard/{name}"] = lambda l=name: leaderboard_case(l, directory)
+    return result
+
+
+def measure(case: Case, min_time: float, repeat: int) -> Dict[str, float]:
+    """
+    先把每轮的次数加倍到耗时不少于 min_time，再计时 repeat 轮，返回每次操作的中位数和最小值（微秒）
+    """
+    n = 1
+    while case(n) < min_time:
+        n *= 2
+    per_op = [case(n) / n * 1e6 for _ in range(repeat)]
+    return {"median_us": statistics.median(per_op), "min_us": min(per_op), "ops": n}
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """
+    打印与基线的对比，返回中位数变慢超过 threshold 的项目名称
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<40}{result['median_us']:>12.2f} us  （基线中没有）")
+            continue
+        ratio = result["median_us"] / base["median_us"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  变慢"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = "  变快"
+        print(f"{name:<40}{base['median_us']:>12.2f} -> {result['median_us']:>10.2f} us  {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="引擎、技能、绘制和排行榜读写的基准测试套件")
+    parser.add_argument("--output", help="结果写入的 JSON 文件")
+    parser.add_argument("--baseline", help="与之比较的基线 JSON 文件")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="中位数变慢超过这个比例视为退化（默认 0.1，即 10%%）")
+    parser.add_argument("--filter", default="", help="只运行名称包含该子串的项目")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    results: Dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, factory in cases(directory).items():
+            if args.filter not in name:
+                continue
+            results[name] = measure(factory(), args.min_time, args.repeat)
+            if not args.baseline:
+                print(f"{name:<40}{results[name]['median_us']:>12.2f} us")
+
+    if args.output:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "pygame": pygame.version.ver,
+                "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} 项变慢超过 {args.threshold:.0%}：{', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
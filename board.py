@@ -0,0 +1,375 @@
+"""
+场地网格的两种存储后端，接口一致，由 engine.TetrisEngine 按名称选择：
+  - ListBoard：原有的二维列表网格
+  - BitBoard：每行用一个整数位掩码表示，碰撞检测和满行判断都是位运算
+两种后端都维护 grid（0 为空，其余为方块种类编号 + 1），供界面层按颜色绘制。
+场地尺寸在创建时指定（默认为 FIELD_WIDTH × FIELD_HEIGHT），可以是 256×4096 这样的大场地：
+满行检查只看自上次消行以来改动过的行，消行只移动最高砖块到最低满行之间的行，
+技能后的下落只处理记录在案的有空洞的列、从最低的空洞往上压缩，耗时都与改动的行数而不是场地面积成正比
+"""
+from bisect import bisect_right
+from itertools import compress
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from constants import *
+
+# 类型别名
+Position = Tuple[int, int]
+Layout = Tuple[Position, ...]
+Grid = List[List[int]]
+Rows = Tuple[int, ...]
+Size = Tuple[int, int]
+
+# 标准尺寸场地的满行掩码（ai 使用），其他尺寸的场地使用各自的 full_row
+FULL_ROW = (1 << FIELD_WIDTH) - 1
+
+
+def is_valid_position(layout: Layout, pos: Position, grid: Grid) -> bool:
+    """
+    检查 layout 在指定 pos 位置是否有效：不超出场地边界且没有碰撞（场地尺寸取自 grid）
+    """
+    offset_x, offset_y = pos
+    height, width = len(grid), len(grid[0])
+    for x, y in layout:
+        new_x, new_y = x + offset_x, y + offset_y
+        if new_x < 0 or new_y < 0 or new_x >= width or new_y >= height:
+            return False
+        if grid[new_y][new_x] != 0:
+            return False
+    return True
+
+
+class PieceMask:
+    """
+    某个方块在某个旋转方向下的预计算位掩码
+    x_lo..x_hi、y_lo..y_hi 为方块不越界时位置的取值范围，
+    placed[x - x_lo] 为方块放在第 x 列时每行的 (dy, 行掩码)
+    bottoms 为方块底部轮廓：每个占用列的 (dx, 该列最低砖块的 dy)
+    """
+    __slots__ = ("x_lo", "x_hi", "y_lo", "y_hi", "placed", "bottoms")
+
+    def __init__(self, layout: Layout, width: int = FIELD_WIDTH, height: int = FIELD_HEIGHT) -> None:
+        self.x_lo = -min(x for x, _ in layout)
+        self.x_hi = width - 1 - max(x for x, _ in layout)
+        self.y_lo = -min(y for _, y in layout)
+        self.y_hi = height - 1 - max(y for _, y in layout)
+        masks: Dict[int, int] = {}
+        for x, y in layout:
+            masks[y] = masks.get(y, 0) | (1 << x)
+        rows = sorted(masks.items())
+        self.placed: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+            tuple((dy, mask << x if x >= 0 else mask >> -x) for dy, mask in rows)
+            for x in range(self.x_lo, self.x_hi + 1)
+        )
+        bottoms: Dict[int, int] = {}
+        for x, y in layout:
+            bottoms[x] = max(bottoms.get(x, y), y)
+        self.bottoms: Tuple[Tuple[int, int], ...] = tuple(sorted(bottoms.items()))
+
+
+PieceMasks = Tuple[Tuple[PieceMask, ...], ...]
+
+_piece_masks: Dict[Size, PieceMasks] = {}
+
+
+def piece_masks(width: int, height: int) -> PieceMasks:
+    """
+    某个尺寸场地的 masks[kind][direction]，与 BLOCK_LAYOUTS 一一对应；同一尺寸只计算一次
+    """
+    masks = _piece_masks.get((width, height))
+    if masks is None:
+        masks = _piece_masks[(width, height)] = tuple(
+            tuple(PieceMask(layout, width, height) for layout in layouts) for layouts in BLOCK_LAYOUTS)
+    return masks
+
+
+# 标准尺寸场地的方块掩码
+PIECE_MASKS = piece_masks(FIELD_WIDTH, FIELD_HEIGHT)
+
+
+class ListBoard:
+    """
+    二维列表网格，逐格检查边界与碰撞
+    heights[x] 为第 x 列的高度（最高砖块到底部的格数），在锁定、消行和技能效果后增量维护；
+    touched 为包含自上次消行以来所有被改动过的行的连续范围，只有这些行可能成为满行；
+    holes[x] 为第 x 列下落时需要从这一行开始往上压缩的位置：不高于该列最低的空洞（上方有砖块的空格），
+    且其下方全是砖块；没有空洞的列不在其中
+    """
+    def __init__(self, width: int = FIELD_WIDTH, height: int = FIELD_HEIGHT) -> None:
+        self.width = width
+        self.height = height
+        self.masks = piece_masks(width, height)
+        self.full_row = (1 << width) - 1
+        self.row_bits = tuple(1 << x for x in range(width))
+        self.reset()
+
+    def reset(self) -> None:
+        self.grid: Grid = [[0] * self.width for _ in range(self.height)]
+        self.heights: List[int] = [0] * self.width
+        self.touched = range(0)
+        self.holes: Dict[int, int] = {}
+
+    @property
+    def top(self) -> int:
+        """
+        最高砖块所在的行号，场地为空时等于 height；其上的行全部为空
+        """
+        return self.height - max(self.heights)
+
+    def is_valid(self, kind: int, direction: int, pos: Position) -> bool:
+        return is_valid_position(BLOCK_LAYOUTS[kind][direction], pos, self.grid)
+
+    def drop_position(self, kind: int, direction: int, pos: Position) -> Position:
+        """
+        返回方块从合法位置 pos 直接落下后的位置。
+        方块位于各列最高砖块之上时，落点只取决于列高和方块底部轮廓；
+        方块钻到悬空砖块下方时列高不再适用，退回逐行检查
+        """
+        x, y = pos
+        heights = self.heights
+        land_y = self.height
+        for dx, bottom in self.masks[kind][direction].bottoms:
+            top = self.height - heights[x + dx]
+            if y + bottom >= top:
+                while self.is_valid(kind, direction, (x, y + 1)):
+                    y += 1
+                return x, y
+            land_y = min(land_y, top - 1 - bottom)
+        return x, land_y
+
+    def lock(self, cells: Iterable[Position], value: int) -> None:
+        """
+        写入方块的格子，并记录格子下方新出现的空洞
+        """
+        grid, heights, height, holes = self.grid, self.heights, self.height, self.holes
+        cells = list(cells)
+        for x, y in cells:
+            grid[y][x] = value
+        if cells:
+            self.touch(range(min(y for _, y in cells), max(y for _, y in cells) + 1))
+        for x, y in cells:
+            below = y + 1
+            if below >= height or grid[below][x]:
+                continue
+            # 格子下方是空的：在原来的最高砖块之上时，这一列最低的空洞只能是原来最高砖块的上一格，
+            # 除非那一格也是刚写入的；否则往下找到这段空隙的最低处
+            top = height - heights[x]
+            hole = top - 1
+            if below > hole or grid[hole][x]:
+                hole = below
+                while hole + 1 < height and not grid[hole + 1][x]:
+                    hole += 1
+            if hole > holes.get(x, -1):
+                holes[x] = hole
+        for x, y in cells:
+            if height - y > heights[x]:
+                heights[x] = height - y
+
+    def touch(self, rows: range) -> None:
+        """
+        把 rows 并入 touched（取两者的外接范围）
+        """
+        touched = self.touched
+        if touched and rows:
+            rows = range(min(touched.start, rows.start), max(touched.stop, rows.stop))
+        if rows:
+            self.touched = rows
+
+    def refresh_heights(self) -> None:
+        """
+        砖块只会变少或下移时（例如清除格子之后），从原来的最高处往下找到新的最高砖块即可
+        """
+        grid = self.grid
+        heights = self.heights
+        height = self.height
+        for x in range(self.width):
+            y = height - heights[x]
+            while y < height and grid[y][x] == 0:
+                y += 1
+            heights[x] = height - y
+
+    def full_rows(self) -> Rows:
+        """
+        按行号升序返回已满的行。只检查 touched 中的行，与场地高度无关
+        """
+        grid = self.grid
+        return tuple(y for y in self.touched if 0 not in grid[y])
+
+    def eliminate_lines(self, rows: Optional[Rows] = None) -> int:
+        """
+        消除满行（rows 为 full_rows 的结果，省略时在这里查找）。
+        只有最高砖块所在行到最低满行之间的行需要下移，其下的行和其上的空行原样保留
+        """
+        if rows is None:
+            rows = self.full_rows()
+        self.touched = range(0)
+        if not rows:
+            return 0
+        eliminated, first, last = len(rows), rows[0], rows[-1]
+        self.shift_rows(self.top, rows)
+        holes = self.holes
+        for x, y in holes.items():
+            # 最低满行以下的空洞不动，其上的空洞随其下方被消除的行数下移
+            if y <= last:
+                holes[x] = y + eliminated if y < first else y + eliminated - bisect_right(rows, y)
+        # 满行在每一列都有砖块，最高砖块在第一个满行之上的列恰好降低 eliminated 格；
+        # 最高砖块就在第一个满行中的列从 first + eliminated 往下找新的最高砖块
+        grid, heights, height = self.grid, self.heights, self.height
+        limit = height - first
+        for x in range(self.width):
+            if heights[x] > limit:
+                heights[x] -= eliminated
+            else:
+                y = first + eliminated
+                while y < height and grid[y][x] == 0:
+                    y += 1
+                heights[x] = height - y
+        return eliminated
+
+    def shift_rows(self, top: int, rows: Rows) -> None:
+        """
+        删除满行 rows（升序），在 top 处补上同样数量的空行，只有 top 到最低满行之间的行移动
+        """
+        grid = self.grid
+        for y in reversed(rows):  # 自下而上删除，删除不影响尚未删除的行号
+            del grid[y]
+        grid[top:top] = [[0] * self.width for _ in rows]
+
+    def filled_cells(self) -> List[Position]:
+        """
+        按行优先的顺序返回全部砖块的坐标，从最高砖块所在的行开始扫描
+        """
+        grid = self.grid
+        return [(x, y) for y in range(self.top, self.height) for x, value in enumerate(grid[y]) if value]
+
+    def clear_cells(self, cells: Iterable[Position]) -> int:
+        """
+        清空若干格子（超出场地的坐标会被忽略），被清空的砖块记为空洞，返回实际清除的砖块数
+        """
+        grid, holes = self.grid, self.holes
+        width, height = self.width, self.height
+        removed = 0
+        for x, y in cells:
+            if 0 <= x < width and 0 <= y < height and grid[y][x]:
+                grid[y][x] = 0
+                removed += 1
+                if y > holes.get(x, -1):
+                    holes[x] = y
+        self.refresh_heights()
+        return removed
+
+    def remove_cells(self, cells: Iterable[Position]) -> int:
+        """
+        技能效果：清空若干格子，然后让悬空的砖块落下，返回实际清除的砖块数
+        """
+        removed = self.clear_cells(cells)
+        self.settle()
+        return removed
+
+    def settle(self) -> range:
+        """
+        技能效果之后让悬空的砖块落下，结果与逐列把砖块按原有顺序压到底部相同。
+        只有 holes 中的列需要处理，且只需压缩最低空洞及其以上的部分，耗时与这些列中被扫描的格子数成正比。
+        返回砖块可能发生变化的行，这些行并入 touched
+        """
+        grid = self.grid
+        heights = self.heights
+        height = self.height
+        columns, self.holes = self.holes, {}
+        first, last = height, -1
+        for x, start in columns.items():
+            top = height - heights[x]
+            y = start
+            for src in range(start, top - 1, -1):
+                value = grid[src][x]
+                if value:
+                    if src != y:
+                        grid[y][x] = value
+                        grid[src][x] = 0
+                    y -= 1
+            if y == start:
+                # 这一格以上已经没有砖块，列高由下方最高的砖块决定
+                y += 1
+                while y < height and grid[y][x] == 0:
+                    y += 1
+                heights[x] = height - y
+            else:
+                heights[x] = height - 1 - y
+            first, last = min(first, top), max(last, start)
+        changed = range(first, last + 1)
+        self.touch(changed)
+        return changed
+
+
+class BitBoard(ListBoard):
+    """
+    位掩码网格：rows[y] 的第 x 位表示 (x, y) 是否被占用
+    碰撞检测只需对方块所在的几行做与运算，满行判断只需与 full_row 比较
+    """
+    def reset(self) -> None:
+        super().reset()
+        self.rows: List[int] = [0] * self.height
+
+    def is_valid(self, kind: int, direction: int, pos: Position) -> bool:
+        mask = self.masks[kind][direction]
+        x, y = pos
+        if not (mask.x_lo <= x <= mask.x_hi and mask.y_lo <= y <= mask.y_hi):
+            return False
+        rows = self.rows
+        for dy, row_mask in mask.placed[x - mask.x_lo]:
+            if rows[y + dy] & row_mask:
+                return False
+        return True
+
+    def lock(self, cells: Iterable[Position], value: int) -> None:
+        cells = list(cells)
+        super().lock(cells, value)
+        rows = self.rows
+        for x, y in cells:
+            rows[y] |= 1 << x
+
+    def full_rows(self) -> Rows:
+        rows, full_row = self.rows, self.full_row
+        return tuple(y for y in self.touched if rows[y] == full_row)
+
+    def shift_rows(self, top: int, rows: Rows) -> None:
+        super().shift_rows(top, rows)
+        masks = self.rows
+        for y in reversed(rows):
+            del masks[y]
+        masks[top:top] = [0] * len(rows)
+
+    def clear_cells(self, cells: Iterable[Position]) -> int:
+        cells = list(cells)
+        removed = super().clear_cells(cells)
+        self.sync_rows({y for _, y in cells if 0 <= y < self.height})
+        return removed
+
+    def settle(self) -> range:
+        changed = super().settle()
+        self.sync_rows(changed)
+        return changed
+
+    def sync_rows(self, ys: Iterable[int]) -> None:
+        """
+        根据 grid 重建这些行的位掩码
+        """
+        rows, grid, row_bits = self.rows, self.grid, self.row_bits
+        for y in ys:
+            rows[y] = sum(compress(row_bits, grid[y]))
+
+
+def board_rows(board: ListBoard) -> Rows:
+    """
+    以每行位掩码的元组表示场地，元组本身即可作为置换表的键
+    """
+    rows = getattr(board, "rows", None)
+    if rows is None:
+        rows = [sum(compress(board.row_bits, row)) for row in board.grid]
+    return tuple(rows)
+
+
+BOARD_BACKENDS = {
+    "list": ListBoard,
+    "bitboard": BitBoard,
+}
@@ -0,0 +1,82 @@
+"""
+不依赖 pygame 的游戏规则常量，供无界面的模拟核心和界面层共同使用
+"""
+
+# 游戏场地参数
+FIELD_WIDTH, FIELD_HEIGHT = 10, 16
+
+CUR_BLOCK_INIT_POSITION = (4, 0)
+
+
+def spawn_position(width: int) -> tuple:
+    """
+    宽度为 width 的场地上方块的出生位置，标准宽度时即 CUR_BLOCK_INIT_POSITION
+    """
+    return width // 2 - 1, 0
+
+
+SCORE_PER_LINE = {1: 100, 2: 200, 3: 400, 4: 600}
+
+SKILL_ENERGY_PER_LINE = 20
+MAX_ENERGY = 60
+
+SkillType = {
+    "EXPLOSION": "爆裂冲击",
+    "TIME_SLOW": "时空凝滞",
+    "CLEAR_LINE": "雷霆扫荡",
+    "COLUMN_WIPE": "纵贯长虹",
+    "MULTI_ROW": "排山倒海",
+    "SCATTER": "星落如雨"
+}
+
+
+# 各种方块的布局数据（此处保持原有数据不变）
+bricks_layout_0 = (
+    ((0, 0), (0, 1), (0, 2), (0, 3)),
+    ((0, 1), (1, 1), (2, 1), (3, 1))
+)
+bricks_layout_1 = (
+    ((1, 0), (2, 0), (1, 1), (2, 1)),
+)
+bricks_layout_2 = (
+    ((1, 0), (0, 1), (1, 1), (2, 1)),
+    ((0, 1), (1, 0), (1, 1), (1, 2)),
+    ((1, 2), (0, 1), (1, 1), (2, 1)),
+    ((2, 1), (1, 0), (1, 1), (1, 2)),
+)
+bricks_layout_3 = (
+    ((0, 1), (1, 1), (1, 0), (2, 0)),
+    ((0, 0), (0, 1), (1, 1), (1, 2)),
+)
+bricks_layout_4 = (
+    ((0, 0), (1, 0), (1, 1), (2, 1)),
+    ((1, 0), (1, 1), (0, 1), (0, 2)),
+)
+bricks_layout_5 = (
+    ((0, 0), (1, 0), (1, 1), (1, 2)),
+    ((0, 2), (0, 1), (1, 1), (2, 1)),
+    ((1, 0), (1, 1), (1, 2), (2, 2)),
+    ((2, 0), (2, 1), (1, 1), (0, 1)),
+)
+bricks_layout_6 = (
+    ((2, 0), (1, 0), (1, 1), (1, 2)),
+    ((0, 0), (0, 1), (1, 1), (2, 1)),
+    ((0, 2), (1, 2), (1, 1), (1, 0)),
+    ((2, 2), (2, 1), (1, 1), (0, 1)),
+)
+
+# 按方块种类编号排列的布局，编号与 config.BLOCK_TYPES / colors_for_bricks 一一对应
+BLOCK_LAYOUTS = (
+    bricks_layout_0,
+    bricks_layout_1,
+    bricks_layout_2,
+    bricks_layout_3,
+    bricks_layout_4,
+    bricks_layout_5,
+    bricks_layout_6,
+)
+
+
+def get_move_interval(difficulty: str) -> int:
+    mapping = {"简单": 800, "普通": 500, "困难": 300}
+    return mapping.get(difficulty, 500)
@@ -0,0 +1,112 @@
+"""
+键盘输入：按键在轮询时记录时间戳，在下一个逻辑帧开头执行；按住左右键时按 DAS / ARR 自动重复：
+  - DAS（delayed auto shift）：按下后等待 das 毫秒开始自动重复
+  - ARR（auto repeat rate）：之后每 arr 毫秒重复一次；一个逻辑帧内到期的多次重复在这一帧内全部执行，
+    arr 为 0 时一帧内直接移动到不能再移动为止
+同时按住左右两个方向时以后按下的为准，松开后回到仍按住的另一个方向并重新计算 DAS。
+另外统计从轮询到按键效果显示在屏幕上的延迟，用于分析输入延迟
+"""
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from constants import FIELD_WIDTH
+
+DEFAULT_DAS = 167
+DEFAULT_ARR = 33
+
+# 可以按住自动重复的动作。"down" 直接落到落点，重复没有意义
+REPEAT_ACTIONS = ("left", "right")
+
+# 保留最近的延迟样本数
+MAX_SAMPLES = 10000
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Controls:
+    """
+    按键状态与自动重复。press / release 在轮询到按键时调用（now 为当前逻辑时钟，毫秒），
+    actions 在每个逻辑帧开头调用，返回这一帧要执行的动作
+    """
+    def __init__(self, das: int = DEFAULT_DAS, arr: int = DEFAULT_ARR,
+                 repeat_actions: Sequence[str] = REPEAT_ACTIONS) -> None:
+        self.das = das
+        self.arr = arr
+        self.repeat_actions = tuple(repeat_actions)
+        self.latencies: List[float] = []
+        self.reset()
+
+    def reset(self) -> None:
+        # 待执行的 (动作, 轮询时间戳)，重复产生的动作时间戳为 None，不计入延迟
+        self.queued: List[Tuple[str, Optional[float]]] = []
+        self.held: List[str] = []
+        self.next_repeat = 0
+        # 已经执行、尚未显示的按键的轮询时间戳
+        self.unpresented: List[float] = []
+
+    def press(self, action: str, now: int, polled: Optional[float] = None) -> None:
+        self.queued.append((action, time.perf_counter() if polled is None else polled))
+        if action in self.repeat_actions:
+            if action in self.held:
+                self.held.remove(action)
+            self.held.append(action)
+            self.next_repeat = now + self.das
+
+    def release(self, action: str, now: int) -> None:
+        if action not in self.held:
+            return
+        active = self.held[-1] == action
+        self.held.remove(action)
+        if active and self.held:
+            self.next_repeat = now + self.das
+
+    def actions(self, now: int) -> List[Tuple[str, Optional[float]]]:
+        """
+        返回逻辑时钟推进到 now 时要执行的 (动作, 轮询时间戳)：先是新按下的键，再是到期的自动重复
+        """
+        result = self.queued
+        self.queued = []
+        if self.held and now >= self.next_repeat:
+            action = self.held[-1]
+            if self.arr <= 0:
+                result.extend((action, None) for _ in range(FIELD_WIDTH))
+                self.next_repeat = now + 1
+            else:
+                repeats = (now - self.next_repeat) // self.arr + 1
+                result.extend((action, None) for _ in range(min(repeats, FIELD_WIDTH)))
+                self.next_repeat += repeats * self.arr
+        return result
+
+    def applied(self, polled: Optional[float]) -> None:
+        """
+        按键对应的动作已在引擎中执行
+        """
+        if polled is not None:
+            self.unpresented.append(polled)
+
+    def presented(self, now: Optional[float] = None) -> None:
+        """
+        画面已提交：记录此前执行的按键从轮询到显示的延迟（毫秒）
+        """
+        if not self.unpresented:
+            return
+        now = time.perf_counter() if now is None else now
+        self.latencies.extend((now - polled) * 1000 for polled in self.unpresented)
+        self.unpresented = []
+        if len(self.latencies) > MAX_SAMPLES:
+            del self.latencies[:-MAX_SAMPLES]
+
+    def latency_stats(self) -> Dict[str, float]:
+        samples = self.latencies
+        if not samples:
+            return {"samples": 0}
+        return {
+            "samples": len(samples),
+            "p50": percentile(samples, 0.5),
+            "p95": percentile(samples, 0.95),
+            "p99": percentile(samples, 0.99),
+            "max": max(samples),
+        }
@@ -0,0 +1,291 @@
+"""
+无界面的俄罗斯方块模拟核心：场地网格、当前方块、下落、消行、计分和技能能量都在这里，
+不依赖 pygame，可以在无显示环境下大量运行对局
+"""
+import random
+import time
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from board import BOARD_BACKENDS, Grid, Layout, Position
+from constants import *
+from generators import GENERATORS
+from skills import SKILL_DURATION, SKILLS, SkillTiming
+
+# 引擎可执行的动作，与 KEY_ACTIONS 的取值一致
+ACTIONS = ("left", "right", "rotate", "down", "activate_skill")
+
+# 旋转时依次尝试的“踢墙”偏移
+ROTATE_OFFSETS = ((0, 0), (-1, 0), (1, 0), (0, -1))
+
+
+class Piece:
+    """
+    方块的纯数据表示：种类编号（对应 BLOCK_LAYOUTS）、旋转方向和位置
+    """
+    __slots__ = ("kind", "direction", "position")
+
+    def __init__(self, kind: int, direction: int, position: Position = CUR_BLOCK_INIT_POSITION) -> None:
+        self.kind = kind
+        self.direction = direction
+        self.position = position
+
+    @property
+    def layouts(self) -> Tuple[Layout, ...]:
+        return BLOCK_LAYOUTS[self.kind]
+
+    @property
+    def layout(self) -> Layout:
+        return BLOCK_LAYOUTS[self.kind][self.direction]
+
+    def cells(self) -> List[Position]:
+        """
+        返回方块各砖块在网格中的坐标
+        """
+        px, py = self.position
+        return [(px + x, py + y) for x, y in self.layout]
+
+
+class StepResult(NamedTuple):
+    """
+    一次推进的结果：是否锁定了方块、消除行数、本次得分、对局是否结束以及被消除的行号（消除前的行号）
+    """
+    locked: bool = False
+    lines: int = 0
+    reward: int = 0
+    done: bool = False
+    rows: Tuple[int, ...] = ()
+
+
+class TetrisEngine:
+    """
+    俄罗斯方块规则引擎。网格中 0 表示空，其余值为方块种类编号 + 1，便于界面层按颜色绘制
+    backend 选择场地存储方式，取值见 board.BOARD_BACKENDS；width / height 为场地尺寸，
+    界面只支持默认尺寸，其他尺寸用于无界面的压力测试和变体玩法；
+    generator 为方块生成器，取值见 generators.GENERATORS；preview 为预览队列中的方块数（至少 1）
+    """
+    def __init__(self, difficulty: str = "普通", seed: Optional[int] = None, backend: str = "bitboard",
+                 width: int = FIELD_WIDTH, height: int = FIELD_HEIGHT,
+                 generator: str = "uniform", preview: int = 1) -> None:
+        self.rng = random.Random(seed)
+        self.board = BOARD_BACKENDS[backend](width, height)
+        self.spawn_position = spawn_position(width)
+        self.generator_name = generator
+        self.generator = GENERATORS[generator](self.rng)
+        self.preview_size = max(preview, 1)
+        # 预览队列，preview[0] 为下一个方块
+        self.preview: Deque[Piece] = deque()
+        # 已经锁定、可以重复使用的方块对象
+        self.pool: List[Piece] = []
+        self.cur_piece: Optional[Piece] = None
+        self.difficulty = difficulty
+        self.move_interval = get_move_interval(difficulty)
+        # 技能名称到累计耗时的映射，跨对局累计
+        self.skill_timings: Dict[str, SkillTiming] = {}
+        self.reset()
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """
+        重置为一局新游戏，传入 seed 时同时重置随机数
+        """
+        if seed is not None:
+            self.rng.seed(seed)
+        self.board.reset()
+        self.score = 0
+        self.lines = 0
+        self.pieces = 0
+        self.energy = 0
+        self.clock = 0
+        self.last_move = 0
+        self.game_over = False
+        self.reset_skill()
+        self.generator.reset()
+        if self.cur_piece is not None:
+            self.pool.append(self.cur_piece)
+        self.pool.extend(self.preview)
+        self.preview.clear()
+        for _ in range(self.preview_size):
+            self.preview.append(self.new_piece())
+        self.spawn()
+
+    @property
+    def grid(self) -> Grid:
+        return self.board.grid
+
+    @property
+    def next_piece(self) -> Piece:
+        return self.preview[0]
+
+    def set_difficulty(self, difficulty: str) -> None:
+        self.difficulty = difficulty
+        self.move_interval = get_move_interval(difficulty)
+
+    def new_piece(self) -> Piece:
+        """
+        由生成器决定下一个方块，优先重复使用已经锁定的方块对象
+        """
+        kind, direction = self.generator.next()
+        if not self.pool:
+            return Piece(kind, direction, self.spawn_position)
+        piece = self.pool.pop()
+        piece.kind, piece.direction, piece.position = kind, direction, self.spawn_position
+        return piece
+
+    def spawn(self) -> bool:
+        """
+        把下一个方块放到出生位置，出生位置被占用时游戏结束
+        """
+        self.cur_piece = self.preview.popleft()
+        self.cur_piece.position = self.spawn_position
+        self.preview.append(self.new_piece())
+        self.last_move = 0
+        if not self.board.is_valid(self.cur_piece.kind, self.cur_piece.direction, self.cur_piece.position):
+            self.game_over = True
+        return not self.game_over
+
+    def move(self, dx: int, dy: int) -> bool:
+        piece = self.cur_piece
+        new_position = (piece.position[0] + dx, piece.position[1] + dy)
+        if self.board.is_valid(piece.kind, piece.direction, new_position):
+            piece.position = new_position
+            return True
+        return False
+
+    def left(self) -> bool:
+        return self.move(-1, 0)
+
+    def right(self) -> bool:
+        return self.move(1, 0)
+
+    def down(self) -> bool:
+        """
+        快速下落到不能再下的位置（不立即锁定，锁定仍由下一次下落判定完成）
+        """
+        piece = self.cur_piece
+        landing = self.ghost_position()
+        moved = landing != piece.position
+        piece.position = landing
+        return moved
+
+    def ghost_position(self) -> Position:
+        """
+        当前方块直接落下后的位置，用于快速下落和落点预览
+        """
+        piece = self.cur_piece
+        return self.board.drop_position(piece.kind, piece.direction, piece.position)
+
+    def rotate(self) -> bool:
+        """
+        顺时针旋转方块，并尝试使用简单的“踢墙”机制调整位置
+        """
+        piece = self.cur_piece
+        new_direction = (piece.direction + 1) % len(piece.layouts)
+        for dx, dy in ROTATE_OFFSETS:
+            adjusted_pos = (piece.position[0] + dx, piece.position[1] + dy)
+            if self.board.is_valid(piece.kind, new_direction, adjusted_pos):
+                piece.direction = new_direction
+                piece.position = adjusted_pos
+                return True
+        return False
+
+    def apply(self, action: str) -> bool:
+        """
+        执行一个动作（取值同 KEY_ACTIONS），返回动作是否生效
+        """
+        if self.game_over:
+            return False
+        handler = getattr(self, action, None) if action in ACTIONS else None
+        if handler is None:
+            return False
+        return handler()
+
+    def gravity_interval(self) -> int:
+        if self.active_skill is not None:
+            return self.move_interval * SKILLS[self.active_skill].gravity_factor
+        return self.move_interval
+
+    def update(self, current_time: int) -> StepResult:
+        """
+        根据时间推进：到达下落间隔时下落一格，无法下落则锁定并生成下一个方块
+        """
+        self.clock = current_time
+        self.update_skill(current_time)
+        if self.game_over:
+            return StepResult(done=True)
+        if current_time - self.last_move < self.gravity_interval():
+            return StepResult()
+        if self.move(0, 1):
+            self.last_move = current_time
+            return StepResult()
+        return self.lock()
+
+    def step(self, action: Optional[str] = None) -> StepResult:
+        """
+        无界面模式下推进一步：先执行动作，再把时钟推进一个下落间隔
+        """
+        if action is not None:
+            self.apply(action)
+        return self.update(self.clock + self.move_interval)
+
+    def lock(self) -> StepResult:
+        """
+        把当前方块写入网格，消行、计分并生成下一个方块
+        """
+        piece = self.cur_piece
+        self.board.lock(piece.cells(), piece.kind + 1)
+        self.pieces += 1
+        # 锁定后方块对象交回池中，下面 spawn 补充预览队列时重复使用，调用方不应在锁定后继续持有它
+        self.pool.append(piece)
+
+        # 技能效果后的下落也可能填满方块以外的行，这些行同样在这里消除
+        full_rows = self.board.full_rows()
+        eliminated = self.board.eliminate_lines(full_rows)
+        reward = SCORE_PER_LINE.get(eliminated, 0)
+        self.lines += eliminated
+        self.score += reward
+        self.energy += eliminated * SKILL_ENERGY_PER_LINE
+
+        self.spawn()
+        return StepResult(True, eliminated, reward, self.game_over, full_rows)
+
+    def reset_skill(self) -> None:
+        self.skill_duration = SKILL_DURATION
+        self.skill_start_time = 0
+        self.active_skill = None
+
+    def update_skill(self, current_time: int) -> None:
+        """
+        技能持续时间结束后清除当前技能
+        """
+        if self.active_skill is not None and current_time - self.skill_start_time > self.skill_duration:
+            self.reset_skill()
+
+    def activate_skill(self) -> bool:
+        """
+        能量充满且没有技能生效时，随机释放一个技能
+        """
+        if self.energy < MAX_ENERGY or self.active_skill is not None:
+            return False
+        self.active_skill = self.rng.choice(list(SKILLS))
+        self.energy -= MAX_ENERGY
+        self.apply_skill(self.active_skill)
+        return True
+
+    def apply_skill(self, skill: str) -> None:
+        """
+        按 SKILLS 中的声明执行技能效果：设置持续时间，清除掩码中的格子并让悬空的砖块落下，
+        每个技能的耗时累计在 skill_timings 中
+        """
+        filled = self.board.filled_cells()
+        if not filled:
+            return
+
+        start = time.perf_counter()
+        self.skill_start_time = self.clock
+        target = self.rng.choice(filled)  # 直接作用于选中的砖块，避免随机偏移导致作用无效
+        effect = SKILLS[skill]
+        self.skill_duration = effect.duration
+        removed = 0
+        if effect.mask is not None:
+            removed = self.board.remove_cells(effect.mask(target, filled, self.rng, self.board))
+        self.skill_timings.setdefault(skill, SkillTiming()).record(removed, time.perf_counter() - start)
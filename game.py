@@ -1,253 +1,180 @@
-import time
+import argparse
+import random
+from typing import Callable, Optional
 
+from ai import AutoPlayer
+from animation import ImageAnimation, RowFlash, Scheduler, TextBanner
+from assets import ASSETS
 from config import *
-from block import get_block
-from utils import Leaderboard, Settings, Button, Skill, SkillType
-import random
+from controls import DEFAULT_ARR, DEFAULT_DAS, Controls
+from engine import StepResult, TetrisEngine
+from generators import GENERATORS
+from leaderboard_db import LEADERBOARDS
+from profiler import PROFILER
+from renderer import ENERGY_RECT, MAX_PREVIEW, RENDERERS
+from replay import Playback, Recorder, Recording, load_recording, tick_time
+from scenes import EXIT, SCENES
+from utils import Skill
+
+FIREWORKS_DURATION = 1000
+FLASH_DURATION = 150
 
 
 class TetrisGame:
-    def __init__(self) -> None:
+    def __init__(self, player: Optional[Callable[[TetrisEngine], Optional[str]]] = None,
+                 renderer: str = "dirty", prewarm: bool = False, leaderboard: str = "json",
+                 record_dir: Optional[str] = None, replay: Optional[Recording] = None,
+                 controls: Optional[Controls] = None, generator: str = "uniform", preview: int = 1) -> None:
+        """
+        player 为可选的自动玩家（如 ai.AutoPlayer），每帧调用一次返回要执行的动作，代替键盘输入；
+        renderer 为对局界面的绘制方式，取值见 renderer.RENDERERS；
+        prewarm 为 True 时在后台线程中预先加载全部资源；
+        leaderboard 为排行榜的存储后端，取值见 leaderboard_db.LEADERBOARDS；
+        record_dir 不为空时每局结束后把录像保存到该目录；replay 为要按原速回放的录像，回放时不读取键盘；
+        controls 为键盘输入的自动重复设置（默认见 controls.Controls）；
+        generator 为方块生成器，取值见 generators.GENERATORS；preview 为预览队列长度（信息栏最多显示前 MAX_PREVIEW 个）。
+        回放时难度、生成器和预览队列长度都取自录像
+        """
         pygame.init()
         pygame.display.set_caption("Tetris")
         self.clock = pygame.time.Clock()
-        self.running: bool = True
-        self.score: int = 0
-        self.field_bricks = []
-        self.grid = [[0 for _ in range(FIELD_WIDTH)] for _ in range(FIELD_HEIGHT)]
-        self.next_block = None
         self.last_end = 0  # 记录上一次
-        self.firework_active = False
-        self.leaderboard = Leaderboard()
+        self.animations = Scheduler()
+        self.leaderboard = LEADERBOARDS[leaderboard]()
         self.config = GameConfig()
-        self.skill = Skill(self.config)
-        self.settings = Settings(self.leaderboard, self.config, self.set_difficulty)
-
-    def show_cover(self) -> None:
+        self.record_dir = record_dir
+        self.replay = replay
+        # 回放结束时录像的得分、方块数和场地是否与回放结果一致，显示在结算界面；不是回放时为 None
+        self.replay_verified: Optional[bool] = None
+        if replay is not None:
+            self.config.difficulty = replay.difficulty
+            generator, preview = replay.generator, replay.preview
+        # 对局按逻辑帧推进，引擎时钟只由帧号决定，随机数只来自每局的种子，因此对局可以录像和回放
+        self.tick = 0
+        self.seed = self.new_seed()
+        self.engine = TetrisEngine(self.config.difficulty, self.seed, generator=generator, preview=preview)
+        self.skill = Skill(self.engine)
+        self.player = player
+        self.controls = controls if controls is not None else Controls()
+        self.renderer_name = renderer
+        self.renderer = None
+        self.music_started = False
+        self.scenes = {name: scene(self) for name, scene in SCENES.items()}
+        if prewarm:
+            ASSETS.prewarm()
+
+    def run(self, scene: str = "cover") -> None:
         """
-        显示封面界面，包含开始游戏、排行榜、设置和退出按钮
+        唯一的主循环：逐帧调用当前界面，按其返回值切换界面，直到某个界面返回 EXIT（例如关闭窗口）
         """
-        width, height = 150, 37.5
-        spacing = 15
-        total_height = 4 * height + 3 * spacing
-        y = (SCREEN.get_height() - total_height) // 2 + 50
-        x = SCREEN.get_width() // 2
-
-        buttons = [
-            Button((x - width // 2, y, width, height), "开始游戏", self.start_game),
-            Button((x - width // 2, y + (height + spacing), width, height), "排行榜",
-                   self.leaderboard.show_leaderboard),
-            Button((x - width // 2, y + 2 * (height + spacing), width, height), "设置", self.settings.show_settings),
-            Button((x - width // 2, y + 3 * (height + spacing), width, height), "退出", exit_cover)
-        ]
-
+        current = self.scenes[scene]
+        current.enter()
         while True:
-            SCREEN.fill((0, 0, 0))
-            cover_rect = COVER_IMG.get_rect(center=(SCREEN.get_width() // 2, SCREEN.get_height() // 2))
-            SCREEN.blit(COVER_IMG, cover_rect)
-            for btn in buttons:
-                btn.draw(SCREEN)
-            pygame.display.flip()
-
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    exit_cover()
-                if event.type == MOUSEBUTTONDOWN and event.button == 1:
-                    pos = pygame.mouse.get_pos()
-                    for btn in buttons:
-                        if btn.is_hovered(pos):
-                            btn.callback()
-
-    def start_game(self) -> None:
-        self.game_loop()
+            PROFILER.begin_frame(current.name)
+            next_scene = current.frame()
+            PROFILER.end_frame()
+            if next_scene == EXIT:
+                return
+            if next_scene is not None:
+                current = self.scenes[next_scene]
+                current.enter()
+
+    def show_cover(self) -> None:
+        self.run("cover")
+
+    def game_loop(self) -> None:
+        self.run("game")
 
     def set_difficulty(self, new_diff: str) -> None:
         self.config.difficulty = new_diff
+        self.engine.set_difficulty(new_diff)
 
-    def draw_field(self) -> None:
-        # Draw the grid
-        for x in range(FIELD_WIDTH + 1):  # +1 to draw the boundary lines
-            pygame.draw.line(SCREEN, (50, 50, 50), (x * BRICK_WIDTH, 0), (x * BRICK_WIDTH, FIELD_HEIGHT * BRICK_HEIGHT))
-        for y in range(FIELD_HEIGHT + 1):
-            pygame.draw.line(SCREEN, (50, 50, 50), (0, y * BRICK_HEIGHT), (FIELD_WIDTH * BRICK_WIDTH, y * BRICK_HEIGHT))
-
-        # Draw all the bricks in the field
-        for brick in self.field_bricks:
-            brick.draw(SCREEN)
-
-        # Draw active skill
-        self.skill.draw_skill()
-
-    def draw_info_panel(self) -> None:
-        # 显示得分信息
-        score_text = FONT.render(f'得分: {self.score}', True, (255, 255, 255))
-        SCREEN.blit(score_text, (FIELD_WIDTH * BRICK_WIDTH + 10, 20))
-
-        # 显示下一个方块提示
-        next_text = FONT.render('下一个:', True, (255, 255, 255))
-        SCREEN.blit(next_text, (FIELD_WIDTH * BRICK_WIDTH + 10, 100))
-        if self.next_block:
-            for brick in self.next_block.bricks:
-                brick.draw(SCREEN)
-
-    def eliminate_lines(self) -> int:
-        eliminated = 0
-        y = FIELD_HEIGHT - 1
-        while y >= 0:
-            if 0 not in self.grid[y]:
-                eliminated += 1
-                del self.grid[y]
-                self.grid.insert(0, [0] * FIELD_WIDTH)
-
-                new_field_bricks = []
-                for brick in self.field_bricks:
-                    bx, by = brick.position
-                    if by == y:
-                        continue
-                    elif by < y:
-                        brick.position = (bx, by + 1)
-                    new_field_bricks.append(brick)
-                self.field_bricks = new_field_bricks
-            else:
-                y -= 1
-        return eliminated
+    def new_seed(self) -> int:
+        return self.replay.seed if self.replay is not None else random.getrandbits(32)
 
-    def game_loop(self) -> None:
-        restart = Button(
-            (BRICK_WIDTH * (FIELD_WIDTH + 0.5 * INFO_PANEL_WIDTH) - 50,
-             SCREEN.get_height() // 2 + 2 * 37.5,
-             100, 37.5),
-            "重新开始",
-            self.reset_game_state_and_restart
-        )
-        exit_game = Button(
-            (BRICK_WIDTH * (FIELD_WIDTH + 0.5 * INFO_PANEL_WIDTH) - 50,
-             SCREEN.get_height() // 2 + 4 * 37.5,
-             100, 37.5),
-            "退出",
-            self.show_cover
-        )
-        while self.running:
-            if self.next_block is None:
-                cur_block = get_block(self.config)
-                cur_block.set_position(CUR_BLOCK_INIT_POSITION)
-            else:
-                cur_block = self.next_block
-                cur_block.set_position(CUR_BLOCK_INIT_POSITION)
-            self.next_block = get_block(self.config)
-            self.next_block.set_position(NEXT_BLOCK_INIT_POSITION)
-
-            if not cur_block.is_valid(self.grid):
-                self.running = False
-                break
-
-            while not cur_block.stopped:
-                self.clock.tick(60)
-
-                # 先处理事件，使技能释放立即生效
-                for event in pygame.event.get():
-                    if event.type == QUIT:
-                        exit_cover()
-                    if event.type == KEYDOWN:
-                        if (event.key == K_SPACE and self.skill.energy >= MAX_ENERGY and
-                                self.skill.active_skill is None):
-                            self.skill.active_skill = random.choice(list(SkillType))
-                            self.skill.energy -= MAX_ENERGY
-                            self.skill.activate_skill(self)
-                        else:
-                            action = KEY_ACTIONS.get(event.key)
-                            if action and hasattr(cur_block, action):
-                                getattr(cur_block, action)(self.grid)
-                    if event.type == MOUSEBUTTONDOWN and event.button == 1:
-                        pos = pygame.mouse.get_pos()
-                        if restart.is_hovered(pos):
-                            self.reset_game_state_and_restart()
-                        elif exit_game.is_hovered(pos):
-                            self.reset_game_state()
-                            exit_game.callback()
-
-                # 更新当前砖块状态
-                current_time = pygame.time.get_ticks()
-                cur_block.update(self.grid, current_time, self.skill.active_skill)
-
-                # 绘制界面
-                SCREEN.fill((0, 0, 0))
-                draw_frame()
-                restart.draw(SCREEN)
-                exit_game.draw(SCREEN)
-                self.draw_field()
-                self.draw_info_panel()
-                cur_block.draw(SCREEN)
-                pygame.display.flip()
-
-            for brick in cur_block.bricks:
-                x, y = brick.position
-                self.grid[y][x] = 1
-                self.field_bricks.append(brick)
-
-            eliminated = self.eliminate_lines()
-            if eliminated > 0:
-                DIDA.play()
-            self.skill.energy += eliminated * SKILL_ENERGY_PER_LINE
-            self.score += SCORE_PER_LINE.get(eliminated, 0)
-
-            # 计算
-            current_end = self.score // 500
-            # 结果是否增大
-            if current_end > self.last_end:
-                self.firework_active = True
-                # 更新余数记录
-                self.last_end = current_end
-            # 在绘制部分添加烟火效果
-            if self.firework_active:
-                # 在场地中央偏上显示
-                center_x = FIELD_WIDTH * BRICK_WIDTH // 2
-                cover_rect = FIREWORKS.get_rect(center=(center_x, SCREEN.get_height() // 3))
-                SCREEN.blit(FIREWORKS, cover_rect)
-                pygame.display.flip()
-                time.sleep(1.0)
-                self.firework_active = False
-        self.leaderboard.add_score(self.score)
-        self.game_over_screen(restart, exit_game)
+    def advance(self, recorder: Recorder, playback: Optional[Playback]) -> StepResult:
+        """
+        推进一个逻辑帧：先执行这一帧的动作（按键及其自动重复，回放时取自录像），再推进引擎时钟，并登记随之出现的动画
+        """
+        self.tick += 1
+        engine = self.engine
+        skill = engine.active_skill
+        if playback is not None:
+            for action in playback.actions(self.tick):
+                engine.apply(action)
+        else:
+            for action, polled in self.controls.actions(tick_time(self.tick)):
+                recorder.apply(engine, self.tick, action)
+                self.controls.applied(polled)
+            if self.player is not None:
+                action = self.player(engine)
+                if action:
+                    recorder.apply(engine, self.tick, action)
+        if skill is None and engine.active_skill is not None:
+            # 技能名称显示到技能结束（与 TetrisEngine.update_skill 的判定一致）
+            self.animations.add(TextBanner(engine.skill_start_time, engine.skill_duration + 1,
+                                           SkillType[engine.active_skill], ENERGY_RECT.center))
+
+        # 推进引擎：下落、锁定、消行和计分都在引擎内完成
+        result = engine.update(tick_time(self.tick))
+        if result.locked:
+            if result.lines > 0:
+                ASSETS.sound("dida").play()
+                self.animations.add(RowFlash(tick_time(self.tick), FLASH_DURATION, result.rows))
+            self.show_fireworks()
+        return result
+
+    def show_fireworks(self) -> None:
+        """
+        得分每跨过一个 500 分的里程碑，在场地中央偏上显示烟花，动画期间游戏照常进行
+        """
+        current_end = self.engine.score // 500
+        if current_end > self.last_end:
+            self.last_end = current_end
+            center = (FIELD_WIDTH * BRICK_WIDTH // 2, SCREEN.get_height() // 3)
+            self.animations.add(ImageAnimation(tick_time(self.tick), FIREWORKS_DURATION,
+                                               ASSETS.image("fireworks"), center))
 
     def reset_game_state(self) -> None:
         self.last_end = 0
-        self.firework_active = False
-        self.score = 0
-        self.field_bricks = []
-        self.grid = [[0 for _ in range(FIELD_WIDTH)] for _ in range(FIELD_HEIGHT)]
-        self.next_block = None
-        self.running = True
-        self.skill.energy = 0
-        self.skill.reset_skill()
-
-    def game_over_screen(self, restart: Button, exit_game: Button) -> None:
-        while True:
-            SCREEN.fill((0, 0, 0))
-            SCREEN.blit(GAME_OVER_IMG, (FIELD_WIDTH / 2 * BRICK_WIDTH, (FIELD_HEIGHT / 2 - 2) * BRICK_HEIGHT))
-            score_text = FONT.render(f'得分: {self.score}', True, (255, 255, 255))
-            SCREEN.blit(score_text, (FIELD_WIDTH * BRICK_WIDTH + 10, 20))
-            restart.draw(SCREEN)
-            exit_game.draw(SCREEN)
-            pygame.display.flip()
-
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    exit_cover()
-                if event.type == MOUSEBUTTONDOWN and event.button == 1:
-                    pos = pygame.mouse.get_pos()
-                    if restart.is_hovered(pos):
-                        self.reset_game_state_and_restart()
-                    elif exit_game.is_hovered(pos):
-                        self.reset_game_state()
-                        exit_game.callback()
-
-    def reset_game_state_and_restart(self) -> None:
+        self.animations.clear()
+        self.controls.reset()
+        self.tick = 0
+        self.seed = self.new_seed()
+        self.engine.reset(self.seed)
+
+    def restart_game(self) -> str:
+        self.reset_game_state()
+        return "game"
+
+    def leave_game(self) -> str:
         self.reset_game_state()
-        self.game_loop()
+        return "cover"
 
 
 if __name__ == "__main__":
-    game = TetrisGame()
-    game.show_cover()
+    parser = argparse.ArgumentParser(description="Tetris")
+    parser.add_argument("--autoplay", action="store_true", help="由自动玩家代替键盘操作")
+    parser.add_argument("--renderer", default="dirty", choices=sorted(RENDERERS),
+                        help="dirty 只重画变化区域，full 每帧全屏重画")
+    parser.add_argument("--prewarm", action="store_true", help="在后台线程中预先加载全部资源")
+    parser.add_argument("--leaderboard", default="json", choices=sorted(LEADERBOARDS),
+                        help="json 只保存前 10 名，sqlite 保存全部成绩并按页查询")
+    parser.add_argument("--record", metavar="DIR", help="每局结束后把录像保存到该目录")
+    parser.add_argument("--replay", metavar="FILE", help="按原速回放录像")
+    parser.add_argument("--das", type=int, default=DEFAULT_DAS, help="按住左右键后开始自动重复的延迟（毫秒）")
+    parser.add_argument("--arr", type=int, default=DEFAULT_ARR, help="自动重复的间隔（毫秒），0 为直接移到底")
+    parser.add_argument("--generator", default="uniform", choices=sorted(GENERATORS),
+                        help="uniform 每次独立随机，bag 为 7-bag，history 避免与最近的方块重复")
+    parser.add_argument("--preview", type=int, default=1, choices=range(1, MAX_PREVIEW + 1),
+                        help="预览队列中的方块数，第一个按原尺寸显示，其后的按 1/4 尺寸排成一行")
+    parser.add_argument("--profile", action="store_true", help="统计每帧各阶段耗时，对局中按 F3 显示")
+    parser.add_argument("--profile-csv", metavar="FILE", help="统计每帧各阶段耗时，退出时导出为 CSV")
+    args = parser.parse_args()
+    if args.profile or args.profile_csv:
+        PROFILER.enable(args.profile_csv)
+    game = TetrisGame(AutoPlayer() if args.autoplay else None, args.renderer, args.prewarm, args.leaderboard,
+                      args.record, load_recording(args.replay) if args.replay else None,
+                      Controls(args.das, args.arr), args.generator, args.preview)
+    game.run()
     exit_cover()
@@ -0,0 +1,78 @@
+"""
+方块生成器：决定下一个方块的种类和初始方向，由 engine.TetrisEngine 按名称选择。
+  - UniformGenerator：每次独立均匀抽取（原有做法，默认）
+  - BagGenerator：7-bag，每 7 个方块为一袋，袋中 7 种方块各一个、顺序随机
+  - HistoryGenerator：记住最近的几个方块，抽到其中的种类时重新抽取，最多重抽若干次
+生成器只使用引擎传入的随机数生成器，同一种子得到同一序列，录像和回放不受影响
+"""
+import random
+from collections import deque
+from typing import Deque, Dict, List, Tuple, Type
+
+from constants import *
+
+# 历史生成器记住的方块数和最多重抽的次数
+HISTORY_SIZE = 4
+HISTORY_ROLLS = 4
+
+
+class UniformGenerator:
+    """
+    每次均匀地抽取种类，再均匀地抽取方向
+    """
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        新的一局开始时清空生成器的状态（不重置随机数）
+        """
+
+    def next_kind(self) -> int:
+        return self.rng.randrange(len(BLOCK_LAYOUTS))
+
+    def next(self) -> Tuple[int, int]:
+        """
+        返回下一个方块的 (种类, 方向)
+        """
+        kind = self.next_kind()
+        return kind, self.rng.randint(0, len(BLOCK_LAYOUTS[kind]) - 1)
+
+
+class BagGenerator(UniformGenerator):
+    """
+    7-bag：袋子空了就装入全部种类并打乱，依次取出；任意两个相同方块之间最多隔 12 个方块
+    """
+    def reset(self) -> None:
+        self.bag: List[int] = []
+
+    def next_kind(self) -> int:
+        if not self.bag:
+            self.bag = list(range(len(BLOCK_LAYOUTS)))
+            self.rng.shuffle(self.bag)
+        return self.bag.pop()
+
+
+class HistoryGenerator(UniformGenerator):
+    """
+    抽到最近 HISTORY_SIZE 个方块中出现过的种类时重抽，最多重抽 HISTORY_ROLLS 次，减少连续重复
+    """
+    def reset(self) -> None:
+        self.history: Deque[int] = deque(maxlen=HISTORY_SIZE)
+
+    def next_kind(self) -> int:
+        kind = super().next_kind()
+        for _ in range(HISTORY_ROLLS):
+            if kind not in self.history:
+                break
+            kind = super().next_kind()
+        self.history.append(kind)
+        return kind
+
+
+GENERATORS: Dict[str, Type[UniformGenerator]] = {
+    "uniform": UniformGenerator,
+    "bag": BagGenerator,
+    "history": HistoryGenerator,
+}
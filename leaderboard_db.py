@@ -0,0 +1,115 @@
+"""
+排行榜的 SQLite 后端：所有成绩保存在一张带索引的表中，不再只保留前 10 名。
+  - 按分数、(难度, 分数) 和时间建立索引，前 N 名、按难度筛选和按时间段查询都只读取需要的行
+  - 批量写入在一个事务中完成
+  - 排行榜界面按页读取（见 scenes.LeaderboardScene），每次翻页只查询一页
+与 JSON 文件后端（utils.Leaderboard）接口一致，由 TetrisGame 按名称选择
+"""
+import os
+import sqlite3
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from utils import Leaderboard
+
+DEFAULT_DIFFICULTY = "普通"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    difficulty TEXT NOT NULL,
+    time TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_score ON scores (score DESC, id);
+CREATE INDEX IF NOT EXISTS scores_difficulty_score ON scores (difficulty, score DESC, id);
+CREATE INDEX IF NOT EXISTS scores_time ON scores (time);
+"""
+
+# 同分时先记录的排在前面，与 JSON 后端一致
+ORDER = "ORDER BY score DESC, id"
+
+Row = Tuple[int, str, str]
+
+
+def now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class SqliteLeaderboard(Leaderboard):
+    """
+    基于 sqlite3 的排行榜。查询结果与 JSON 后端相同，为 {"score", "difficulty", "time"} 字典的列表
+    """
+    def __init__(self, file_path: str = "resources/leaderboard.db") -> None:
+        self.file_path = file_path
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(file_path)
+        # WAL 模式下提交只追加日志，读写互不阻塞
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def query(self, sql: str, parameters: Tuple = ()) -> List[dict]:
+        return [{"score": score, "difficulty": difficulty, "time": time}
+                for score, difficulty, time in self.connection.execute(sql, parameters)]
+
+    def add_score(self, score: int, difficulty: Optional[str] = None) -> None:
+        self.add_scores([(score, difficulty or DEFAULT_DIFFICULTY, now())])
+
+    def add_scores(self, rows: Iterable[Row]) -> None:
+        """
+        在一个事务中批量写入 (分数, 难度, 时间) 记录
+        """
+        with self.connection:
+            self.connection.executemany("INSERT INTO scores (score, difficulty, time) VALUES (?, ?, ?)", rows)
+
+    def top(self, limit: int = Leaderboard.MAX_ENTRIES, offset: int = 0,
+            difficulty: Optional[str] = None) -> List[dict]:
+        """
+        按分数从高到低返回第 offset 条起的至多 limit 条记录，可只看某一难度
+        """
+        if difficulty is None:
+            return self.query(f"SELECT score, difficulty, time FROM scores {ORDER} LIMIT ? OFFSET ?",
+                              (limit, offset))
+        return self.query(f"SELECT score, difficulty, time FROM scores WHERE difficulty = ? {ORDER} LIMIT ? OFFSET ?",
+                          (difficulty, limit, offset))
+
+    def between(self, start: str, end: str, limit: int = Leaderboard.MAX_ENTRIES, offset: int = 0) -> List[dict]:
+        """
+        时间在 [start, end) 内的记录，按时间先后排列；时间格式与记录相同（"%Y-%m-%d %H:%M:%S"，可只写日期）
+        """
+        return self.query("SELECT score, difficulty, time FROM scores WHERE time >= ? AND time < ? "
+                          "ORDER BY time, id LIMIT ? OFFSET ?", (start, end, limit, offset))
+
+    def count(self, difficulty: Optional[str] = None) -> int:
+        if difficulty is None:
+            return self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+        return self.connection.execute("SELECT COUNT(*) FROM scores WHERE difficulty = ?", (difficulty,)).fetchone()[0]
+
+    def page(self, offset: int, limit: int) -> List[dict]:
+        return self.top(limit, offset)
+
+    def load_leaderboard(self) -> List[dict]:
+        return self.top()
+
+    def save_leaderboard(self, leader_board: List[dict]) -> None:
+        """
+        用 leader_board 替换全部记录（设置界面的“清除排行榜”传入空列表）
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM scores")
+            self.connection.executemany(
+                "INSERT INTO scores (score, difficulty, time) VALUES (?, ?, ?)",
+                [(entry["score"], entry.get("difficulty", DEFAULT_DIFFICULTY), entry["time"])
+                 for entry in leader_board])
+
+
+LEADERBOARDS = {
+    "json": Leaderboard,
+    "sqlite": SqliteLeaderboard,
+}
@@ -0,0 +1,124 @@
+"""
+走法生成：从方块当前位置出发，按 TetrisEngine 的真实规则（左右移动、带踢墙的旋转、快速下落和重力下落）
+搜索 (方向, x, y) 状态，得到方块能到达的所有锁定位置以及到达每个位置的最短按键序列。
+结果按 (场地, 方块种类, 方向, 位置) 缓存，机器人或提示层重复查询同一局面时不再搜索
+"""
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from board import board_rows
+from cache import LRUCache
+from constants import *
+from engine import ROTATE_OFFSETS, Piece
+
+# 序列中的 WAIT 表示不按键，等待一次重力下落；方块无法继续下落时这一次等待使其锁定
+WAIT = None
+
+State = Tuple[int, int, int]
+Sequence = List[Optional[str]]
+
+DEFAULT_CACHE_SIZE = 10000
+
+
+def successors(board, kind: int, state: State) -> List[Tuple[str, State]]:
+    """
+    一次按键可以到达的状态，规则与 TetrisEngine 的 left/right/rotate/down 一致
+    """
+    direction, x, y = state
+    result = []
+    if board.is_valid(kind, direction, (x - 1, y)):
+        result.append(("left", (direction, x - 1, y)))
+    if board.is_valid(kind, direction, (x + 1, y)):
+        result.append(("right", (direction, x + 1, y)))
+    new_direction = (direction + 1) % len(BLOCK_LAYOUTS[kind])
+    for dx, dy in ROTATE_OFFSETS:
+        if board.is_valid(kind, new_direction, (x + dx, y + dy)):
+            rotated = (new_direction, x + dx, y + dy)
+            if rotated != state:
+                result.append(("rotate", rotated))
+            break
+    land_x, land_y = board.drop_position(kind, direction, (x, y))
+    if land_y != y:
+        result.append(("down", (direction, land_x, land_y)))
+    return result
+
+
+def search(board, kind: int, direction: int, position: Tuple[int, int]) -> Dict[State, Sequence]:
+    """
+    以 (序列长度, 等待数) 为代价做最短路搜索，返回 {锁定状态: 按键序列}。
+    两次重力下落之间可以按任意多次键，与界面层每帧都能输入、下落间隔远大于一帧的情形一致
+    """
+    start = (direction, position[0], position[1])
+    if not board.is_valid(kind, direction, position):
+        return {}
+    best = {start: (0, 0)}
+    parent: Dict[State, Tuple[Optional[State], Optional[str]]] = {start: (None, None)}
+    heap = [(0, 0, start)]
+    locks = []
+    while heap:
+        length, waits, state = heapq.heappop(heap)
+        if best[state] < (length, waits):
+            continue
+        d, x, y = state
+        candidates = [(action, nxt, waits) for action, nxt in successors(board, kind, state)]
+        if board.is_valid(kind, d, (x, y + 1)):
+            candidates.append((WAIT, (d, x, y + 1), waits + 1))
+        else:
+            locks.append(state)
+        for action, nxt, next_waits in candidates:
+            cost = (length + 1, next_waits)
+            if nxt not in best or cost < best[nxt]:
+                best[nxt] = cost
+                parent[nxt] = (state, action)
+                heapq.heappush(heap, (length + 1, next_waits, nxt))
+
+    result = {}
+    for state in locks:
+        sequence: Sequence = [WAIT]
+        node = state
+        while True:
+            prev, action = parent[node]
+            if prev is None:
+                break
+            sequence.append(action)
+            node = prev
+        sequence.reverse()
+        result[state] = sequence
+    return result
+
+
+def trace(board, kind: int, start: State,
+          sequence: Sequence) -> List[Tuple[Optional[str], State, Optional[State]]]:
+    """
+    把按键序列展开为 (动作, 动作前状态, 动作后状态)，最后一次等待使方块锁定，其动作后状态为 None
+    """
+    steps = []
+    state = start
+    for action in sequence:
+        if action is WAIT:
+            direction, x, y = state
+            after = (direction, x, y + 1) if board.is_valid(kind, direction, (x, y + 1)) else None
+        else:
+            after = dict(successors(board, kind, state))[action]
+        steps.append((action, state, after))
+        state = after
+    return steps
+
+
+class MoveGenerator:
+    """
+    带缓存的走法生成器
+    """
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self.cache = LRUCache(cache_size)
+
+    def reachable(self, board, piece: Piece) -> Dict[State, Sequence]:
+        """
+        返回方块从当前位置能到达的所有锁定状态 (方向, x, y) 及其最短按键序列，结果只读
+        """
+        key = (board_rows(board), piece.kind, piece.direction, piece.position)
+        result = self.cache.get(key)
+        if result is None:
+            result = search(board, piece.kind, piece.direction, piece.position)
+            self.cache.put(key, result)
+        return result
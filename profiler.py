@@ -0,0 +1,154 @@
+"""
+按阶段统计每帧耗时的性能分析器（默认关闭）。主循环和菜单循环在每帧开头调用 begin_frame，
+每个阶段结束时调用 mark(阶段名)，距上一次 mark 的时间计入该阶段，帧结束时调用 end_frame。
+关闭时这些调用只检查一个标志就返回。
+开启后：
+  - 每个 (界面, 阶段) 保留最近 WINDOW 帧的耗时，用于 p50 / p95 / p99 和耗时分布直方图
+  - 按 HUD_KEY 在对局界面左上角显示各阶段的分位数
+  - 给出 CSV 路径时（python game.py --profile-csv frames.csv）每帧的样本保存在内存中，在退出时导出
+"""
+import atexit
+import bisect
+import csv
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from config import *
+from text import TextCache
+
+WINDOW = 300
+HUD_KEY = K_F3
+# HUD 每隔这么多帧刷新一次数字，便于阅读
+HUD_INTERVAL = 15
+HUD_POSITION = (4, 4)
+HUD_LINE_HEIGHT = 22
+
+# 直方图的桶上界（毫秒），最后一个桶收集更长的耗时
+HISTOGRAM_BOUNDS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33)
+
+Sample = Tuple[int, str, Dict[str, float]]
+
+
+def percentiles(values: Sequence[float], qs: Sequence[float]) -> List[float]:
+    ordered = sorted(values)
+    if not ordered:
+        return [0.0] * len(qs)
+    return [ordered[min(len(ordered) - 1, int(q * len(ordered)))] for q in qs]
+
+
+class FrameProfiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.hud = False
+        self.csv_path: Optional[str] = None
+        self.frame = 0
+        self.scene = ""
+        self.current: Optional[Dict[str, float]] = None
+        self.last = 0.0
+        self.windows: Dict[Tuple[str, str], Deque[float]] = {}
+        self.phases: List[str] = []
+        self.samples: List[Sample] = []
+        self.hud_text = TextCache(max_size=256)
+        self.hud_surface: Optional[pygame.Surface] = None
+
+    def enable(self, csv_path: Optional[str] = None) -> None:
+        """
+        开启统计；给出 csv_path 时在进程退出时导出全部样本
+        """
+        self.enabled = True
+        if csv_path is not None and self.csv_path is None:
+            atexit.register(self.export_on_exit)
+        self.csv_path = csv_path
+
+    def toggle_hud(self) -> None:
+        self.hud = self.enabled and not self.hud
+        self.hud_surface = None
+
+    def begin_frame(self, scene: str) -> None:
+        """
+        开始新的一帧。上一帧未调用 end_frame 时直接丢弃
+        """
+        if not self.enabled:
+            return
+        self.scene = scene
+        self.current = {}
+        self.last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """
+        把距上一次 mark（或 begin_frame）的时间计入 phase，同一帧内多次计入同一阶段时累加
+        """
+        if not self.enabled or self.current is None:
+            return
+        now = time.perf_counter()
+        self.current[phase] = self.current.get(phase, 0.0) + (now - self.last) * 1000
+        self.last = now
+
+    def end_frame(self) -> None:
+        if not self.enabled or self.current is None:
+            return
+        frame, self.current = self.current, None
+        frame["total"] = sum(frame.values())
+        for phase, elapsed in frame.items():
+            key = (self.scene, phase)
+            window = self.windows.get(key)
+            if window is None:
+                window = self.windows[key] = deque(maxlen=WINDOW)
+                if phase not in self.phases:
+                    self.phases.append(phase)
+            window.append(elapsed)
+        if self.csv_path is not None:
+            # 只有需要导出时才保留全部样本，否则长时间运行时内存会不断增长
+            self.samples.append((self.frame, self.scene, frame))
+        self.frame += 1
+
+    def stats(self, scene: str = "game") -> Dict[str, Tuple[float, float, float]]:
+        """
+        最近 WINDOW 帧中各阶段的 (p50, p95, p99)，单位毫秒
+        """
+        return {phase: tuple(percentiles(self.windows[(scene, phase)], (0.5, 0.95, 0.99)))
+                for phase in self.phases if (scene, phase) in self.windows}
+
+    def histogram(self, scene: str, phase: str) -> List[int]:
+        """
+        最近 WINDOW 帧中该阶段耗时落在各个桶（见 HISTOGRAM_BOUNDS）中的帧数
+        """
+        counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        for elapsed in self.windows.get((scene, phase), ()):
+            counts[bisect.bisect_left(HISTOGRAM_BOUNDS, elapsed)] += 1
+        return counts
+
+    def draw_hud(self, surface: pygame.Surface, scene: str = "game") -> Optional[pygame.Rect]:
+        """
+        在左上角绘制各阶段的分位数，返回绘制区域（HUD 关闭时返回 None）
+        """
+        if not self.hud:
+            return None
+        if self.hud_surface is None or self.frame % HUD_INTERVAL == 0:
+            lines = ["阶段 p50/p95/p99 ms"] + [f"{phase} {p50:.2f}/{p95:.2f}/{p99:.2f}"
+                                              for phase, (p50, p95, p99) in self.stats(scene).items()]
+            rendered = [self.hud_text.render(line) for line in lines]
+            self.hud_surface = pygame.Surface((max(r.get_width() for r in rendered) + 8,
+                                               len(rendered) * HUD_LINE_HEIGHT + 4))
+            for i, line in enumerate(rendered):
+                self.hud_surface.blit(line, (4, 2 + i * HUD_LINE_HEIGHT))
+        return surface.blit(self.hud_surface, HUD_POSITION)
+
+    def export_csv(self, path: str) -> None:
+        """
+        每帧一行：帧号、界面、各阶段耗时（毫秒，未经过的阶段为空）
+        """
+        phases = list(self.phases)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "scene"] + phases)
+            for frame, scene, values in self.samples:
+                writer.writerow([frame, scene] + [f"{values[p]:.4f}" if p in values else "" for p in phases])
+
+    def export_on_exit(self) -> None:
+        if self.csv_path is not None and self.samples:
+            self.export_csv(self.csv_path)
+
+
+PROFILER = FrameProfiler()
@@ -0,0 +1,248 @@
+"""
+对局界面的绘制：
+  - FullRenderer：原有做法，每帧清屏后重画网格线、边框、按钮、全部砖块和信息栏，再 flip 整个屏幕
+  - DirtyRenderer：网格线、边框、按钮和静态文字预先画到缓存的背景层上，
+    每帧只比较与上一帧的差异，恢复变化区域的背景、在裁剪区域内重画，并用 display.update(rects) 只提交这些区域
+两者画出的像素完全一致，由 TetrisGame 按名称选择。
+烟花、技能名称等限时动画由 animation.Scheduler 管理，在所有图层之后绘制。
+预览队列的第一个方块按原尺寸画在“下一个”标签下方，其后的方块按 1/4 尺寸排成一行，界面最多显示 MAX_PREVIEW 个。
+各图层的耗时按场地、信息栏、能量槽等阶段计入 profiler.PROFILER（默认关闭）
+"""
+from itertools import islice, zip_longest
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from animation import Scheduler
+from config import *
+from block import draw_ghost, draw_grid, draw_mini_piece, draw_piece
+from engine import Piece, Position, TetrisEngine
+from profiler import PROFILER
+from text import TEXT
+from utils import Button, Skill
+
+FIELD_RECT = pygame.Rect(0, 0, FIELD_WIDTH * BRICK_WIDTH, FIELD_HEIGHT * BRICK_HEIGHT)
+SCORE_POSITION = (FIELD_WIDTH * BRICK_WIDTH + 10, 20)
+NEXT_LABEL_POSITION = (FIELD_WIDTH * BRICK_WIDTH + 10, 100)
+# 能量槽背景，与 Skill.draw_skill 一致
+ENERGY_RECT = pygame.Rect(FIELD_WIDTH * BRICK_WIDTH - 80, 10, 60, 20)
+# “下一个”预览区域：覆盖所有方块所有方向的外接矩形
+NEXT_RECT = pygame.Rect(
+    NEXT_BLOCK_INIT_POSITION[0] * BRICK_WIDTH, NEXT_BLOCK_INIT_POSITION[1] * BRICK_HEIGHT,
+    (max(x for layouts in BLOCK_LAYOUTS for layout in layouts for x, _ in layout) + 1) * BRICK_WIDTH,
+    (max(y for layouts in BLOCK_LAYOUTS for layout in layouts for _, y in layout) + 1) * BRICK_HEIGHT
+)
+# 预览队列中每个方块的区域：第一个为 NEXT_RECT，其后为 1/4 尺寸的小格，
+# 在 NEXT_RECT 与“重新开始”按钮之间排成一行，信息栏中放得下 4 个
+MINI_PREVIEW_SLOTS = 4
+PREVIEW_RECTS = (NEXT_RECT,) + tuple(
+    pygame.Rect(FIELD_WIDTH * BRICK_WIDTH + 10 + index * (NEXT_RECT.width // 4 + 8), NEXT_RECT.bottom + 4,
+                NEXT_RECT.width // 4, NEXT_RECT.height // 4)
+    for index in range(MINI_PREVIEW_SLOTS)
+)
+# 界面最多显示的预览方块数，更长的队列（例如无界面录制的录像）只显示前 MAX_PREVIEW 个
+MAX_PREVIEW = len(PREVIEW_RECTS)
+
+# 单帧变化的格子超过这个数量时（例如消行），合并为一个外接矩形提交
+MAX_DIRTY_RECTS = 32
+
+
+def draw_background(surface: pygame.Surface, buttons: Sequence[Button]) -> None:
+    """
+    绘制对局中不会变化的部分：网格线、边框、按钮和“下一个”标签
+    """
+    surface.fill((0, 0, 0))
+    draw_frame(surface)
+    for button in buttons:
+        button.draw(surface)
+    for x in range(FIELD_WIDTH + 1):  # +1 to draw the boundary lines
+        pygame.draw.line(surface, (50, 50, 50), (x * BRICK_WIDTH, 0), (x * BRICK_WIDTH, FIELD_HEIGHT * BRICK_HEIGHT))
+    for y in range(FIELD_HEIGHT + 1):
+        pygame.draw.line(surface, (50, 50, 50), (0, y * BRICK_HEIGHT), (FIELD_WIDTH * BRICK_WIDTH, y * BRICK_HEIGHT))
+    next_text = TEXT.render('下一个:')
+    surface.blit(next_text, NEXT_LABEL_POSITION)
+
+
+def draw_score(surface: pygame.Surface, score: int) -> pygame.Rect:
+    return TEXT.blit(surface, f'得分: {score}', SCORE_POSITION)
+
+
+def draw_preview(surface: pygame.Surface, preview: Iterable[Piece], rect: Optional[pygame.Rect] = None) -> None:
+    """
+    按 PREVIEW_RECTS 绘制预览队列中的方块，给出 rect 时只画区域与 rect 相交的方块
+    """
+    for index, (piece, area) in enumerate(zip(preview, PREVIEW_RECTS)):
+        if rect is not None and not rect.colliderect(area):
+            continue
+        if index == 0:
+            draw_piece(surface, piece, NEXT_BLOCK_INIT_POSITION)
+        else:
+            draw_mini_piece(surface, piece, area.topleft)
+
+
+class FullRenderer:
+    """
+    每帧全屏重画。animations 为播放中的限时动画，绘制在最上层
+    """
+    def __init__(self, buttons: Sequence[Button], skill: Skill, animations: Optional[Scheduler] = None) -> None:
+        self.buttons = buttons
+        self.skill = skill
+        self.animations = animations if animations is not None else Scheduler()
+
+    def invalidate(self) -> None:
+        """
+        屏幕被其他代码直接修改后调用，下一帧完整重画（全屏重画时无需处理）
+        """
+
+    def damage(self, rect: pygame.Rect) -> None:
+        """
+        rect 区域被其他代码（例如性能 HUD）画过，下一帧重画这一区域（全屏重画时无需处理）
+        """
+
+    def draw(self, engine: TetrisEngine) -> None:
+        draw_background(SCREEN, self.buttons)
+        draw_grid(SCREEN, engine.grid, range(FIELD_WIDTH), range(FIELD_HEIGHT))
+        PROFILER.mark("field")
+        self.skill.draw_skill()
+        PROFILER.mark("skill")
+        draw_score(SCREEN, engine.score)
+        draw_preview(SCREEN, engine.preview)
+        PROFILER.mark("info")
+        draw_ghost(SCREEN, engine.cur_piece, engine.ghost_position())
+        draw_piece(SCREEN, engine.cur_piece)
+        PROFILER.mark("field")
+        self.animations.draw(SCREEN)
+        PROFILER.mark("animations")
+        pygame.display.flip()
+        PROFILER.mark("present")
+
+
+class DirtyRenderer(FullRenderer):
+    """
+    脏矩形绘制。每帧记录每个格子上画了什么（砖块、落点轮廓、当前方块）以及得分、能量槽和预览方块的状态，
+    与上一帧不同的部分才重画。每个脏矩形内按与 FullRenderer 相同的图层顺序、在裁剪区域内重画，
+    因此重叠的元素（例如压在场地右上角砖块上的能量槽）也能正确恢复。
+    动画可能每帧变化，播放中的动画区域每帧都重画，结束后再重画一次以恢复其下方的内容
+    """
+    def __init__(self, buttons: Sequence[Button], skill: Skill, animations: Optional[Scheduler] = None) -> None:
+        super().__init__(buttons, skill, animations)
+        self.background = pygame.Surface(SCREEN.get_size())
+        draw_background(self.background, buttons)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self.cells: Dict[Position, Tuple[int, int, int]] = {}
+        self.score: Optional[int] = None
+        self.score_rect = pygame.Rect(SCORE_POSITION, (0, 0))
+        self.energy: Optional[int] = None
+        self.preview_state: Tuple[Tuple[int, int], ...] = ()
+        self.animation_rects: List[pygame.Rect] = []
+        self.damaged: List[pygame.Rect] = []
+        self.full_redraw = True
+
+    def damage(self, rect: pygame.Rect) -> None:
+        self.damaged.append(pygame.Rect(rect))
+
+    def scene_cells(self, engine: TetrisEngine) -> Dict[Position, Tuple[int, int, int]]:
+        """
+        每个非空格子上画的内容：(砖块值, 落点轮廓的方块种类 + 1, 当前方块的种类 + 1)
+        """
+        cells = {}
+        for y, row in enumerate(engine.grid):
+            for x, value in enumerate(row):
+                if value:
+                    cells[(x, y)] = (value, 0, 0)
+        piece = engine.cur_piece
+        marker = piece.kind + 1
+        gx, gy = engine.ghost_position()
+        for x, y in piece.layout:
+            cell = (gx + x, gy + y)
+            value, _, active = cells.get(cell, (0, 0, 0))
+            cells[cell] = (value, marker, active)
+        for cell in piece.cells():
+            value, ghost, _ = cells.get(cell, (0, 0, 0))
+            cells[cell] = (value, ghost, marker)
+        return cells
+
+    def dirty_rects(self, engine: TetrisEngine) -> List[pygame.Rect]:
+        rects = []
+        cells = self.scene_cells(engine)
+        previous = self.cells
+        for cell in previous.keys() | cells.keys():
+            if previous.get(cell) != cells.get(cell):
+                rects.append(pygame.Rect(cell[0] * BRICK_WIDTH, cell[1] * BRICK_HEIGHT, BRICK_WIDTH, BRICK_HEIGHT))
+        self.cells = cells
+        if len(rects) > MAX_DIRTY_RECTS:
+            rects = [rects[0].unionall(rects)]
+
+        if engine.score != self.score:
+            new_rect = pygame.Rect(SCORE_POSITION, TEXT.size(f'得分: {engine.score}'))
+            rects.append(self.score_rect.union(new_rect))
+            self.score, self.score_rect = engine.score, new_rect
+
+        energy = min(engine.energy, MAX_ENERGY)
+        if energy != self.energy:
+            rects.append(ENERGY_RECT)
+            self.energy = energy
+
+        preview_state = tuple((piece.kind, piece.direction) for piece in islice(engine.preview, MAX_PREVIEW))
+        for index, (old, new) in enumerate(zip_longest(self.preview_state, preview_state)):
+            if old != new:
+                rects.append(PREVIEW_RECTS[index])
+        self.preview_state = preview_state
+
+        animation_rects = self.animations.rects()
+        rects.extend(self.animation_rects)
+        rects.extend(animation_rects)
+        self.animation_rects = animation_rects
+        rects.extend(self.damaged)
+        self.damaged = []
+        return rects
+
+    def redraw(self, engine: TetrisEngine, rect: pygame.Rect) -> None:
+        """
+        恢复 rect 内的背景，并在裁剪区域内按图层顺序重画与 rect 相交的元素
+        """
+        SCREEN.set_clip(rect)
+        SCREEN.blit(self.background, rect, rect)
+        field = rect.clip(FIELD_RECT)
+        if field:
+            draw_grid(SCREEN, engine.grid,
+                      range(field.left // BRICK_WIDTH, (field.right - 1) // BRICK_WIDTH + 1),
+                      range(field.top // BRICK_HEIGHT, (field.bottom - 1) // BRICK_HEIGHT + 1))
+        PROFILER.mark("field")
+        if rect.colliderect(ENERGY_RECT):
+            self.skill.draw_skill()
+            PROFILER.mark("skill")
+        if rect.colliderect(self.score_rect):
+            draw_score(SCREEN, engine.score)
+        draw_preview(SCREEN, engine.preview, rect)
+        PROFILER.mark("info")
+        if field:
+            draw_ghost(SCREEN, engine.cur_piece, engine.ghost_position())
+            draw_piece(SCREEN, engine.cur_piece)
+            PROFILER.mark("field")
+        self.animations.draw(SCREEN, rect)
+        PROFILER.mark("animations")
+        SCREEN.set_clip(None)
+
+    def draw(self, engine: TetrisEngine) -> None:
+        if self.full_redraw:
+            self.dirty_rects(engine)
+            PROFILER.mark("diff")
+            self.redraw(engine, SCREEN.get_rect())
+            pygame.display.flip()
+            PROFILER.mark("present")
+            self.full_redraw = False
+            return
+        rects = self.dirty_rects(engine)
+        PROFILER.mark("diff")
+        for rect in rects:
+            self.redraw(engine, rect)
+        if rects:
+            pygame.display.update(rects)
+            PROFILER.mark("present")
+
+
+RENDERERS = {
+    "full": FullRenderer,
+    "dirty": DirtyRenderer,
+}
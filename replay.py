@@ -0,0 +1,219 @@
+"""
+对局录像与回放。对局按固定的逻辑帧（tick）推进：第 tick 帧先执行这一帧的动作，再把引擎时钟推进到 tick_time(tick)，
+引擎的随机数只来自对局开始时的种子，因此一局可以只记录为
+    种子 + 难度 + [(帧号, 动作), ...]
+并在之后原样重现。回放既可以由 TetrisGame 按原速显示，也可以无界面地以最快速度运行：
+两个动作之间没有下落和技能结束时直接跳到下一个会改变局面的帧，最后校验得分和场地。
+
+用法示例：
+    python game.py --record recordings          # 每局结束后把录像保存到 recordings 目录
+    python game.py --replay recordings/xxx.json # 按原速回放
+    python replay.py recordings/*.json           # 无界面快速回放并校验
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from board import board_rows
+from engine import TetrisEngine
+
+# 每秒的逻辑帧数，与界面层 clock.tick(60) 一致
+TICK_RATE = 60
+
+# 无界面录制时单局最多模拟的帧数
+DEFAULT_MAX_TICKS = 60 * 60 * TICK_RATE
+
+Action = Tuple[int, str]
+
+
+def tick_time(tick: int) -> int:
+    """
+    第 tick 帧的引擎时钟（毫秒）
+    """
+    return tick * 1000 // TICK_RATE
+
+
+def first_tick_at(ms: int) -> int:
+    """
+    引擎时钟不早于 ms 的第一帧
+    """
+    return -(-ms * TICK_RATE // 1000)
+
+
+class Recording(NamedTuple):
+    """
+    一局的录像：种子、难度、按帧号排序的 (帧号, 动作)，以及用于校验的结束帧、得分、方块数和场地（每行位掩码），
+    最后是方块生成器和预览队列长度（之前的录像中没有这两项，按默认值读取）
+    """
+    seed: int
+    difficulty: str
+    actions: List[Action]
+    ticks: int
+    score: int
+    pieces: int
+    rows: List[int]
+    generator: str = "uniform"
+    preview: int = 1
+
+
+def save_recording(recording: Recording, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(recording._asdict(), f, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_recording(path: str) -> Recording:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data["actions"] = [(tick, action) for tick, action in data["actions"]]
+    return Recording(**data)
+
+
+class Recorder:
+    """
+    记录一局中生效的动作（没有生效的动作不改变局面，不必记录）
+    """
+    def __init__(self, seed: int, difficulty: str) -> None:
+        self.seed = seed
+        self.difficulty = difficulty
+        self.actions: List[Action] = []
+
+    def apply(self, engine: TetrisEngine, tick: int, action: str) -> bool:
+        """
+        在第 tick 帧执行动作并记录
+        """
+        applied = engine.apply(action)
+        if applied:
+            self.actions.append((tick, action))
+        return applied
+
+    def finish(self, engine: TetrisEngine, tick: int) -> Recording:
+        return Recording(self.seed, self.difficulty, self.actions, tick,
+                         engine.score, engine.pieces, list(board_rows(engine.board)),
+                         engine.generator_name, engine.preview_size)
+
+    def save(self, engine: TetrisEngine, tick: int, directory: str) -> str:
+        """
+        把录像保存到 directory 下以结束时间命名的文件，返回文件路径
+        """
+        os.makedirs(directory, exist_ok=True)
+        name = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        path = os.path.join(directory, f"{name}-{self.seed}.json")
+        save_recording(self.finish(engine, tick), path)
+        return path
+
+
+class Playback:
+    """
+    按帧号依次取出录像中的动作
+    """
+    def __init__(self, recording: Recording) -> None:
+        self.recording = recording
+        self.index = 0
+
+    def next_tick(self) -> Optional[int]:
+        actions = self.recording.actions
+        return actions[self.index][0] if self.index < len(actions) else None
+
+    def actions(self, tick: int) -> List[str]:
+        """
+        返回第 tick 帧的动作（之前的帧必须已经取过）
+        """
+        actions = self.recording.actions
+        result = []
+        while self.index < len(actions) and actions[self.index][0] == tick:
+            result.append(actions[self.index][1])
+            self.index += 1
+        return result
+
+
+def next_event_tick(engine: TetrisEngine, tick: int) -> int:
+    """
+    tick 之后第一个会改变局面的帧：到达下落间隔或技能结束。两者之间的 update 只推进时钟
+    """
+    event = first_tick_at(engine.last_move + engine.gravity_interval())
+    if engine.active_skill is not None:
+        event = min(event, first_tick_at(engine.skill_start_time + engine.skill_duration + 1))
+    return max(event, tick + 1)
+
+
+def simulate(recording: Recording, backend: str = "bitboard", turbo: bool = True) -> TetrisEngine:
+    """
+    无界面地重新运行录像，返回结束时的引擎。turbo 为 True 时跳过不会改变局面的帧，否则逐帧推进
+    """
+    engine = TetrisEngine(recording.difficulty, recording.seed, backend,
+                          generator=recording.generator, preview=recording.preview)
+    playback = Playback(recording)
+    tick = 0
+    while tick < recording.ticks and not engine.game_over:
+        if turbo:
+            target = min(next_event_tick(engine, tick), recording.ticks)
+            action_tick = playback.next_tick()
+            if action_tick is not None:
+                target = min(target, action_tick)
+            if target == action_tick and target - 1 > tick:
+                # 动作执行时引擎时钟停在上一帧（技能开始时间取自这里），跳过的帧只需补上这一次
+                engine.update(tick_time(target - 1))
+        else:
+            target = tick + 1
+        for action in playback.actions(target):
+            engine.apply(action)
+        engine.update(tick_time(target))
+        tick = target
+    return engine
+
+
+def verify(recording: Recording, engine: TetrisEngine) -> bool:
+    """
+    回放结束时的得分、方块数和场地是否与录像一致
+    """
+    return (engine.score == recording.score and engine.pieces == recording.pieces
+            and list(board_rows(engine.board)) == recording.rows)
+
+
+def record(player: Callable[[TetrisEngine], Optional[str]], seed: int, difficulty: str = "普通",
+           max_ticks: int = DEFAULT_MAX_TICKS, generator: str = "uniform", preview: int = 1) -> Recording:
+    """
+    无界面地由 player（每帧调用一次，取值同 KEY_ACTIONS）进行一局并录像，帧的推进方式与 scenes.GameScene 相同
+    """
+    engine = TetrisEngine(difficulty, seed, generator=generator, preview=preview)
+    recorder = Recorder(seed, difficulty)
+    tick = 0
+    while not engine.game_over and tick < max_ticks:
+        tick += 1
+        action = player(engine)
+        if action:
+            recorder.apply(engine, tick, action)
+        engine.update(tick_time(tick))
+    return recorder.finish(engine, tick)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="无界面快速回放录像并校验得分和场地")
+    parser.add_argument("paths", nargs="+", help="录像文件")
+    parser.add_argument("--backend", default="bitboard", choices=["list", "bitboard"])
+    parser.add_argument("--step", action="store_true", help="逐帧推进，不跳过空闲帧")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    ticks = 0
+    start = time.perf_counter()
+    for path in args.paths:
+        recording = load_recording(path)
+        engine = simulate(recording, args.backend, turbo=not args.step)
+        ticks += recording.ticks
+        if not verify(recording, engine):
+            failed += 1
+            print(f"{path}: 不一致（得分 {engine.score} / {recording.score}，"
+                  f"方块 {engine.pieces} / {recording.pieces}）", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    print(f"{len(args.paths)} 局，{failed} 局不一致，用时 {elapsed:.2f}s"
+          f"（{ticks / TICK_RATE / max(elapsed, 1e-9):.0f} 倍速）", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+"""
+界面状态机：封面、对局、结算、排行榜、设置等界面各是一个 Scene，由 TetrisGame.run 的唯一主循环逐帧调用。
+frame 绘制并处理一帧，返回要切换到的界面名称（留在当前界面时返回 None，返回 EXIT 时主循环结束）。
+切换界面只是换一个对象继续循环，不再由界面互相调用，重新开始多少局调用栈深度都不变，
+上一个界面的局部状态也随之释放。
+对局界面按 60 帧/秒推进和绘制；菜单界面由事件驱动，没有输入时阻塞等待而不是反复重画
+"""
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
+
+from assets import ASSETS
+from config import *
+from profiler import HUD_KEY, PROFILER
+from renderer import RENDERERS
+from replay import TICK_RATE, Playback, Recorder, tick_time, verify
+from text import TEXT
+from utils import Button
+
+if TYPE_CHECKING:
+    from game import TetrisGame
+
+EXIT = "exit"
+
+# 逻辑帧间隔（毫秒）；绘制跟不上时一帧内最多补上的逻辑帧数，再多的积压直接丢弃，避免越追越慢
+TICK_MS = 1000 / TICK_RATE
+MAX_TICKS_PER_FRAME = 5
+
+# 菜单界面没有事件时最长等待的时间（毫秒），醒来后调用 update 检查是否需要重画
+IDLE_TIMEOUT = 250
+# 窗口重新显示、恢复或改变大小时需要重画
+REDRAW_EVENTS = (VIDEOEXPOSE, WINDOWEXPOSED, WINDOWSHOWN, WINDOWRESTORED, WINDOWSIZECHANGED)
+
+DIFFICULTIES = ("简单", "普通", "困难")
+
+
+def menu_buttons(items: List[Tuple[str, object]], y: float, width: int = 150, height: float = 37.5,
+                 spacing: int = 15) -> List[Button]:
+    """
+    在屏幕水平居中、从 y 开始竖排的一列按钮
+    """
+    x = SCREEN.get_width() // 2
+    return [Button((x - width // 2, y + i * (height + spacing), width, height), text, callback)
+            for i, (text, callback) in enumerate(items)]
+
+
+def game_buttons(game: "TetrisGame") -> Tuple[Button, Button]:
+    """
+    对局和结算界面右侧的“重新开始”和“退出”按钮
+    """
+    x = BRICK_WIDTH * (FIELD_WIDTH + 0.5 * INFO_PANEL_WIDTH) - 50
+    restart = Button((x, SCREEN.get_height() // 2 + 2 * 37.5, 100, 37.5), "重新开始", game.restart_game)
+    exit_game = Button((x, SCREEN.get_height() // 2 + 4 * 37.5, 100, 37.5), "退出", game.leave_game)
+    return restart, exit_game
+
+
+class Scene:
+    """
+    一个界面。enter 在每次切换到该界面时调用，frame 每帧调用一次
+    """
+    name = ""
+
+    def __init__(self, game: "TetrisGame") -> None:
+        self.game = game
+
+    def enter(self) -> None:
+        pass
+
+    def frame(self) -> Optional[str]:
+        raise NotImplementedError
+
+
+class MenuScene(Scene):
+    """
+    由背景和一组按钮组成的菜单界面，点击按钮时调用其回调，回调的返回值即要切换到的界面。
+    菜单只在需要时重画（进入界面、点中按钮、窗口重新显示，或 update 返回 True），
+    其余时间阻塞在 pygame.event.wait 上，空闲时几乎不占用 CPU
+    """
+    def __init__(self, game: "TetrisGame") -> None:
+        super().__init__(game)
+        self.buttons: List[Button] = []
+        self.dirty = True
+
+    def enter(self) -> None:
+        self.dirty = True
+
+    def update(self, now: int) -> bool:
+        """
+        每次醒来时调用，有动画的界面在这里推进动画，返回 True 表示需要重画
+        """
+        return False
+
+    def draw(self) -> None:
+        SCREEN.fill((0, 0, 0))
+        for btn in self.buttons:
+            btn.draw(SCREEN)
+
+    def redraw(self) -> None:
+        self.draw()
+        PROFILER.mark("render")
+        pygame.display.flip()
+        PROFILER.mark("present")
+
+    def click(self, pos: Tuple[int, int]) -> Optional[str]:
+        for btn in self.buttons:
+            if btn.is_hovered(pos):
+                self.dirty = True
+                return btn.callback()
+        return None
+
+    def frame(self) -> Optional[str]:
+        if self.update(pygame.time.get_ticks()) or self.dirty:
+            self.dirty = False
+            self.redraw()
+        return self.handle_events()
+
+    def handle_events(self) -> Optional[str]:
+        """
+        等待下一个事件（最长 IDLE_TIMEOUT 毫秒），再处理同时到达的其余事件
+        """
+        first = pygame.event.wait(IDLE_TIMEOUT)
+        PROFILER.mark("wait")
+        next_scene = None
+        for event in [first] + pygame.event.get():
+            if event.type == QUIT:
+                next_scene = EXIT
+            elif event.type in REDRAW_EVENTS:
+                self.dirty = True
+            elif event.type == MOUSEBUTTONDOWN and event.button == 1:
+                next_scene = self.click(event.pos)
+            if next_scene is not None:
+                break
+        PROFILER.mark("events")
+        return next_scene
+
+
+class CoverScene(MenuScene):
+    """
+    封面界面，包含开始游戏、排行榜、设置和退出按钮
+    """
+    name = "cover"
+
+    def __init__(self, game: "TetrisGame") -> None:
+        super().__init__(game)
+        self.buttons = menu_buttons([
+            ("开始游戏", lambda: "game"),
+            ("排行榜", lambda: "leaderboard"),
+            ("设置", lambda: "settings"),
+            ("退出", lambda: EXIT),
+        ], (SCREEN.get_height() - (4 * 37.5 + 3 * 15)) // 2 + 50)
+
+    def draw(self) -> None:
+        SCREEN.fill((0, 0, 0))
+        cover_img = ASSETS.image("cover")
+        SCREEN.blit(cover_img, cover_img.get_rect(center=(SCREEN.get_width() // 2, SCREEN.get_height() // 2)))
+        for btn in self.buttons:
+            btn.draw(SCREEN)
+
+    def redraw(self) -> None:
+        super().redraw()
+        if not self.game.music_started:
+            # 封面第一帧显示之后再加载并播放背景音乐，不推迟首帧
+            self.game.music_started = True
+            self.game.config.start_music()
+
+
+class GameScene(Scene):
+    """
+    对局界面。按经过的真实时间推进整数个逻辑帧（见 TetrisGame.advance），与绘制帧率无关；
+    对局结束时记录成绩（回放时校验录像）并切换到结算界面
+    """
+    name = "game"
+
+    def __init__(self, game: "TetrisGame") -> None:
+        super().__init__(game)
+        self.restart, self.exit_game = game_buttons(game)
+        self.recorder: Optional[Recorder] = None
+        self.playback: Optional[Playback] = None
+        self.lag = 0.0
+        self.last_time = 0
+        # 上一帧性能 HUD 的区域，HUD 直接画在屏幕上，下一帧交给渲染器重画
+        self.hud_rect: Optional[pygame.Rect] = None
+
+    def enter(self) -> None:
+        game = self.game
+        game.renderer = RENDERERS[game.renderer_name]((self.restart, self.exit_game), game.skill, game.animations)
+        self.recorder = Recorder(game.seed, game.engine.difficulty)
+        self.playback = Playback(game.replay) if game.replay is not None else None
+        self.lag = 0.0
+        self.last_time = pygame.time.get_ticks()
+        self.hud_rect = None
+
+    def frame(self) -> Optional[str]:
+        game = self.game
+        game.clock.tick(60)
+        PROFILER.mark("wait")
+        now = pygame.time.get_ticks()
+        self.lag += now - self.last_time
+        self.last_time = now
+
+        # 先处理事件，按键在下一个逻辑帧开头执行，使技能释放立即生效
+        polled = time.perf_counter()
+        for event in pygame.event.get():
+            if event.type == QUIT:
+                return EXIT
+            if event.type in (KEYDOWN, KEYUP) and self.playback is None:
+                action = KEY_ACTIONS.get(event.key)
+                if action and event.type == KEYDOWN:
+                    game.controls.press(action, tick_time(game.tick), polled)
+                elif action:
+                    game.controls.release(action, tick_time(game.tick))
+            if event.type == KEYDOWN and event.key == HUD_KEY and PROFILER.enabled:
+                PROFILER.toggle_hud()
+            if event.type == MOUSEBUTTONDOWN and event.button == 1:
+                for btn in (self.restart, self.exit_game):
+                    if btn.is_hovered(event.pos):
+                        return btn.callback()
+        PROFILER.mark("events")
+
+        # 按经过的真实时间推进整数个逻辑帧，与绘制帧率无关
+        ticks = 0
+        while self.lag >= TICK_MS and ticks < MAX_TICKS_PER_FRAME and not game.engine.game_over:
+            self.lag -= TICK_MS
+            ticks += 1
+            game.advance(self.recorder, self.playback)
+        if self.lag >= TICK_MS:
+            self.lag %= TICK_MS
+        if game.engine.game_over:
+            return self.finish()
+        PROFILER.mark("update")
+
+        self.present()
+        return None
+
+    def present(self) -> None:
+        """
+        绘制界面，开启时在最上层画性能 HUD。HUD 变窄或关闭后，上一帧 HUD 的区域由渲染器恢复
+        """
+        game = self.game
+        game.animations.update(tick_time(game.tick))
+        if self.hud_rect is not None:
+            game.renderer.damage(self.hud_rect)
+        game.renderer.draw(game.engine)
+        game.controls.presented()
+        self.hud_rect = PROFILER.draw_hud(SCREEN)
+        if self.hud_rect is not None:
+            pygame.display.update(self.hud_rect)
+            PROFILER.mark("hud")
+
+    def finish(self) -> str:
+        game = self.game
+        game.replay_verified = verify(game.replay, game.engine) if self.playback is not None else None
+        if self.playback is None:
+            game.leaderboard.add_score(game.engine.score, game.config.difficulty)
+            if game.record_dir is not None:
+                self.recorder.save(game.engine, game.tick, game.record_dir)
+        self.recorder = self.playback = None
+        return "game_over"
+
+
+class GameOverScene(MenuScene):
+    """
+    结算界面：显示本局得分（回放时还显示回放校验结果），可以重新开始或回到封面
+    """
+    name = "game_over"
+
+    def __init__(self, game: "TetrisGame") -> None:
+        super().__init__(game)
+        self.buttons = list(game_buttons(game))
+
+    def draw(self) -> None:
+        SCREEN.fill((0, 0, 0))
+        SCREEN.blit(ASSETS.image("game_over"), (FIELD_WIDTH / 2 * BRICK_WIDTH, (FIELD_HEIGHT / 2 - 2) * BRICK_HEIGHT))
+        TEXT.blit(SCREEN, f'得分: {self.game.engine.score}', (FIELD_WIDTH * BRICK_WIDTH + 10, 20))
+        if self.game.replay_verified is not None:
+            TEXT.blit(SCREEN, "回放校验：" + ("一致" if self.game.replay_verified else "不一致"),
+                      (FIELD_WIDTH * BRICK_WIDTH + 10, 60))
+        for btn in self.buttons:
+            btn.draw(SCREEN)
+
+
+class LeaderboardScene(MenuScene):
+    """
+    排行榜界面。只在进入界面和翻页时读取一页（多取一条用于判断是否还有下一页），之后每帧只绘制
+    """
+    name = "leaderboard"
+
+    def __init__(self, game: "TetrisGame") -> None:
+        super().__init__(game)
+        lb_width, lb_height = 100, 37.5
+        lb_x = 0.5 * BRICK_WIDTH * (FIELD_WIDTH + INFO_PANEL_WIDTH) - 0.5 * lb_width
+        lb_y = SCREEN.get_height() // 2 + 4 * lb_height
+        self.exit_button = Button((lb_x, lb_y, lb_width, lb_height), "退出", lambda: "cover")
+        self.prev_page = Button((lb_x - lb_width - 10, lb_y, lb_width, lb_height), "上一页",
+                                lambda: self.turn(-1))
+        self.next_page = Button((lb_x + lb_width + 10, lb_y, lb_width, lb_height), "下一页",
+                                lambda: self.turn(1))
+        self.offset = 0
+        self.rows: List[dict] = []
+
+    def enter(self) -> None:
+        super().enter()
+        self.offset = 0
+        self.load()
+
+    def load(self) -> None:
+        size = self.game.leaderboard.PAGE_SIZE
+        self.rows = self.game.leaderboard.page(self.offset, size + 1)
+        self.buttons = [self.exit_button]
+        if self.offset > 0:
+            self.buttons.append(self.prev_page)
+        if len(self.rows) > size:
+            self.buttons.append(self.next_page)
+
+    def turn(self, pages: int) -> None:
+        self.offset = max(0, self.offset + pages * self.game.leaderboard.PAGE_SIZE)
+        self.load()
+
+    def draw(self) -> None:
+        super().draw()
+        title_text = TEXT.render("排行榜")
+        SCREEN.blit(title_text, ((SCREEN.get_width() - title_text.get_width()) // 2, 50))
+        for i, entry in enumerate(self.rows[:self.game.leaderboard.PAGE_SIZE]):
+            TEXT.blit(SCREEN, f"{self.offset + i + 1}. 分数: {entry['score']} 时间: {entry['time']}",
+                      (50, 100 + i * 30))
+
+
+class SettingsScene(MenuScene):
+    name = "settings"
+
+    def __init__(self, game: "TetrisGame") -> None:
+        super().__init__(game)
+        self.buttons = menu_buttons([
+            ("玩法教程", lambda: "teaching"),
+            ("清除排行榜", lambda: game.leaderboard.save_leaderboard([])),
+            ("开关音乐", game.config.toggle_music),
+            ("调整难度", lambda: "difficulty"),
+            ("退出", lambda: "cover"),
+        ], (SCREEN.get_height() - (4 * 37.5 + 3 * 15)) // 2 + 50 - (37.5 + 15))
+
+
+class DifficultyScene(MenuScene):
+    """
+    选择难度后回到设置界面
+    """
+    name = "difficulty"
+
+    def __init__(self, game: "TetrisGame") -> None:
+        super().__init__(game)
+        items = [(diff, lambda d=diff: self.choose(d)) for diff in DIFFICULTIES]
+        items.append(("退出", lambda: "settings"))
+        total_height = len(DIFFICULTIES) * 37.5 + (len(DIFFICULTIES) - 1) * 15
+        self.buttons = menu_buttons(items, (SCREEN.get_height() - total_height) // 2 + 50)
+
+    def choose(self, difficulty: str) -> str:
+        self.game.set_difficulty(difficulty)
+        return "settings"
+
+    def draw(self) -> None:
+        super().draw()
+        title = TEXT.render("难度调整")
+        SCREEN.blit(title, ((SCREEN.get_width() - title.get_width()) // 2, 2 * title.get_height()))
+
+
+class TeachingScene(MenuScene):
+    """
+    玩法教程，点击任意位置回到设置界面
+    """
+    name = "teaching"
+
+    def __init__(self, game: "TetrisGame") -> None:
+        super().__init__(game)
+        self.buttons = [Button((BRICK_WIDTH * (FIELD_WIDTH + 0.5 * INFO_PANEL_WIDTH) - 50,
+                                SCREEN.get_height() // 2 + 4 * 37.5, 100, 37.5), "退出", lambda: "settings")]
+
+    def draw(self) -> None:
+        SCREEN.fill((0, 0, 0))
+        teach_img = ASSETS.image("teach")
+        SCREEN.blit(teach_img, teach_img.get_rect(center=(SCREEN.get_width() // 2, SCREEN.get_height() // 2)))
+        for btn in self.buttons:
+            btn.draw(SCREEN)
+
+    def click(self, pos: Tuple[int, int]) -> Optional[str]:
+        return "settings"
+
+
+SCENES: Dict[str, Type[Scene]] = {
+    scene.name: scene
+    for scene in (CoverScene, GameScene, GameOverScene, LeaderboardScene, SettingsScene, DifficultyScene,
+                  TeachingScene)
+}
@@ -0,0 +1,102 @@
+"""
+技能注册表：每个技能声明持续时间、生效期间下落间隔的倍数以及要清除的格子（掩码函数）。
+引擎释放技能时统一清除掩码中的格子，再用一次逐列压缩（board.settle）让悬空的砖块落下，
+新增范围类技能只需注册一个掩码函数，不必各自处理下落
+"""
+import random
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from board import ListBoard, Position
+from constants import *
+
+# 技能名称显示 / 效果持续的毫秒数
+SKILL_DURATION = 1000
+
+# 时间凝滞技能生效时下落间隔的倍数
+TIME_SLOW_FACTOR = 3
+
+# 星落技能随机清除的砖块数
+SCATTER_CELLS = 8
+
+# 掩码函数：接收选中的目标砖块、场地上全部砖块、随机数生成器和场地（用于尺寸和列高），
+# 返回要清除的格子（可以超出场地）
+Mask = Callable[[Position, List[Position], random.Random, ListBoard], Iterable[Position]]
+
+
+class SkillEffect(NamedTuple):
+    mask: Optional[Mask] = None
+    duration: int = SKILL_DURATION
+    gravity_factor: int = 1
+
+
+def explosion(target: Position, filled: List[Position], rng: random.Random,
+              board: ListBoard) -> Iterable[Position]:
+    """
+    清除目标周围 3x3 范围
+    """
+    x, y = target
+    return [(x + dx, y + dy) for dx in range(-1, 2) for dy in range(-1, 2)]
+
+
+def clear_line(target: Position, filled: List[Position], rng: random.Random,
+               board: ListBoard) -> Iterable[Position]:
+    """
+    清除目标所在的整行
+    """
+    return [(x, target[1]) for x in range(board.width)]
+
+
+def column_wipe(target: Position, filled: List[Position], rng: random.Random,
+                board: ListBoard) -> Iterable[Position]:
+    """
+    清除目标所在的整列（该列最高砖块以上都是空格，不必列出）
+    """
+    x = target[0]
+    return [(x, y) for y in range(board.height - board.heights[x], board.height)]
+
+
+def multi_row(target: Position, filled: List[Position], rng: random.Random,
+              board: ListBoard) -> Iterable[Position]:
+    """
+    清除以目标为中心的连续三行
+    """
+    return [(x, target[1] + dy) for dy in range(-1, 2) for x in range(board.width)]
+
+
+def scatter(target: Position, filled: List[Position], rng: random.Random,
+            board: ListBoard) -> Iterable[Position]:
+    """
+    随机清除场地上的若干砖块
+    """
+    return rng.sample(filled, min(SCATTER_CELLS, len(filled)))
+
+
+# 技能名称到效果的映射，名称与 SkillType 的键一致；释放时从中随机选择
+SKILLS: Dict[str, SkillEffect] = {
+    "EXPLOSION": SkillEffect(explosion),
+    "TIME_SLOW": SkillEffect(duration=SKILL_DURATION * 20, gravity_factor=TIME_SLOW_FACTOR),
+    "CLEAR_LINE": SkillEffect(clear_line),
+    "COLUMN_WIPE": SkillEffect(column_wipe),
+    "MULTI_ROW": SkillEffect(multi_row),
+    "SCATTER": SkillEffect(scatter),
+}
+
+
+class SkillTiming:
+    """
+    某个技能累计的释放次数、清除的砖块数和效果耗时（秒，包括掩码计算、清除和下落）
+    """
+    __slots__ = ("count", "cells", "seconds")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.cells = 0
+        self.seconds = 0.0
+
+    def record(self, cells: int, seconds: float) -> None:
+        self.count += 1
+        self.cells += cells
+        self.seconds += seconds
+
+    def mean(self) -> float:
+        return self.seconds / self.count if self.count else 0.0
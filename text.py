@@ -0,0 +1,94 @@
+"""
+文字绘制层：渲染结果保存在有界的 LRU 缓存中，键为 (文字, 抗锯齿, 颜色)。
+静态文字（按钮、标题、技能名称）整串只光栅化一次；
+得分、排行榜等含数字的文字由缓存的数字单字和其余片段拼接而成，
+分数变化时只需拼接已有的字形，不必用字体重新光栅化整串文字
+"""
+import re
+from typing import Dict, Optional, Tuple
+
+from assets import ASSETS
+from cache import LRUCache
+from config import *
+
+WHITE = (255, 255, 255)
+
+DEFAULT_CACHE_SIZE = 512
+
+# 每个数字单独成段，其余连续字符为一段
+RUN_PATTERN = re.compile(r"\d|\D+")
+
+Color = Tuple[int, ...]
+
+
+class TextCache:
+    """
+    带缓存的文字绘制，hits / misses 记录缓存命中情况
+    """
+    def __init__(self, font: Optional[pygame.font.Font] = None, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        font 为 None 时在第一次渲染时从 ASSETS 加载默认字体
+        """
+        self._font = font
+        self.cache = LRUCache(max_size)
+
+    @property
+    def font(self) -> pygame.font.Font:
+        if self._font is None:
+            self._font = ASSETS.font()
+        return self._font
+
+    def glyphs(self, text: str, antialias: bool, color: Color) -> pygame.Surface:
+        key = (text, antialias, color)
+        surface = self.cache.get(key)
+        if surface is None:
+            surface = self.font.render(text, antialias, color)
+            if pygame.display.get_surface() is not None:
+                # 转换为屏幕的像素格式，之后每帧 blit 更快
+                surface = surface.convert_alpha() if antialias else surface.convert()
+            self.cache.put(key, surface)
+        return surface
+
+    def render(self, text: str, antialias: bool = True, color: Color = WHITE) -> pygame.Surface:
+        """
+        返回 text 渲染后的 Surface（共享对象，调用方不应修改）
+        """
+        color = tuple(color)
+        runs = RUN_PATTERN.findall(text)
+        if len(runs) <= 1:
+            return self.glyphs(text, antialias, color)
+        key = (text, antialias, color)
+        surface = self.cache.get(key)
+        if surface is None:
+            parts = [self.glyphs(run, antialias, color) for run in runs]
+            surface = pygame.Surface((sum(p.get_width() for p in parts), max(p.get_height() for p in parts)),
+                                     pygame.SRCALPHA)
+            # 片段互不重叠，按通道取最大值即原样复制像素和透明度（普通 blit 会把透明度再乘一次）
+            flags = pygame.BLEND_RGBA_MAX if antialias else 0
+            x = 0
+            for part in parts:
+                surface.blit(part, (x, 0), special_flags=flags)
+                x += part.get_width()
+            self.cache.put(key, surface)
+        return surface
+
+    def size(self, text: str) -> Tuple[int, int]:
+        return self.render(text).get_size()
+
+    def blit(self, surface: pygame.Surface, text: str, position: Tuple[int, int],
+             antialias: bool = True, color: Color = WHITE) -> pygame.Rect:
+        """
+        把文字绘制到 surface 的 position（左上角）处，返回绘制区域
+        """
+        return surface.blit(self.render(text, antialias, color), position)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "hits": self.cache.hits,
+            "misses": self.cache.misses,
+            "hit_rate": self.cache.hit_rate(),
+            "size": len(self.cache.data),
+        }
+
+
+TEXT = TextCache()
@@ -0,0 +1,241 @@
+"""
+多进程对局锦标赛：把 (玩家, 随机种子, 难度) 的组合分块分发到进程池中无界面运行，
+每局结束后立即以 JSON 行输出得分、消行数、方块数和耗时。
+
+用法示例：
+    python tournament.py --agents random idle --seeds 0-99 --difficulties 简单 普通 困难
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Generator, Iterator, List, Optional, Tuple
+
+from ai import AutoPlayer
+from engine import ACTIONS, TetrisEngine
+from movegen import MoveGenerator
+
+# 与界面层 clock.tick(60) 相同的帧间隔，玩家每帧可以执行一个动作
+FRAME_MS = 1000 // 60
+
+# 单局最多模拟的帧数，防止不会输的玩家让对局永远进行下去
+DEFAULT_MAX_FRAMES = 60 * 60 * 60
+
+# 崩溃时正在运行的对局最多尝试的次数，最后一次在单独的进程中运行
+MAX_TASK_ATTEMPTS = 3
+
+CHUNK_PENDING, CHUNK_RUNNING, CHUNK_DONE = 0, 1, 2
+
+Agent = Callable[[TetrisEngine], Optional[str]]
+Task = Tuple[str, int, str]
+
+
+def idle_agent(seed: int) -> Agent:
+    """
+    不做任何操作，方块自然下落
+    """
+    return lambda engine: None
+
+
+def random_agent(seed: int) -> Agent:
+    """
+    每帧以一定概率随机执行一个动作
+    """
+    rng = random.Random(seed)
+
+    def act(engine: TetrisEngine) -> Optional[str]:
+        if rng.random() < 0.1:
+            return rng.choice(ACTIONS)
+        return None
+
+    return act
+
+
+# 玩家名称到工厂函数的映射，工厂函数接收随机种子返回每帧调用一次的玩家
+AGENTS: Dict[str, Callable[[int], Agent]] = {
+    "idle": idle_agent,
+    "random": random_agent,
+    "ai": lambda seed: AutoPlayer(),
+    "ai-movegen": lambda seed: AutoPlayer(movegen=MoveGenerator()),
+}
+
+
+def play_game(agent_name: str, seed: int, difficulty: str, max_frames: int = DEFAULT_MAX_FRAMES) -> dict:
+    """
+    以固定帧间隔无界面地运行一局，返回对局结果
+    """
+    engine = TetrisEngine(difficulty, seed=seed)
+    agent = AGENTS[agent_name](seed)
+    start = time.perf_counter()
+    now = 0
+    frames = 0
+    while not engine.game_over and frames < max_frames:
+        action = agent(engine)
+        if action:
+            engine.apply(action)
+        now += FRAME_MS
+        engine.update(now)
+        frames += 1
+    return {
+        "agent": agent_name,
+        "seed": seed,
+        "difficulty": difficulty,
+        "score": engine.score,
+        "lines": engine.lines,
+        "pieces": engine.pieces,
+        "frames": frames,
+        "finished": engine.game_over,
+        "duration": time.perf_counter() - start,
+        "error": None,
+    }
+
+
+def error_result(task: Task, error: str) -> dict:
+    agent_name, seed, difficulty = task
+    return {"agent": agent_name, "seed": seed, "difficulty": difficulty, "error": error}
+
+
+def init_worker(state) -> None:
+    global chunk_state
+    chunk_state = state
+
+
+def run_chunk(index: int, tasks: List[Task], max_frames: int) -> List[dict]:
+    """
+    在工作进程中依次运行一块对局；单局抛出异常只影响这一局。
+    开始和结束时在共享数组中登记状态，进程池崩溃后据此找出当时正在运行的分块
+    """
+    chunk_state[index] = CHUNK_RUNNING
+    results = []
+    for task in tasks:
+        try:
+            results.append(play_game(*task, max_frames=max_frames))
+        except Exception:
+            results.append(error_result(task, traceback.format_exc()))
+    chunk_state[index] = CHUNK_DONE
+    return results
+
+
+def chunked(tasks: List[Task], size: int) -> List[List[Task]]:
+    return [tasks[i:i + size] for i in range(0, len(tasks), size)]
+
+
+def run_round(batch: List[Tuple[List[Task], int]], workers: int,
+              max_frames: int) -> Generator[dict, None, List[Tuple[List[Task], int]]]:
+    """
+    用一个进程池运行一批 (分块, 第几次尝试)，逐局产出结果，返回需要重新提交的分块。
+    某个工作进程异常退出会使整个进程池失效：尚未开始的分块原样重新提交；
+    崩溃时正在运行的分块拆成单局并增加尝试次数；达到最后一次尝试的单局记为崩溃
+    """
+    state = multiprocessing.Array("b", len(batch), lock=False)
+    requeue = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(state,)) as pool:
+        futures = {pool.submit(run_chunk, index, chunk, max_frames): (index, chunk, attempt)
+                   for index, (chunk, attempt) in enumerate(batch)}
+        for future in as_completed(futures):
+            index, chunk, attempt = futures[future]
+            try:
+                yield from future.result()
+            except BrokenProcessPool:
+                if state[index] != CHUNK_RUNNING:
+                    requeue.append((chunk, attempt))
+                elif len(chunk) > 1:
+                    requeue.extend(([task], attempt + 1) for task in chunk)
+                elif attempt < MAX_TASK_ATTEMPTS:
+                    requeue.append((chunk, attempt + 1))
+                else:
+                    yield error_result(chunk[0], "worker process crashed")
+    return requeue
+
+
+def run_tournament(tasks: List[Task], workers: int, chunk_size: int,
+                   max_frames: int = DEFAULT_MAX_FRAMES) -> Iterator[dict]:
+    """
+    把对局分块提交到进程池，按完成顺序逐局产出结果。
+    已经多次与崩溃同时运行的单局放到只有一个进程的进程池里逐个重试，
+    这样再次崩溃时可以确定就是这一局，其余对局不受影响
+    """
+    queue = [(chunk, 1) for chunk in chunked(tasks, chunk_size)]
+    while queue:
+        suspects = [item for item in queue if item[1] >= MAX_TASK_ATTEMPTS]
+        if suspects:
+            queue = [item for item in queue if item[1] < MAX_TASK_ATTEMPTS]
+            queue.extend((yield from run_round(suspects, 1, max_frames)))
+        else:
+            queue = yield from run_round(queue, workers, max_frames)
+
+
+def parse_seeds(text: str) -> List[int]:
+    """
+    解析种子列表，支持 "0-99"、"1,5,7" 以及两者的组合
+    """
+    seeds = []
+    for part in text.split(","):
+        if "-" in part:
+            low, high = part.split("-", 1)
+            seeds.extend(range(int(low), int(high) + 1))
+        elif part:
+            seeds.append(int(part))
+    return seeds
+
+
+def summarize(results: List[dict]) -> List[str]:
+    groups: Dict[Tuple[str, str], List[dict]] = {}
+    for result in results:
+        groups.setdefault((result["agent"], result["difficulty"]), []).append(result)
+    lines = []
+    for (agent_name, difficulty), group in sorted(groups.items()):
+        ok = [r for r in group if r["error"] is None]
+        mean_score = sum(r["score"] for r in ok) / len(ok) if ok else 0.0
+        mean_lines = sum(r["lines"] for r in ok) / len(ok) if ok else 0.0
+        lines.append(f"{agent_name:<10}{difficulty:<6}games={len(group):<6}errors={len(group) - len(ok):<4}"
+                     f"mean_score={mean_score:<10.1f}mean_lines={mean_lines:.2f}")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="多进程无界面对局锦标赛")
+    parser.add_argument("--agents", nargs="+", default=["random"], choices=sorted(AGENTS))
+    parser.add_argument("--seeds", default="0-99", help='随机种子，例如 "0-99" 或 "1,5,7"')
+    parser.add_argument("--difficulties", nargs="+", default=["普通"], choices=["简单", "普通", "困难"])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=0, help="每个任务包含的对局数，默认按进程数自动计算")
+    parser.add_argument("--max-frames", type=int, default=DEFAULT_MAX_FRAMES)
+    parser.add_argument("--output", help="结果 JSON 行写入的文件，默认输出到标准输出")
+    args = parser.parse_args(argv)
+
+    tasks = [(agent_name, seed, difficulty)
+             for agent_name in args.agents
+             for difficulty in args.difficulties
+             for seed in parse_seeds(args.seeds)]
+    # 每个进程大约分到 4 块，既摊薄任务分发开销又保持负载均衡
+    chunk_size = args.chunk_size or max(1, math.ceil(len(tasks) / (args.workers * 4)))
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in run_tournament(tasks, args.workers, chunk_size, args.max_frames):
+            results.append(result)
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    for line in summarize(results):
+        print(line, file=sys.stderr)
+    print(f"{len(results)} games in {elapsed:.2f}s ({len(results) / elapsed:.1f} games/s, "
+          f"{args.workers} workers, chunk size {chunk_size})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()